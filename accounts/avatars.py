@@ -0,0 +1,85 @@
+"""头像处理：上传后生成固定尺寸、去除元数据的 WebP / JPEG 缩略图，文件名包含内容哈希"""
+import hashlib
+import io
+import posixpath
+
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from PIL import Image, ImageOps
+
+# 尺寸名 -> 边长（像素）；md 对应页面上 150px 的头像，lg 用于高分屏
+AVATAR_SIZES = {'sm': 48, 'md': 160, 'lg': 320}
+AVATAR_FORMATS = {
+    'webp': ('WEBP', {'quality': 80, 'method': 4}),
+    'jpg': ('JPEG', {'quality': 85, 'optimize': True, 'progressive': True}),
+}
+AVATAR_VARIANT_DIR = 'avatars/variants'
+
+
+def variant_key(size, fmt):
+    return f'{size}.{fmt}'
+
+
+VARIANT_KEYS = frozenset(variant_key(size, fmt) for size in AVATAR_SIZES for fmt in AVATAR_FORMATS)
+
+
+def _load_image(data):
+    image = Image.open(io.BytesIO(data))
+    # 大尺寸 JPEG 直接按缩小后的分辨率解码，节省时间和内存
+    largest = max(AVATAR_SIZES.values())
+    image.draft('RGB', (largest * 2, largest * 2))
+    image = ImageOps.exif_transpose(image)
+    if image.mode in ('RGBA', 'LA', 'P'):
+        image = image.convert('RGBA')
+        background = Image.new('RGB', image.size, (255, 255, 255))
+        background.paste(image, mask=image.getchannel('A'))
+        return background
+    return image.convert('RGB')
+
+
+def render_variants(source_name, user_id, overwrite=False):
+    """
+    读取原图并写入所有变体，返回 {'md.webp': 存储路径, ...}。
+    不访问数据库，可以在子进程中运行；同样内容的文件已存在时直接复用（overwrite=True 时重新生成）。
+    """
+    with default_storage.open(source_name, 'rb') as fh:
+        data = fh.read()
+    digest = hashlib.sha256(data).hexdigest()[:16]
+    directory = posixpath.join(AVATAR_VARIANT_DIR, str(user_id))
+
+    image = None
+    variants = {}
+    for size, pixels in AVATAR_SIZES.items():
+        fitted = None
+        for fmt, (pil_format, options) in AVATAR_FORMATS.items():
+            name = posixpath.join(directory, f'{digest}-{pixels}.{fmt}')
+            if overwrite or not default_storage.exists(name):
+                if image is None:
+                    image = _load_image(data)
+                if fitted is None:
+                    fitted = ImageOps.fit(image, (pixels, pixels), Image.Resampling.LANCZOS)
+                buffer = io.BytesIO()
+                # 不传 exif / icc_profile，输出文件不含元数据
+                fitted.save(buffer, pil_format, **options)
+                delete_files([name])
+                name = default_storage.save(name, ContentFile(buffer.getvalue()))
+            variants[variant_key(size, fmt)] = name
+    return variants
+
+
+def delete_files(names):
+    for name in names:
+        if name and default_storage.exists(name):
+            default_storage.delete(name)
+
+
+def apply_variants(profile, variants):
+    """保存新的变体列表，并删除被替换掉的旧文件"""
+    previous = profile.avatar_variants or {}
+    superseded = set(previous.get('files', {}).values()) - set(variants.values())
+    if previous.get('source') and previous['source'] != profile.avatar.name:
+        superseded.add(previous['source'])
+
+    profile.avatar_variants = {'source': profile.avatar.name, 'files': variants}
+    type(profile).objects.filter(pk=profile.pk).update(avatar_variants=profile.avatar_variants)
+    delete_files(superseded)
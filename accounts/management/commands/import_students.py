@@ -0,0 +1,139 @@
+import csv
+import os
+import secrets
+
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import Group, User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from accounts.models import UserProfile
+from config.pool import process_pool
+from pastpaper.permissions import bump_roles_version
+
+REQUIRED_COLUMNS = {'username'}
+OPTIONAL_COLUMNS = ('password', 'email', 'first_name', 'last_name', 'groups')
+
+
+def hash_passwords(passwords, workers):
+    """PBKDF2 是纯 CPU 计算，分散到多个进程并行计算"""
+    if workers <= 1 or len(passwords) < 2:
+        return [make_password(password) for password in passwords]
+    chunksize = max(1, len(passwords) // (workers * 4))
+    with process_pool(workers) as pool:
+        return list(pool.map(make_password, passwords, chunksize=chunksize))
+
+
+class Command(BaseCommand):
+    help = '从CSV批量导入学生账号（列：username,password,email,first_name,last_name,groups），重复执行时跳过已存在的账号'
+
+    def add_arguments(self, parser):
+        parser.add_argument('csv_file', help='CSV文件路径（UTF-8，首行为列名）')
+        parser.add_argument('--group', action='append', default=[], help='所有导入账号都加入的用户组（班级），可重复')
+        parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help='计算密码哈希的进程数')
+        parser.add_argument('--batch-size', type=int, default=500, help='每条 INSERT 语句写入的行数')
+        parser.add_argument(
+            '--password-out',
+            help='为没有填写密码的学生生成随机密码，并将账号和密码写入该CSV文件；不指定时缺少密码的行会报错',
+        )
+        parser.add_argument('--dry-run', action='store_true', help='只校验CSV，不写入数据库')
+
+    def read_rows(self, path):
+        try:
+            with open(path, encoding='utf-8-sig', newline='') as fh:
+                reader = csv.DictReader(fh)
+                columns = set(reader.fieldnames or [])
+                if not REQUIRED_COLUMNS <= columns:
+                    raise CommandError(f"CSV must have columns: {', '.join(sorted(REQUIRED_COLUMNS))}")
+                rows = list(reader)
+        except OSError as exc:
+            raise CommandError(f'Cannot read {path}: {exc}')
+
+        students = {}
+        for line_num, row in enumerate(rows, start=2):
+            username = (row.get('username') or '').strip()
+            if not username:
+                raise CommandError(f'Line {line_num}: username is empty')
+            if username in students:
+                raise CommandError(f'Line {line_num}: duplicate username {username}')
+            student = {key: (row.get(key) or '').strip() for key in OPTIONAL_COLUMNS}
+            student['groups'] = [name.strip() for name in student['groups'].split(';') if name.strip()]
+            students[username] = student
+        return students
+
+    def handle(self, *args, **options):
+        students = self.read_rows(options['csv_file'])
+        batch_size = options['batch_size']
+
+        # 已存在的账号不重新计算哈希、不修改密码，只补齐用户组
+        existing = set(User.objects.filter(username__in=list(students)).values_list('username', flat=True))
+        new_usernames = [username for username in students if username not in existing]
+
+        generated = {}
+        for username in new_usernames:
+            if not students[username]['password']:
+                if not options['password_out']:
+                    raise CommandError(f'{username} has no password; pass --password-out to generate one')
+                generated[username] = secrets.token_urlsafe(9)
+                students[username]['password'] = generated[username]
+
+        if options['dry_run']:
+            self.stdout.write(f'{len(new_usernames)} to create, {len(existing)} already exist.')
+            return
+
+        hashes = hash_passwords([students[u]['password'] for u in new_usernames], options['workers'])
+
+        group_names = set(options['group'])
+        for student in students.values():
+            group_names.update(student['groups'])
+
+        with transaction.atomic():
+            User.objects.bulk_create(
+                [
+                    User(
+                        username=username,
+                        password=password_hash,
+                        email=students[username]['email'],
+                        first_name=students[username]['first_name'],
+                        last_name=students[username]['last_name'],
+                    )
+                    for username, password_hash in zip(new_usernames, hashes)
+                ],
+                batch_size=batch_size,
+                ignore_conflicts=True,
+            )
+            user_ids = dict(User.objects.filter(username__in=list(students)).values_list('username', 'id'))
+
+            # bulk_create 不触发 post_save，需要手动创建 UserProfile
+            UserProfile.objects.bulk_create(
+                [UserProfile(user_id=user_ids[username]) for username in students],
+                batch_size=batch_size,
+                ignore_conflicts=True,
+            )
+
+            memberships = []
+            if group_names:
+                for name in group_names:
+                    Group.objects.get_or_create(name=name)
+                group_ids = dict(Group.objects.filter(name__in=group_names).values_list('name', 'id'))
+                Membership = User.groups.through
+                for username, student in students.items():
+                    for name in set(options['group']) | set(student['groups']):
+                        memberships.append(Membership(user_id=user_ids[username], group_id=group_ids[name]))
+                Membership.objects.bulk_create(memberships, batch_size=batch_size, ignore_conflicts=True)
+
+        if memberships:
+            # 批量写入中间表不会发出 m2m_changed，手动使角色缓存失效
+            bump_roles_version()
+
+        if generated:
+            with open(options['password_out'], 'w', encoding='utf-8', newline='') as fh:
+                writer = csv.writer(fh)
+                writer.writerow(['username', 'password'])
+                writer.writerows(generated.items())
+            self.stdout.write(f"Generated passwords written to {options['password_out']}")
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Created {len(new_usernames)} students, skipped {len(existing)} existing, '
+            f'{len(memberships)} group memberships ensured.'
+        ))
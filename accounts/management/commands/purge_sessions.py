@@ -0,0 +1,63 @@
+import time
+from importlib import import_module
+
+from django.conf import settings
+from django.contrib.sessions.backends.db import SessionStore as DBStore
+from django.core.management.base import BaseCommand
+from django.db import DatabaseError, close_old_connections
+from django.utils import timezone
+
+
+class Command(BaseCommand):
+    help = '分批删除过期会话，避免一次性大删除长时间锁住 SQLite；--loop 可作为后台任务常驻'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=settings.SESSION_PURGE_CHUNK_SIZE,
+            help='每批删除的会话数',
+        )
+        parser.add_argument('--pause', type=float, default=0.05, help='两批之间暂停的秒数，让出写锁')
+        parser.add_argument('--loop', type=int, default=0, help='每隔N秒重复执行（0表示只执行一次）')
+
+    def purge_once(self, chunk_size, pause):
+        engine = import_module(settings.SESSION_ENGINE)
+        store_class = engine.SessionStore
+        if not issubclass(store_class, DBStore):
+            # cache / signed_cookies 由缓存过期或浏览器自行处理
+            store_class.clear_expired()
+            return 0
+
+        model = store_class.get_model_class()
+        total = 0
+        while True:
+            keys = list(
+                model.objects.filter(expire_date__lt=timezone.now())
+                .values_list('session_key', flat=True)[:chunk_size]
+            )
+            if not keys:
+                break
+            deleted, _ = model.objects.filter(session_key__in=keys).delete()
+            total += deleted
+            if len(keys) < chunk_size:
+                break
+            time.sleep(pause)
+        return total
+
+    def handle(self, *args, **options):
+        while True:
+            try:
+                total = self.purge_once(options['chunk_size'], options['pause'])
+                self.stdout.write(f"Purged {total} expired sessions ({settings.SESSION_ENGINE}).")
+            except DatabaseError as exc:
+                if options['loop'] <= 0:
+                    raise
+                # 常驻时一次失败（如 database is locked）不退出，下一轮再试；已删除的批次不受影响
+                self.stderr.write(f'Session purge failed: {exc}')
+            finally:
+                # 长期运行的进程不复用可能已失效的连接
+                close_old_connections()
+            if options['loop'] <= 0:
+                break
+            time.sleep(options['loop'])
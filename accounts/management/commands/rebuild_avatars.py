@@ -0,0 +1,71 @@
+import os
+
+from django.core.files.storage import default_storage
+from django.core.management.base import BaseCommand
+
+from accounts.avatars import AVATAR_VARIANT_DIR, VARIANT_KEYS, apply_variants, delete_files, render_variants
+from accounts.models import UserProfile
+from config.pool import process_pool
+
+
+def _render(args):
+    source_name, user_id, overwrite = args
+    try:
+        return render_variants(source_name, user_id, overwrite), None
+    except Exception as exc:  # 单张损坏的图片不影响其他头像
+        return None, str(exc)
+
+
+def _walk(directory):
+    directories, files = default_storage.listdir(directory)
+    for name in files:
+        yield f'{directory}/{name}'
+    for child in directories:
+        yield from _walk(f'{directory}/{child}')
+
+
+class Command(BaseCommand):
+    help = '为已有头像生成缩略图（多进程），用于上线新尺寸或补齐旧数据'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help='处理图片的进程数')
+        parser.add_argument('--force', action='store_true', help='缩略图已是最新时也重新生成（修改尺寸或质量后使用）')
+        parser.add_argument('--clean', action='store_true', help='删除不再被任何用户引用的缩略图文件')
+
+    def handle(self, *args, **options):
+        profiles = [
+            profile for profile in UserProfile.objects.exclude(avatar='').exclude(avatar__isnull=True)
+            if options['force'] or profile.avatar_variants.get('source') != profile.avatar.name
+            or set(profile.avatar_variants.get('files', {})) != VARIANT_KEYS
+        ]
+
+        # 强制重建时覆盖已有文件，否则同名的内容哈希文件会被直接复用
+        jobs = [(profile.avatar.name, profile.user_id, options['force']) for profile in profiles]
+        if options['workers'] > 1 and len(jobs) > 1:
+            with process_pool(options['workers']) as pool:
+                outcomes = list(pool.map(_render, jobs, chunksize=max(1, len(jobs) // (options['workers'] * 4))))
+        else:
+            outcomes = [_render(job) for job in jobs]
+
+        failed = 0
+        for profile, (variants, error) in zip(profiles, outcomes):
+            if error:
+                failed += 1
+                self.stderr.write(f'{profile.user_id} ({profile.avatar.name}): {error}')
+                continue
+            apply_variants(profile, variants)
+
+        removed = self.clean_orphans() if options['clean'] else 0
+        self.stdout.write(self.style.SUCCESS(
+            f'Rebuilt {len(profiles) - failed} avatars, {failed} failed, {removed} orphaned files removed.'
+        ))
+
+    def clean_orphans(self):
+        if not default_storage.exists(AVATAR_VARIANT_DIR):
+            return 0
+        referenced = set()
+        for variants in UserProfile.objects.values_list('avatar_variants', flat=True):
+            referenced.update((variants or {}).get('files', {}).values())
+        orphans = [name for name in _walk(AVATAR_VARIANT_DIR) if name not in referenced]
+        delete_files(orphans)
+        return len(orphans)
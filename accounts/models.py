@@ -1,8 +1,14 @@
+import logging
+
 from django.db import models
 from django.contrib.auth.models import User
-from django.db.models.signals import post_save
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 
+from .avatars import apply_variants, delete_files, render_variants, variant_key
+
+logger = logging.getLogger(__name__)
+
 
 class UserProfile(models.Model):
     """用户配置模型（扩展Django默认User模型）"""
@@ -18,6 +24,12 @@ class UserProfile(models.Model):
         null=True,
         verbose_name="头像"
     )
+    avatar_variants = models.JSONField(
+        default=dict,
+        blank=True,
+        editable=False,
+        verbose_name="头像缩略图"
+    )
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -28,13 +40,56 @@ class UserProfile(models.Model):
     def __str__(self):
         return f"{self.user.username}'s profile"
 
-    @property
-    def avatar_url(self):
-        """获取头像URL"""
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # 记录数据库中的原图，保存时据此判断头像是否被替换
+        instance._loaded_avatar = instance.avatar.name if 'avatar' in field_names else None
+        return instance
+
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        replaced = getattr(self, '_loaded_avatar', None)
+        if self.avatar:
+            if self.avatar_variants.get('source') != self.avatar.name:
+                try:
+                    variants = render_variants(self.avatar.name, self.user_id)
+                except Exception:
+                    # 记录已经保存，不能再让请求失败；没有缩略图时页面显示原图，rebuild_avatars 会补齐
+                    logger.exception('Rendering avatar variants for user %s failed', self.user_id)
+                    variants = {}
+                apply_variants(self, variants)
+        elif self.avatar_variants:
+            delete_files(self.avatar_variants.get('files', {}).values())
+            self.avatar_variants = {}
+            UserProfile.objects.filter(pk=self.pk).update(avatar_variants={})
+        if replaced and replaced != self.avatar.name:
+            delete_files([replaced])
+        self._loaded_avatar = self.avatar.name
+
+    def avatar_variant_url(self, size='md', fmt='webp'):
+        """获取指定尺寸的头像URL；尚未生成缩略图的旧头像返回原图"""
+        name = self.avatar_variants.get('files', {}).get(variant_key(size, fmt))
+        if name:
+            return self.avatar.storage.url(name)
         if self.avatar:
             return self.avatar.url
         return '/static/images/default_avatar.jpg'
 
+    @property
+    def avatar_url(self):
+        """获取头像URL（页面上 150px 头像使用的尺寸）"""
+        return self.avatar_variant_url('md')
+
+    @property
+    def avatar_srcset(self):
+        return f"{self.avatar_variant_url('md')} 1x, {self.avatar_variant_url('lg')} 2x"
+
+    @property
+    def avatar_fallback_url(self):
+        """不支持 WebP 的浏览器使用的 JPEG 头像"""
+        return self.avatar_variant_url('md', 'jpg')
+
 
 @receiver(post_save, sender=User)
 def create_user_profile(sender, instance, created, **kwargs):
@@ -44,7 +99,19 @@ def create_user_profile(sender, instance, created, **kwargs):
 
 
 @receiver(post_save, sender=User)
-def save_user_profile(sender, instance, **kwargs):
-    """保存User时同时保存UserProfile"""
-    if hasattr(instance, 'profile'):
+def save_user_profile(sender, instance, update_fields=None, **kwargs):
+    """保存User时同时保存已加载的UserProfile（仅更新 last_login 等字段时跳过，避免登录时多一次写入）"""
+    if update_fields is not None and set(update_fields) <= {'last_login'}:
+        return
+    # 只有在本次请求中加载过 profile 时才可能有未保存的修改，未加载时无需查询和写入
+    if User.profile.related.is_cached(instance):
         instance.profile.save()
+
+
+@receiver(post_delete, sender=UserProfile)
+def delete_avatar_files(sender, instance, **kwargs):
+    """删除用户时同时删除头像原图和缩略图"""
+    files = list(instance.avatar_variants.get('files', {}).values())
+    if instance.avatar:
+        files.append(instance.avatar.name)
+    delete_files(files)
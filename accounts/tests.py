@@ -1,3 +1,77 @@
-from django.test import TestCase
+import io
+import shutil
+import tempfile
+from unittest import mock
 
-# Create your tests here.
+from django.contrib.auth.models import User
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.db import OperationalError
+from django.test import SimpleTestCase, TestCase, override_settings
+from PIL import Image
+
+from .management.commands.purge_sessions import Command as PurgeSessionsCommand
+from .models import UserProfile
+
+
+class _StopLoop(Exception):
+    pass
+
+
+class PurgeSessionsTests(SimpleTestCase):
+    def test_loop_survives_database_errors(self):
+        stdout, stderr = io.StringIO(), io.StringIO()
+        with mock.patch.object(
+            PurgeSessionsCommand, 'purge_once', side_effect=[OperationalError('database is locked'), 3],
+        ), mock.patch('time.sleep', side_effect=[None, _StopLoop]):
+            with self.assertRaises(_StopLoop):
+                call_command('purge_sessions', loop=60, stdout=stdout, stderr=stderr)
+        self.assertIn('database is locked', stderr.getvalue())
+        self.assertIn('Purged 3 expired sessions', stdout.getvalue())
+
+    def test_single_run_reports_database_errors(self):
+        with mock.patch.object(PurgeSessionsCommand, 'purge_once', side_effect=OperationalError('database is locked')):
+            with self.assertRaises(OperationalError):
+                call_command('purge_sessions', stdout=io.StringIO())
+
+
+def _png():
+    buffer = io.BytesIO()
+    Image.new('RGB', (400, 300), (200, 30, 30)).save(buffer, 'PNG')
+    return buffer.getvalue()
+
+
+class AvatarTests(TestCase):
+    def setUp(self):
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root, ignore_errors=True)
+        settings_override = override_settings(MEDIA_ROOT=media_root)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        self.profile = User.objects.create_user('avatar', password='avatar-pass').profile
+
+    def test_render_failure_keeps_saved_avatar(self):
+        self.profile.avatar = SimpleUploadedFile('broken.png', b'not an image')
+        with self.assertLogs('accounts.models', 'ERROR'):
+            self.profile.save()
+
+        profile = UserProfile.objects.get(pk=self.profile.pk)
+        self.assertTrue(profile.avatar.name.startswith('avatars/broken'))
+        self.assertEqual(profile.avatar_url, profile.avatar.url)
+
+    def test_failed_render_is_repaired_by_rebuild_avatars(self):
+        self.profile.avatar = SimpleUploadedFile('first.png', _png())
+        self.profile.save()
+        self.assertNotEqual(self.profile.avatar_url, self.profile.avatar.url)
+
+        with mock.patch('accounts.models.render_variants', side_effect=OSError('cannot identify image file')):
+            with self.assertLogs('accounts.models', 'ERROR'):
+                self.profile.avatar = SimpleUploadedFile('second.png', _png())
+                self.profile.save()
+        # 旧头像的缩略图已删除，不会继续显示旧头像
+        self.assertEqual(UserProfile.objects.get(pk=self.profile.pk).avatar_url, self.profile.avatar.url)
+
+        call_command('rebuild_avatars', workers=1, stdout=io.StringIO())
+        profile = UserProfile.objects.get(pk=self.profile.pk)
+        self.assertEqual(profile.avatar_variants['source'], profile.avatar.name)
+        self.assertNotEqual(profile.avatar_url, profile.avatar.url)
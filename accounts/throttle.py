@@ -0,0 +1,73 @@
+"""登录准入控制：限制同时进行密码哈希的请求数，超出排队上限时立即返回“N秒后重试”"""
+import math
+import threading
+import time
+from contextlib import contextmanager
+
+from django.conf import settings
+
+
+class LoginBusy(Exception):
+    """排队已满或等待超时"""
+
+    def __init__(self, retry_after):
+        super().__init__(f'Login queue is full, retry in {retry_after}s')
+        self.retry_after = retry_after
+
+
+class LoginAdmission:
+    """
+    每个进程一个实例。PBKDF2 哈希（hashlib 会释放 GIL）最多 concurrency 个同时进行，
+    其余请求最多 queue_size 个排队等待，再多的请求直接拒绝，避免所有请求线程都卡在哈希上。
+    """
+
+    def __init__(self, concurrency, queue_size, wait_timeout):
+        self.concurrency = max(1, concurrency)
+        self.queue_size = max(0, queue_size)
+        self.wait_timeout = wait_timeout
+        self._slots = threading.BoundedSemaphore(self.concurrency)
+        self._lock = threading.Lock()
+        self._waiting = 0
+        # 单次登录耗时的指数移动平均，用于估算重试时间
+        self._avg_seconds = 0.3
+
+    @property
+    def waiting(self):
+        return self._waiting
+
+    def retry_after(self):
+        backlog = self._waiting + self.concurrency
+        return max(1, math.ceil(backlog / self.concurrency * self._avg_seconds))
+
+    def _record(self, seconds):
+        with self._lock:
+            self._avg_seconds = self._avg_seconds * 0.8 + seconds * 0.2
+
+    @contextmanager
+    def admit(self):
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                if self._waiting >= self.queue_size:
+                    raise LoginBusy(self.retry_after())
+                self._waiting += 1
+            try:
+                acquired = self._slots.acquire(timeout=self.wait_timeout)
+            finally:
+                with self._lock:
+                    self._waiting -= 1
+            if not acquired:
+                raise LoginBusy(self.retry_after())
+
+        started = time.monotonic()
+        try:
+            yield
+        finally:
+            self._record(time.monotonic() - started)
+            self._slots.release()
+
+
+login_admission = LoginAdmission(
+    concurrency=settings.LOGIN_CONCURRENCY,
+    queue_size=settings.LOGIN_QUEUE_SIZE,
+    wait_timeout=settings.LOGIN_QUEUE_TIMEOUT,
+)
@@ -1,8 +1,10 @@
+from django.conf import settings
 from django.shortcuts import render, redirect
-from django.contrib.auth import login, logout, authenticate
+from django.contrib.auth import login, logout
 from django.contrib.auth.decorators import login_required
 from django.contrib import messages
 from .forms import UserRegisterForm, UserLoginForm, UserProfileForm
+from .throttle import LoginBusy, login_admission
 
 
 def register_view(request):
@@ -31,23 +33,34 @@ def login_view(request):
     
     if request.method == 'POST':
         form = UserLoginForm(request, data=request.POST)
-        if form.is_valid():
-            username = form.cleaned_data.get('username')
-            password = form.cleaned_data.get('password')
+        try:
+            # 表单校验内部调用 authenticate()（PBKDF2），在准入控制下进行
+            with login_admission.admit():
+                is_valid = form.is_valid()
+        except LoginBusy as busy:
+            response = render(
+                request,
+                'accounts/login.html',
+                {'form': UserLoginForm(initial={'username': request.POST.get('username', '')}),
+                 'retry_after': busy.retry_after},
+                status=503,
+            )
+            response['Retry-After'] = str(busy.retry_after)
+            return response
+
+        if is_valid:
+            user = form.get_user()
             remember_me = form.cleaned_data.get('remember_me')
+            login(request, user)
+            
+            # 处理"记住我"功能
+            if not remember_me:
+                request.session.set_expiry(0)
+            else:
+                request.session.set_expiry(settings.SESSION_COOKIE_AGE)  # 默认2周
             
-            user = authenticate(username=username, password=password)
-            if user is not None:
-                login(request, user)
-                
-                # 处理"记住我"功能
-                if not remember_me:
-                    request.session.set_expiry(0)
-                else:
-                    request.session.set_expiry(1209600)  # 2周
-                
-                next_url = request.GET.get('next', 'pastpaper:home')
-                return redirect(next_url)
+            next_url = request.GET.get('next', 'pastpaper:home')
+            return redirect(next_url)
     else:
         form = UserLoginForm()
     
@@ -0,0 +1,117 @@
+"""基准测试脚本共用的工具：隔离的临时数据目录、统计与结果输出"""
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from socketserver import ThreadingMixIn
+from wsgiref.simple_server import WSGIRequestHandler, WSGIServer, make_server
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+
+
+def setup_django(data_dir=None, migrate=True):
+    """在临时数据目录中初始化Django，避免污染开发数据库"""
+    if str(BASE_DIR) not in sys.path:
+        sys.path.insert(0, str(BASE_DIR))
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
+    os.environ['DATA_DIR'] = str(data_dir or tempfile.mkdtemp(prefix='courser-bench-'))
+    # 关闭DEBUG，避免 connection.queries 记录影响计时
+    os.environ.setdefault('DEBUG', '0')
+    os.environ.setdefault('ALLOWED_HOSTS', '*')
+    os.environ.setdefault('SESSION_COOKIE_SECURE', '0')
+    os.environ.setdefault('CSRF_COOKIE_SECURE', '0')
+
+    import django
+    django.setup()
+
+    if migrate:
+        from django.core.management import call_command
+        call_command('migrate', verbosity=0)
+    return Path(os.environ['DATA_DIR'])
+
+
+class _ThreadingWSGIServer(ThreadingMixIn, WSGIServer):
+    daemon_threads = True
+    request_queue_size = 256
+
+
+class _QuietHandler(WSGIRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+
+@contextmanager
+def wsgi_server(host='127.0.0.1', port=0):
+    """在后台线程中启动多线程WSGI服务器（每个请求一个线程），产出基础URL"""
+    from django.core.wsgi import get_wsgi_application
+
+    server = make_server(
+        host, port, get_wsgi_application(),
+        server_class=_ThreadingWSGIServer, handler_class=_QuietHandler,
+    )
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f'http://{host}:{server.server_port}'
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def percentile(sorted_values, pct):
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, round(pct / 100 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def summarize(samples_ms):
+    """samples_ms: 每次请求耗时（毫秒）"""
+    values = sorted(samples_ms)
+    count = len(values)
+    return {
+        'count': count,
+        'mean_ms': round(sum(values) / count, 3) if count else 0.0,
+        'p50_ms': round(percentile(values, 50), 3),
+        'p95_ms': round(percentile(values, 95), 3),
+        'p99_ms': round(percentile(values, 99), 3),
+        'max_ms': round(values[-1], 3) if count else 0.0,
+    }
+
+
+def git_revision():
+    try:
+        return subprocess.check_output(
+            ['git', 'rev-parse', '--short', 'HEAD'],
+            cwd=BASE_DIR,
+            stderr=subprocess.DEVNULL,
+            text=True,
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def write_results(output, name, results, **meta):
+    """写出机器可读的结果，方便比较两个提交"""
+    payload = {
+        'benchmark': name,
+        'revision': git_revision(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        **meta,
+        'results': results,
+    }
+    Path(output).write_text(json.dumps(payload, indent=2, ensure_ascii=False), encoding='utf-8')
+
+
+def print_table(rows, columns):
+    widths = {col: max(len(col), *(len(str(row.get(col, ''))) for row in rows)) for col in columns}
+    print('  '.join(col.ljust(widths[col]) for col in columns))
+    for row in rows:
+        print('  '.join(str(row.get(col, '')).ljust(widths[col]) for col in columns))
@@ -0,0 +1,59 @@
+#!/usr/bin/env python
+"""
+比较两次基准测试的 JSON 结果（例如两个提交），输出各行指标的变化百分比。
+
+    python benchmarks/compare.py endpoints-main.json endpoints-HEAD.json
+"""
+import argparse
+import json
+import sys
+
+from common import print_table
+
+KEY_COLUMNS = ('server', 'endpoint', 'backend', 'round')
+METRICS = ('p50_ms', 'p95_ms', 'p99_ms', 'rps', 'error_rate', 'pss_mb')
+
+
+def load(path):
+    with open(path, encoding='utf-8') as fh:
+        return json.load(fh)
+
+
+def row_key(row):
+    return tuple(row.get(column) for column in KEY_COLUMNS if column in row)
+
+
+def change(before, after):
+    if before in (None, 0) or after is None:
+        return ''
+    return f'{(after - before) / before * 100:+.1f}%'
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare two benchmark result files.')
+    parser.add_argument('baseline')
+    parser.add_argument('candidate')
+    args = parser.parse_args()
+
+    baseline, candidate = load(args.baseline), load(args.candidate)
+    if baseline['benchmark'] != candidate['benchmark']:
+        sys.exit(f"Different benchmarks: {baseline['benchmark']} vs {candidate['benchmark']}")
+
+    before_rows = {row_key(row): row for row in baseline['results']}
+    rows = []
+    for row in candidate['results']:
+        before = before_rows.get(row_key(row))
+        if before is None:
+            continue
+        out = {'row': '/'.join(str(part) for part in row_key(row))}
+        for metric in METRICS:
+            if metric in row:
+                out[metric] = f'{row[metric]} ({change(before.get(metric), row[metric])})'
+        rows.append(out)
+
+    print(f"{baseline['benchmark']}: {baseline.get('revision')} -> {candidate.get('revision')}")
+    print_table(rows, ['row', *[m for m in METRICS if any(m in r for r in rows)]])
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,369 @@
+#!/usr/bin/env python
+"""
+通过真实的 WSGI / ASGI 服务器并发压测 pastpaper 的全部 API。
+
+    python benchmarks/endpoints.py --users 50 --duration 30 --output endpoints-HEAD.json
+    python benchmarks/compare.py endpoints-main.json endpoints-HEAD.json
+    python benchmarks/endpoints.py --server both --users 50   # WSGI 与 ASGI（uvicorn）并排对比
+    python benchmarks/endpoints.py --server gunicorn,gunicorn-conf   # 原固定参数与 config/gunicorn_conf.py 对比
+
+默认在临时数据目录中用 generate_load_dataset 生成数据；--data-dir 指向已生成的数据目录时直接复用。
+安装了 gunicorn 时默认使用 gunicorn（与生产一致），否则使用进程内的多线程 wsgiref 服务器。
+--server uvicorn 按 ASGI 部署方式启动（config.asgi，JSON 接口使用异步视图）。
+--server gunicorn-conf 使用生产配置 config/gunicorn_conf.py（自动计算 worker 数、preload、max_requests）；
+gunicorn-conf-asgi 为同一配置的 ASGI 模式。服务器以子进程运行时，结果的 all 行附带压测结束时整个进程树的 PSS（MB）。
+"""
+import argparse
+import http.client
+import importlib.util
+import os
+import random
+import secrets
+import socket
+import subprocess
+import sys
+import threading
+import time
+import urllib.parse
+from collections import defaultdict
+from contextlib import contextmanager
+
+from common import BASE_DIR, print_table, setup_django, summarize, wsgi_server, write_results
+
+PREFIX = 'bench'
+
+SERVERS = ('auto', 'gunicorn', 'gunicorn-conf', 'gunicorn-conf-asgi', 'wsgiref', 'uvicorn')
+
+# 名称 -> (路径, 权重)；权重大致对应首页上的调用频率
+ENDPOINTS = {
+    'get_units': ('/get_units/', 1),
+    'get_list': ('/get_list/', 4),
+    'get_past_papers': ('/get_past_papers/', 2),
+    'get_question_info': ('/get_question_info/', 2),
+    'open_question': ('/open_question/', 4),
+    'get_history': ('/get_history/', 1),
+    'update_user_tags': ('/update_user_tags/', 4),
+    'update_history': ('/update_history/', 2),
+    'sync': ('/sync/', 1),
+}
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='Benchmark pastpaper API endpoints through a WSGI or ASGI server.')
+    parser.add_argument('--users', type=int, default=50, help='Concurrent simulated students')
+    parser.add_argument('--duration', type=float, default=20, help='Seconds of load per run')
+    parser.add_argument('--warmup', type=float, default=3, help='Untimed seconds before measuring')
+    parser.add_argument('--endpoints', default=','.join(ENDPOINTS), help='Comma-separated endpoints to exercise')
+    parser.add_argument('--server', default='auto',
+                        help=f"Comma-separated servers run one after another with the same load: {', '.join(SERVERS)}; "
+                             'both: the WSGI profile (auto) and then uvicorn')
+    parser.add_argument('--workers', type=int,
+                        help='gunicorn / uvicorn worker processes (default 2; gunicorn-conf: autosized)')
+    parser.add_argument('--threads', type=int, help='gunicorn threads per worker (default 4; gunicorn-conf: autosized)')
+    parser.add_argument('--data-dir', help='Reuse an existing data directory instead of seeding a new one')
+    parser.add_argument('--dataset-users', type=int, default=500, help='Seeded students')
+    parser.add_argument('--tags-per-user', type=int, default=200)
+    parser.add_argument('--history-per-user', type=int, default=300)
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--output', help='Write JSON results to this file')
+    return parser.parse_args()
+
+
+def seed_dataset(args):
+    from django.contrib.auth.models import User
+    from django.core.management import call_command
+
+    if User.objects.filter(username__startswith=PREFIX).exists():
+        return
+    call_command(
+        'generate_load_dataset',
+        prefix=PREFIX,
+        users=args.dataset_users,
+        tags_per_user=args.tags_per_user,
+        history_per_user=args.history_per_user,
+        seed=args.seed,
+        verbosity=0,
+    )
+
+
+def make_sessions(count):
+    """直接写入会话，跳过登录表单（避免把 PBKDF2 计入接口耗时）"""
+    from importlib import import_module
+
+    from django.conf import settings
+    from django.contrib.auth import BACKEND_SESSION_KEY, HASH_SESSION_KEY, SESSION_KEY
+    from django.contrib.auth.models import User
+
+    engine = import_module(settings.SESSION_ENGINE)
+    sessions = []
+    for user in User.objects.filter(username__startswith=PREFIX).order_by('id')[:count]:
+        store = engine.SessionStore()
+        store[SESSION_KEY] = str(user.pk)
+        store[BACKEND_SESSION_KEY] = settings.AUTHENTICATION_BACKENDS[0]
+        store[HASH_SESSION_KEY] = user.get_session_auth_hash()
+        store.save()
+        sessions.append(store.session_key)
+    return sessions
+
+
+def load_fixtures():
+    from pastpaper.models import Question, Subject, Unit, catalog_version
+
+    subjects = list(Subject.objects.filter(code__startswith=PREFIX).values_list('code', flat=True))
+    units = defaultdict(list)
+    for code, unit_num in Unit.objects.filter(subject__code__in=subjects).values_list('subject__code', 'unit_num'):
+        units[code].append(unit_num)
+    questions = defaultdict(list)
+    for code, qid, qcode in Question.objects.filter(subject__code__in=subjects).values_list('subject__code', 'id', 'code'):
+        questions[code].append((qid, qcode))
+    return {'subjects': subjects, 'units': units, 'questions': questions, 'catalog_version': catalog_version()}
+
+
+def build_request(name, rng, subject, fixtures):
+    """返回 POST 表单参数"""
+    question_id, question_code = rng.choice(fixtures['questions'][subject])
+    if name in ('get_units', 'get_past_papers', 'get_history'):
+        return {'subject': subject}
+    if name == 'get_list':
+        return {'subject': subject, 'unit': rng.choice(fixtures['units'][subject])}
+    if name in ('get_question_info', 'open_question', 'update_history'):
+        return {'code': question_code}
+    if name == 'update_user_tags':
+        return {'id': question_id, 'kill': rng.choice('01'), 'save': '0'}
+    if name == 'sync':
+        # 多数客户端已有本地缓存，只取增量
+        version = 0 if rng.random() < 0.1 else fixtures['catalog_version']
+        return {'subject': subject, 'catalog_version': version}
+    raise ValueError(name)
+
+
+def post(host, port, path, params, headers):
+    body = urllib.parse.urlencode(params)
+    conn = http.client.HTTPConnection(host, port, timeout=60)
+    try:
+        conn.request('POST', path, body=body, headers=headers)
+        response = conn.getresponse()
+        response.read()
+        return response.status
+    finally:
+        conn.close()
+
+
+def run_load(base_url, sessions, fixtures, endpoints, duration, warmup, seed):
+    from django.conf import settings
+
+    parsed = urllib.parse.urlsplit(base_url)
+    names = list(endpoints)
+    weights = [ENDPOINTS[name][1] for name in names]
+    samples = defaultdict(list)
+    errors = defaultdict(int)
+    lock = threading.Lock()
+    measure_from = time.perf_counter() + warmup
+    stop_at = measure_from + duration
+    barrier = threading.Barrier(len(sessions))
+
+    def student(index, session_key):
+        rng = random.Random(seed * 100003 + index)
+        subject = fixtures['subjects'][index % len(fixtures['subjects'])]
+        csrf_token = secrets.token_hex(16)
+        headers = {
+            'Content-Type': 'application/x-www-form-urlencoded',
+            'Cookie': f'{settings.SESSION_COOKIE_NAME}={session_key}; {settings.CSRF_COOKIE_NAME}={csrf_token}',
+            'X-CSRFToken': csrf_token,
+        }
+        local_samples = defaultdict(list)
+        local_errors = defaultdict(int)
+        barrier.wait()
+        while True:
+            started = time.perf_counter()
+            if started >= stop_at:
+                break
+            name = rng.choices(names, weights)[0]
+            try:
+                status = post(parsed.hostname, parsed.port, ENDPOINTS[name][0],
+                              build_request(name, rng, subject, fixtures), headers)
+            except OSError:
+                status = None
+            if started < measure_from:
+                continue
+            local_samples[name].append((time.perf_counter() - started) * 1000)
+            if status != 200:
+                local_errors[name] += 1
+        with lock:
+            for name, values in local_samples.items():
+                samples[name].extend(values)
+            for name, count in local_errors.items():
+                errors[name] += count
+
+    threads = [threading.Thread(target=student, args=(i, key)) for i, key in enumerate(sessions)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    rows = []
+    for name in names + ['all']:
+        values = [v for values in samples.values() for v in values] if name == 'all' else samples[name]
+        error_count = sum(errors.values()) if name == 'all' else errors[name]
+        rows.append({
+            'endpoint': name,
+            **summarize(values),
+            'rps': round(len(values) / duration, 1),
+            'errors': error_count,
+            'error_rate': round(error_count / len(values), 4) if values else 0.0,
+        })
+    return rows
+
+
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def _children(pid):
+    try:
+        with open(f'/proc/{pid}/task/{pid}/children', encoding='ascii') as fh:
+            return [int(child) for child in fh.read().split()]
+    except OSError:
+        return []
+
+
+def process_tree_pss_mb(pid):
+    """进程及其子进程的 PSS 合计（MB）：写时复制共享的页按共享进程数分摊；非 Linux 返回 None"""
+    total, pending = 0, [pid]
+    while pending:
+        current = pending.pop()
+        try:
+            with open(f'/proc/{current}/smaps_rollup', encoding='ascii') as fh:
+                for line in fh:
+                    if line.startswith('Pss:'):
+                        total += int(line.split()[1])
+                        break
+        except OSError:
+            if current == pid:
+                return None
+            continue
+        pending.extend(_children(current))
+    return round(total / 1024, 1)
+
+
+@contextmanager
+def _server_process(name, args, port, env=None):
+    process = subprocess.Popen([sys.executable, '-m', name, *args], cwd=BASE_DIR, env={**os.environ, **(env or {})})
+    try:
+        deadline = time.monotonic() + 30
+        while True:
+            try:
+                socket.create_connection(('127.0.0.1', port), timeout=1).close()
+                break
+            except OSError:
+                if process.poll() is not None or time.monotonic() > deadline:
+                    raise RuntimeError(f'{name} did not start')
+                time.sleep(0.2)
+        yield f'http://127.0.0.1:{port}', lambda: process_tree_pss_mb(process.pid)
+    finally:
+        process.terminate()
+        process.wait(timeout=30)
+
+
+def gunicorn_server(workers, threads):
+    port = _free_port()
+    # 不读取 gunicorn_conf，与之前 Dockerfile 中的固定参数一致
+    return _server_process('gunicorn', [
+        'config.wsgi:application', '--bind', f'127.0.0.1:{port}',
+        '--workers', str(workers or 2), '--threads', str(threads or 4), '--log-level', 'warning',
+    ], port)
+
+
+def gunicorn_conf_server(mode, workers, threads):
+    port = _free_port()
+    env = {'SERVER_MODE': mode, 'BIND': f'127.0.0.1:{port}'}
+    if workers:
+        env['WEB_CONCURRENCY'] = str(workers)
+    if threads:
+        env['WEB_THREADS'] = str(threads)
+    return _server_process('gunicorn', ['-c', 'python:config.gunicorn_conf', '--log-level', 'warning'], port, env)
+
+
+def uvicorn_server(workers):
+    port = _free_port()
+    return _server_process('uvicorn', [
+        'config.asgi:application', '--host', '127.0.0.1', '--port', str(port),
+        '--workers', str(workers or 2), '--log-level', 'warning', '--no-access-log',
+    ], port)
+
+
+@contextmanager
+def in_process_server():
+    with wsgi_server() as base_url:
+        yield base_url, lambda: None
+
+
+def server_context(server, args):
+    if server == 'gunicorn':
+        return gunicorn_server(args.workers, args.threads)
+    if server in ('gunicorn-conf', 'gunicorn-conf-asgi'):
+        return gunicorn_conf_server('asgi' if server.endswith('asgi') else 'wsgi', args.workers, args.threads)
+    if server == 'uvicorn':
+        return uvicorn_server(args.workers)
+    return in_process_server()
+
+
+def main():
+    args = parse_args()
+    endpoints = [name.strip() for name in args.endpoints.split(',') if name.strip()]
+    unknown = set(endpoints) - set(ENDPOINTS)
+    if unknown:
+        sys.exit(f"Unknown endpoints: {', '.join(sorted(unknown))}")
+
+    wsgi = 'gunicorn' if importlib.util.find_spec('gunicorn') else 'wsgiref'
+    requested = ['auto', 'uvicorn'] if args.server == 'both' else [s.strip() for s in args.server.split(',') if s.strip()]
+    unknown = set(requested) - set(SERVERS)
+    if unknown:
+        sys.exit(f"Unknown servers: {', '.join(sorted(unknown))}")
+    servers = [wsgi if server == 'auto' else server for server in requested]
+    if any(server.startswith('gunicorn') for server in servers) and not importlib.util.find_spec('gunicorn'):
+        sys.exit('gunicorn is not installed')
+    if any(server in ('uvicorn', 'gunicorn-conf-asgi') for server in servers) and not importlib.util.find_spec('uvicorn'):
+        sys.exit('uvicorn is not installed')
+
+    setup_django(args.data_dir)
+    from django.conf import settings
+
+    seed_dataset(args)
+    sessions = make_sessions(args.users)
+    if len(sessions) < args.users:
+        sys.exit(f'Dataset only has {len(sessions)} students; raise --dataset-users')
+    fixtures = load_fixtures()
+
+    rows = []
+    for server in servers:
+        with server_context(server, args) as (base_url, pss):
+            server_rows = run_load(base_url, sessions, fixtures, endpoints, args.duration, args.warmup, args.seed)
+            server_rows[-1]['pss_mb'] = pss()
+        # 单一服务器时保持原有结果格式，便于和旧结果比较
+        rows.extend({'server': server, **row} if len(servers) > 1 else row for row in server_rows)
+    # 同一接口的各服务器结果相邻排列
+    order = endpoints + ['all']
+    rows.sort(key=lambda row: (order.index(row['endpoint']), servers.index(row.get('server', servers[0]))))
+
+    columns = ['endpoint', 'count', 'rps', 'p50_ms', 'p95_ms', 'p99_ms', 'max_ms', 'errors', 'error_rate', 'pss_mb']
+    print_table(rows, ['server', *columns] if len(servers) > 1 else columns)
+    if args.output:
+        write_results(
+            args.output, 'endpoints', rows,
+            server='+'.join(servers),
+            workers=args.workers,
+            threads=args.threads,
+            users=args.users,
+            duration_s=args.duration,
+            dataset_users=args.dataset_users,
+            tags_per_user=args.tags_per_user,
+            history_per_user=args.history_per_user,
+            session_engine=settings.SESSION_ENGINE,
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,135 @@
+#!/usr/bin/env python
+"""
+模拟上课时全班同时登录：N 个客户端并发完成“打开登录页 -> 提交表单”。
+
+    python benchmarks/login_storm.py --users 60 --concurrency 60 --output login-storm.json
+
+通过 LOGIN_CONCURRENCY / LOGIN_QUEUE_SIZE / LOGIN_QUEUE_TIMEOUT 环境变量比较不同准入设置。
+"""
+import argparse
+import http.cookiejar
+import re
+import threading
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+
+from common import print_table, setup_django, summarize, wsgi_server, write_results
+
+PASSWORD = 'bench-password'
+CSRF_INPUT = re.compile(r'name="csrfmiddlewaretoken" value="([^"]+)"')
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='Simulate a class logging in at the same time.')
+    parser.add_argument('--users', type=int, default=60, help='Number of distinct student accounts')
+    parser.add_argument('--concurrency', type=int, default=60, help='Clients started at the same moment')
+    parser.add_argument('--rounds', type=int, default=1, help='How many storms to run back to back')
+    parser.add_argument('--output', help='Write JSON results to this file')
+    return parser.parse_args()
+
+
+class _NoRedirect(urllib.request.HTTPRedirectHandler):
+    def redirect_request(self, *args, **kwargs):
+        return None
+
+
+def create_users(count):
+    from django.contrib.auth.hashers import make_password
+    from django.contrib.auth.models import User
+
+    # 所有账号共用一个哈希，创建时只需计算一次 PBKDF2
+    password = make_password(PASSWORD)
+    User.objects.bulk_create(
+        [User(username=f'storm{i:04d}', password=password) for i in range(count)],
+        ignore_conflicts=True,
+    )
+    return [f'storm{i:04d}' for i in range(count)]
+
+
+def login_once(base_url, username):
+    """返回 (状态, 耗时毫秒)；只统计提交表单的耗时"""
+    jar = http.cookiejar.CookieJar()
+    opener = urllib.request.build_opener(urllib.request.HTTPCookieProcessor(jar), _NoRedirect)
+    page = opener.open(f'{base_url}/accounts/login/', timeout=60).read().decode()
+    token = CSRF_INPUT.search(page).group(1)
+    data = urllib.parse.urlencode({
+        'username': username,
+        'password': PASSWORD,
+        'csrfmiddlewaretoken': token,
+    }).encode()
+    request = urllib.request.Request(
+        f'{base_url}/accounts/login/', data=data, headers={'Referer': f'{base_url}/accounts/login/'}
+    )
+
+    start = time.perf_counter()
+    try:
+        status = opener.open(request, timeout=60).status
+    except urllib.error.HTTPError as exc:
+        status = exc.code
+    elapsed = (time.perf_counter() - start) * 1000
+    return status, elapsed
+
+
+def run_storm(base_url, usernames, concurrency):
+    barrier = threading.Barrier(concurrency)
+    outcomes = []
+    lock = threading.Lock()
+
+    def client(index):
+        username = usernames[index % len(usernames)]
+        barrier.wait()
+        try:
+            outcome = login_once(base_url, username)
+        except Exception:
+            outcome = ('error', 0.0)
+        with lock:
+            outcomes.append(outcome)
+
+    threads = [threading.Thread(target=client, args=(i,)) for i in range(concurrency)]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    wall = time.perf_counter() - started
+
+    ok = [ms for status, ms in outcomes if status == 302]
+    shed = [ms for status, ms in outcomes if status == 503]
+    return {
+        'logged_in': len(ok),
+        'shed': len(shed),
+        'errors': len(outcomes) - len(ok) - len(shed),
+        'wall_s': round(wall, 3),
+        **summarize(ok),
+        'shed_p50_ms': summarize(shed)['p50_ms'],
+    }
+
+
+def main():
+    args = parse_args()
+    setup_django()
+
+    from django.conf import settings
+
+    usernames = create_users(args.users)
+    rows = []
+    with wsgi_server() as base_url:
+        for round_num in range(1, args.rounds + 1):
+            rows.append({'round': round_num, **run_storm(base_url, usernames, args.concurrency)})
+
+    print_table(rows, ['round', 'logged_in', 'shed', 'errors', 'wall_s', 'p50_ms', 'p95_ms', 'p99_ms', 'shed_p50_ms'])
+    if args.output:
+        write_results(
+            args.output, 'login_storm', rows,
+            users=args.users,
+            concurrency=args.concurrency,
+            login_concurrency=settings.LOGIN_CONCURRENCY,
+            login_queue_size=settings.LOGIN_QUEUE_SIZE,
+            login_queue_timeout=settings.LOGIN_QUEUE_TIMEOUT,
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,63 @@
+#!/usr/bin/env python
+"""
+比较不同会话后端下已登录请求的延迟。
+
+    python benchmarks/session_backends.py --requests 500 --output session-bench.json
+"""
+import argparse
+import time
+
+from common import print_table, setup_django, summarize, write_results
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='Compare request latency across session backends.')
+    parser.add_argument('--requests', type=int, default=300, help='Timed requests per backend')
+    parser.add_argument('--warmup', type=int, default=20, help='Untimed warm-up requests per backend')
+    parser.add_argument('--path', default='/feedback/', help='Login-protected URL to request')
+    parser.add_argument('--output', help='Write JSON results to this file')
+    return parser.parse_args()
+
+
+def bench_engine(engine, user, path, requests, warmup):
+    from django.test import Client, override_settings
+
+    with override_settings(SESSION_ENGINE=engine):
+        client = Client()
+        client.force_login(user)
+        for _ in range(warmup):
+            client.get(path)
+        samples = []
+        errors = 0
+        for _ in range(requests):
+            start = time.perf_counter()
+            response = client.get(path)
+            samples.append((time.perf_counter() - start) * 1000)
+            if response.status_code != 200:
+                errors += 1
+    return samples, errors
+
+
+def main():
+    args = parse_args()
+    setup_django()
+
+    from django.conf import settings
+    from django.contrib.auth.models import User
+    from pastpaper.models import Subject
+
+    Subject.objects.get_or_create(code='cs', defaults={'name': 'Computer Science', 'exam_code': '9618'})
+    user = User.objects.create_user('bench-session', password='bench-password')
+
+    rows = []
+    for strategy, engine in settings.SESSION_ENGINES.items():
+        samples, errors = bench_engine(engine, user, args.path, args.requests, args.warmup)
+        rows.append({'backend': strategy, 'errors': errors, **summarize(samples)})
+
+    print_table(rows, ['backend', 'count', 'mean_ms', 'p50_ms', 'p95_ms', 'p99_ms', 'errors'])
+    if args.output:
+        write_results(args.output, 'session_backends', rows, url=args.path, cache=settings.CACHES['default']['BACKEND'])
+
+
+if __name__ == '__main__':
+    main()
@@ -12,5 +12,7 @@ import os
 from django.core.asgi import get_asgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
+# ASGI 下 JSON 接口使用原生异步视图（见 pastpaper/async_views.py）
+os.environ.setdefault('ASYNC_VIEWS', '1')
 
 application = get_asgi_application()
@@ -0,0 +1,22 @@
+import itertools
+
+from django.core.cache.backends.filebased import FileBasedCache
+
+
+class SharedFileCache(FileBasedCache):
+    """
+    同一数据卷上所有 worker（以及 WSGI / ASGI 两个服务）共用的文件缓存，不需要额外的缓存服务。
+    写入先写临时文件再改名，并发读写不会读到半个文件。
+
+    Django 的 FileBasedCache 每次 set 都列出整个缓存目录判断是否需要淘汰，条目多时写入变慢；
+    这里每个进程每 CULL_CHECK_INTERVAL 次写入才检查一次，条目数可能短暂超过 MAX_ENTRIES。
+    """
+
+    def __init__(self, dir, params):
+        super().__init__(dir, params)
+        self._cull_check_interval = max(1, int(params.get('OPTIONS', {}).get('CULL_CHECK_INTERVAL', 100)))
+        self._writes = itertools.count()
+
+    def _cull(self):
+        if next(self._writes) % self._cull_check_interval == 0:
+            super()._cull()
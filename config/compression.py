@@ -0,0 +1,176 @@
+"""
+响应压缩：
+- CompressionMiddleware 按 Accept-Encoding 对较大的 HTML / JSON 动态响应做 brotli 或 gzip 压缩（含 CSRF token 的响应只用 gzip）；
+- serve_media 提供 /media/ 文件，优先返回 compress_media 命令预先生成的 .br / .gz 文件，不在请求时压缩。
+"""
+import gzip
+import mimetypes
+import os
+import posixpath
+import re
+
+import brotli
+from django.conf import settings
+from django.http import FileResponse, Http404, HttpResponseNotModified
+from django.urls import re_path
+from django.utils._os import safe_join
+from django.utils.cache import patch_vary_headers
+from django.utils.deprecation import MiddlewareMixin
+from django.utils.http import http_date
+from django.utils.regex_helper import _lazy_re_compile
+from django.utils.text import compress_string
+from django.views.static import was_modified_since
+
+# 按优先级排列：(编码名, 预压缩文件后缀)
+ENCODINGS = [('br', '.br'), ('gzip', '.gz')]
+
+COMPRESSIBLE_TYPES = (
+    'text/html',
+    'text/plain',
+    'text/css',
+    'text/csv',
+    'application/json',
+    'application/javascript',
+    'application/vnd.courser.columns+json',
+)
+
+# 动态响应用较低的质量，压缩耗时与 gzip 相当；离线预压缩用最高质量
+BROTLI_DYNAMIC_QUALITY = 5
+BROTLI_OFFLINE_QUALITY = 11
+
+# 已经是压缩格式的文件，再压缩没有收益
+INCOMPRESSIBLE_EXTENSIONS = frozenset({
+    '.br', '.gz', '.zip', '.7z', '.rar', '.xz', '.bz2',
+    '.jpg', '.jpeg', '.png', '.gif', '.webp', '.avif', '.ico',
+    '.mp3', '.mp4', '.m4a', '.webm', '.ogg', '.woff', '.woff2',
+    '.pptx', '.docx', '.xlsx',
+})
+
+# 预压缩文件至少要比原文件小 5% 才保留
+MIN_RATIO = 0.95
+
+_accept_encoding_re = _lazy_re_compile(r'\s*([^\s;,]+)\s*(?:;\s*q\s*=\s*([0-9.]+))?')
+
+
+def accepted_encodings(request):
+    """客户端可接受的编码（按服务端优先级排列，q=0 的编码排除）"""
+    header = request.META.get('HTTP_ACCEPT_ENCODING', '')
+    quality = {}
+    for part in header.split(','):
+        match = _accept_encoding_re.match(part)
+        if not match or not match.group(1):
+            continue
+        try:
+            quality[match.group(1).lower()] = float(match.group(2)) if match.group(2) else 1.0
+        except ValueError:
+            continue
+    wildcard = quality.get('*', 0.0)
+    return [name for name, _ in ENCODINGS if quality.get(name, wildcard) > 0]
+
+
+def compress_bytes(data, encoding, offline=False):
+    if encoding == 'br':
+        return brotli.compress(data, quality=BROTLI_OFFLINE_QUALITY if offline else BROTLI_DYNAMIC_QUALITY)
+    if offline:
+        return gzip.compress(data, compresslevel=9, mtime=0)
+    # 与 Django 的 GZipMiddleware 相同，加入随机长度的文件名字段缓解 BREACH
+    return compress_string(data, max_random_bytes=100)
+
+
+class CompressionMiddleware(MiddlewareMixin):
+    """放在 RequestMetricsMiddleware 之后，压缩耗时计入 total"""
+
+    def process_response(self, request, response):
+        if (
+            not settings.COMPRESS_RESPONSES
+            or response.streaming
+            or response.has_header('Content-Encoding')
+            or len(response.content) < settings.COMPRESS_MIN_SIZE
+        ):
+            return response
+        content_type = response.get('Content-Type', '').split(';')[0].strip().lower()
+        if content_type not in COMPRESSIBLE_TYPES:
+            return response
+
+        patch_vary_headers(response, ['Accept-Encoding'])
+        encodings = accepted_encodings(request)
+        if request.META.get('CSRF_COOKIE_NEEDS_UPDATE'):
+            # 响应中含 CSRF token（get_token 设置该标记）：brotli 没有随机填充，改用带随机填充的 gzip 缓解 BREACH
+            encodings = [encoding for encoding in encodings if encoding != 'br']
+        if not encodings:
+            return response
+
+        compressed = compress_bytes(response.content, encodings[0])
+        if len(compressed) >= len(response.content):
+            return response
+        response.content = compressed
+        response['Content-Length'] = str(len(compressed))
+        response['Content-Encoding'] = encodings[0]
+        # 压缩后字节不同，强 ETag 改为弱 ETag
+        etag = response.get('ETag')
+        if etag and etag.startswith('"'):
+            response['ETag'] = 'W/' + etag
+        return response
+
+
+def precompressed_paths(path):
+    return [(encoding, f'{path}{suffix}') for encoding, suffix in ENCODINGS]
+
+
+def is_compressible(path):
+    return os.path.splitext(path)[1].lower() not in INCOMPRESSIBLE_EXTENSIONS
+
+
+def serve_media(request, path, document_root=None):
+    """
+    替代 django.views.static.serve：客户端支持时返回比原文件新的 .br / .gz 预压缩版本，
+    Content-Type 仍为原文件类型。
+    """
+    path = posixpath.normpath(path).lstrip('/')
+    # 路径越界时 safe_join 抛出 SuspiciousFileOperation（返回 400）
+    fullpath = safe_join(document_root or settings.MEDIA_ROOT, path)
+    try:
+        statobj = os.stat(fullpath)
+    except OSError:
+        raise Http404('File not found')
+    if not os.path.isfile(fullpath):
+        raise Http404('Directories are not listed')
+
+    if not was_modified_since(request.META.get('HTTP_IF_MODIFIED_SINCE'), statobj.st_mtime):
+        response = HttpResponseNotModified()
+        # 与 200 响应一致，缓存按 Accept-Encoding 区分保存的版本
+        patch_vary_headers(response, ['Accept-Encoding'])
+        return response
+
+    content_type, _ = mimetypes.guess_type(fullpath)
+    serve_path, content_encoding = fullpath, None
+    accepted = accepted_encodings(request)
+    for encoding, candidate in precompressed_paths(fullpath):
+        if encoding not in accepted:
+            continue
+        try:
+            # 原文件被替换后，旧的压缩文件不再使用
+            if os.stat(candidate).st_mtime >= statobj.st_mtime:
+                serve_path, content_encoding = candidate, encoding
+                break
+        except OSError:
+            continue
+
+    # 显式传入原文件名，避免 Content-Disposition 中出现 .br / .gz 后缀
+    response = FileResponse(
+        open(serve_path, 'rb'),
+        content_type=content_type or 'application/octet-stream',
+        filename=os.path.basename(fullpath),
+    )
+    response.headers['Last-Modified'] = http_date(statobj.st_mtime)
+    if content_encoding:
+        response.headers['Content-Encoding'] = content_encoding
+    patch_vary_headers(response, ['Accept-Encoding'])
+    return response
+
+
+def media_urlpatterns():
+    prefix = settings.MEDIA_URL.lstrip('/').rstrip('/')
+    if not prefix:
+        return []
+    return [re_path(rf'^{re.escape(prefix)}/(?P<path>.*)$', serve_media, {'document_root': settings.MEDIA_ROOT})]
@@ -0,0 +1,369 @@
+"""
+Prometheus 文本格式的运行指标（/metrics/）。
+
+每个进程在内存中累计，并定期把快照写入 METRICS_DIR/<主机名>-<pid>-<随机后缀>.json；
+/metrics/ 合并目录中所有进程的文件（多个容器共用数据卷时也包括其他容器），
+因此不论请求落在哪个 gunicorn worker 上，看到的都是全局数据。
+
+已退出进程的计数器和直方图并入 aggregate.json 后删除各自的文件（保证单调递增，文件数不随 worker 重启增长），
+瞬时值（gauge）只统计仍在运行的进程。其他容器的进程无法直接判断存活，文件超过 METRICS_STALE_SECONDS
+未更新即视为退出；若该进程其实只是空闲，下次写入时发现文件已被合并，会扣除已合并的部分再写，不会重复计数。
+"""
+import atexit
+import hmac
+import ipaddress
+import json
+import os
+import socket
+import threading
+import time
+import uuid
+from collections import defaultdict
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # Windows 开发环境：不做跨进程加锁和合并
+    fcntl = None
+
+from django.conf import settings
+from django.http import HttpResponse, HttpResponseForbidden
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# 名称 -> (类型, 说明)
+METRICS = {
+    'courser_http_requests_total': ('counter', 'HTTP requests by URL name, method and status'),
+    'courser_http_request_duration_seconds': ('histogram', 'Request latency by URL name'),
+    'courser_db_queries_total': ('counter', 'SQL statements executed, by URL name'),
+    'courser_db_query_duration_seconds_total': ('counter', 'Time spent in SQL, by URL name'),
+    'courser_cache_requests_total': ('counter', 'Cache lookups by cache name and result (hit/miss)'),
+    'courser_inflight_requests': ('gauge', 'Requests currently being handled, by kind (read/write)'),
+    'courser_login_queue_depth': ('gauge', 'Logins waiting for a password-check slot'),
+}
+
+
+AGGREGATE_NAME = 'aggregate.json'
+LOCK_NAME = '.lock'
+HOSTNAME = socket.gethostname()
+
+
+def _key(name, labels):
+    return name, tuple(sorted((labels or {}).items()))
+
+
+def _process_start(pid):
+    """进程启动时间（开机后的时钟滴答数），用于识别 pid 被复用；不可用时为 None"""
+    try:
+        with open(f'/proc/{pid}/stat', encoding='ascii') as fh:
+            # 第 2 列（进程名）可能含空格，从最后一个右括号之后开始数
+            return int(fh.read().rsplit(')', 1)[1].split()[19])
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def _add_values(counters, histograms, snapshot):
+    for name, labels, value in snapshot['counters']:
+        counters[_key(name, dict(labels))] += value
+    for name, labels, values in snapshot['histograms']:
+        key = _key(name, dict(labels))
+        if key in histograms:
+            histograms[key] = [a + b for a, b in zip(histograms[key], values)]
+        else:
+            histograms[key] = list(values)
+
+
+class MetricsStore:
+    def __init__(self, directory, flush_interval, stale_seconds):
+        self.directory = directory
+        self.flush_interval = flush_interval
+        self.stale_seconds = stale_seconds
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self.counters = defaultdict(float)
+        self.gauges = defaultdict(float)
+        # (name, labels) -> [各桶计数..., +Inf 计数, 总和]
+        self.histograms = {}
+        self._reset_process()
+
+    def _reset_process(self):
+        self.pid = os.getpid()
+        self.started = _process_start(self.pid)
+        # 不同容器（PID 命名空间）中的 pid 会重复，文件名加上主机名和随机后缀
+        self.process_id = f'{HOSTNAME}-{self.pid}-{uuid.uuid4().hex[:8]}'
+        self.path = os.path.join(self.directory, f'{self.process_id}.json')
+        self._last_flush = 0.0
+        # 上次写入文件的计数器和直方图；文件被合并进 aggregate.json 后从内存中扣除
+        self._flushed = None
+
+    def _check_fork(self):
+        # gunicorn 在导入应用后 fork worker，子进程需要从零开始计数
+        if os.getpid() != self.pid:
+            self.counters.clear()
+            self.gauges.clear()
+            self.histograms.clear()
+            self._reset_process()
+
+    def inc(self, name, labels=None, value=1.0):
+        with self._lock:
+            self._check_fork()
+            self.counters[_key(name, labels)] += value
+        self.maybe_flush()
+
+    def add_gauge(self, name, labels=None, value=1.0):
+        with self._lock:
+            self._check_fork()
+            self.gauges[_key(name, labels)] += value
+        self.maybe_flush()
+
+    def set_gauge(self, name, labels=None, value=0.0):
+        with self._lock:
+            self._check_fork()
+            self.gauges[_key(name, labels)] = value
+
+    def observe(self, name, labels, value):
+        with self._lock:
+            self._check_fork()
+            key = _key(name, labels)
+            bucket = self.histograms.get(key)
+            if bucket is None:
+                bucket = self.histograms[key] = [0] * (len(LATENCY_BUCKETS) + 1) + [0.0]
+            for index, bound in enumerate(LATENCY_BUCKETS):
+                if value <= bound:
+                    bucket[index] += 1
+            bucket[len(LATENCY_BUCKETS)] += 1
+            bucket[-1] += value
+        self.maybe_flush()
+
+    def snapshot(self):
+        with self._lock:
+            self._check_fork()
+            return {
+                'host': HOSTNAME,
+                'pid': self.pid,
+                'started': self.started,
+                'counters': [[name, labels, value] for (name, labels), value in self.counters.items()],
+                'gauges': [[name, labels, value] for (name, labels), value in self.gauges.items()],
+                'histograms': [[name, labels, list(values)] for (name, labels), values in self.histograms.items()],
+            }
+
+    def maybe_flush(self):
+        if time.monotonic() - self._last_flush >= self.flush_interval:
+            self.flush()
+
+    @contextmanager
+    def _directory_lock(self):
+        """METRICS_DIR 内跨进程互斥：写入快照与合并已退出进程的文件不能交错"""
+        if fcntl is None:
+            yield
+            return
+        with open(os.path.join(self.directory, LOCK_NAME), 'a') as fh:
+            fcntl.flock(fh, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(fh, fcntl.LOCK_UN)
+
+    def _subtract_flushed(self):
+        """本进程的文件已被当作退出进程合并：已写入的部分留在 aggregate.json，内存中只保留之后的增量"""
+        with self._lock:
+            for name, labels, value in self._flushed['counters']:
+                key = _key(name, dict(labels))
+                self.counters[key] -= value
+            for name, labels, values in self._flushed['histograms']:
+                key = _key(name, dict(labels))
+                self.histograms[key] = [a - b for a, b in zip(self.histograms[key], values)]
+
+    def flush(self):
+        self._last_flush = time.monotonic()
+        with self._flush_lock:
+            try:
+                with self._directory_lock():
+                    if self._flushed is not None and not os.path.exists(self.path):
+                        self._subtract_flushed()
+                    snapshot = self.snapshot()
+                    tmp_path = f'{self.path}.tmp'
+                    with open(tmp_path, 'w', encoding='utf-8') as fh:
+                        json.dump(snapshot, fh)
+                    os.replace(tmp_path, self.path)
+                    self._flushed = snapshot
+            except OSError:
+                pass
+
+    def _alive(self, snapshot, mtime):
+        if snapshot.get('host') == HOSTNAME:
+            return _pid_alive(snapshot['pid']) and _process_start(snapshot['pid']) == snapshot.get('started')
+        # 其他容器的进程：以文件更新时间判断
+        return time.time() - mtime < self.stale_seconds
+
+    def _snapshots(self):
+        """
+        所有进程的快照，已退出进程的文件并入 aggregate.json；本进程使用内存中的最新数据。
+        返回 [(快照, 是否仍在运行)]
+        """
+        own = self.snapshot()
+        snapshots = [(own, True)]
+        with self._directory_lock():
+            try:
+                names = os.listdir(self.directory)
+            except OSError:
+                names = []
+            aggregate_path = os.path.join(self.directory, AGGREGATE_NAME)
+            folded_counters, folded_histograms, folded = defaultdict(float), {}, []
+            for name in names:
+                if not name.endswith('.json') or name in (AGGREGATE_NAME, f'{self.process_id}.json'):
+                    continue
+                path = os.path.join(self.directory, name)
+                try:
+                    mtime = os.path.getmtime(path)
+                    with open(path, encoding='utf-8') as fh:
+                        snapshot = json.load(fh)
+                except (OSError, ValueError):
+                    continue
+                if fcntl is not None and not self._alive(snapshot, mtime):
+                    _add_values(folded_counters, folded_histograms, snapshot)
+                    folded.append(path)
+                else:
+                    snapshots.append((snapshot, True))
+
+            try:
+                with open(aggregate_path, encoding='utf-8') as fh:
+                    aggregate = json.load(fh)
+            except (OSError, ValueError):
+                aggregate = {'counters': [], 'gauges': [], 'histograms': []}
+            if folded:
+                _add_values(folded_counters, folded_histograms, aggregate)
+                aggregate = {
+                    'counters': [[name, labels, value] for (name, labels), value in folded_counters.items()],
+                    'gauges': [],
+                    'histograms': [[name, labels, values] for (name, labels), values in folded_histograms.items()],
+                }
+                try:
+                    tmp_path = f'{aggregate_path}.tmp'
+                    with open(tmp_path, 'w', encoding='utf-8') as fh:
+                        json.dump(aggregate, fh)
+                    os.replace(tmp_path, aggregate_path)
+                    for path in folded:
+                        os.remove(path)
+                except OSError:
+                    # 合并失败时保留原文件，下次再试；本次仍按合并后的结果输出
+                    pass
+            snapshots.append((aggregate, False))
+        return snapshots
+
+    def collect(self):
+        counters = defaultdict(float)
+        gauges = defaultdict(float)
+        histograms = {}
+        for snapshot, alive in self._snapshots():
+            _add_values(counters, histograms, snapshot)
+            if alive:
+                for name, labels, value in snapshot['gauges']:
+                    gauges[_key(name, dict(labels))] += value
+        return counters, gauges, histograms
+
+
+def _pid_alive(pid):
+    if pid == os.getpid():
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_labels(labels, extra=None):
+    pairs = list(labels) + list(extra or [])
+    if not pairs:
+        return ''
+    return '{' + ','.join(f'{key}="{_escape(value)}"' for key, value in pairs) + '}'
+
+
+def _format_value(value):
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+def request_kind(request):
+    return 'read' if request.method in ('GET', 'HEAD', 'OPTIONS') else 'write'
+
+
+def request_started(request):
+    store.add_gauge('courser_inflight_requests', {'kind': request_kind(request)}, 1)
+
+
+def observe_request(request, response, metrics):
+    """由 RequestMetricsMiddleware 在每个请求结束时调用"""
+    from accounts.throttle import login_admission
+
+    match = getattr(request, 'resolver_match', None)
+    view = match.view_name if match else '<unmatched>'
+    store.add_gauge('courser_inflight_requests', {'kind': request_kind(request)}, -1)
+    store.set_gauge('courser_login_queue_depth', None, login_admission.waiting)
+    store.inc('courser_db_queries_total', {'view': view}, metrics.sql_count)
+    store.inc('courser_db_query_duration_seconds_total', {'view': view}, metrics.sql_ms / 1000)
+    status = response.status_code if response is not None else 500
+    store.inc('courser_http_requests_total', {'view': view, 'method': request.method, 'status': status})
+    store.observe('courser_http_request_duration_seconds', {'view': view}, metrics.total_ms / 1000)
+
+
+def render_metrics():
+    """生成 Prometheus 文本格式（text/plain; version=0.0.4）"""
+    counters, gauges, histograms = store.collect()
+
+    lines = []
+    for name, (kind, description) in METRICS.items():
+        lines.append(f'# HELP {name} {description}')
+        lines.append(f'# TYPE {name} {kind}')
+        if kind == 'histogram':
+            for (metric, labels), values in sorted(histograms.items()):
+                if metric != name:
+                    continue
+                for bound, count in zip(LATENCY_BUCKETS, values):
+                    lines.append(f'{name}_bucket{_format_labels(labels, [("le", bound)])} {count}')
+                lines.append(f'{name}_bucket{_format_labels(labels, [("le", "+Inf")])} {values[len(LATENCY_BUCKETS)]}')
+                lines.append(f'{name}_sum{_format_labels(labels)} {_format_value(values[-1])}')
+                lines.append(f'{name}_count{_format_labels(labels)} {values[len(LATENCY_BUCKETS)]}')
+        else:
+            source = counters if kind == 'counter' else gauges
+            for (metric, labels), value in sorted(source.items()):
+                if metric == name:
+                    lines.append(f'{name}{_format_labels(labels)} {_format_value(value)}')
+    return '\n'.join(lines) + '\n'
+
+
+def record_cache(cache_name, hit):
+    """供各处缓存调用，统计命中率"""
+    if settings.METRICS_ENABLED:
+        store.inc('courser_cache_requests_total', {'cache': cache_name, 'result': 'hit' if hit else 'miss'})
+
+
+def _is_loopback(address):
+    try:
+        return ipaddress.ip_address(address).is_loopback
+    except ValueError:
+        return False
+
+
+def metrics_view(request):
+    """设置 METRICS_TOKEN 时校验 Bearer 令牌；未设置时只允许本机访问（如容器内的 curl）"""
+    if not settings.METRICS_ENABLED:
+        return HttpResponse(status=404)
+    token = settings.METRICS_TOKEN
+    if token:
+        if not hmac.compare_digest(request.headers.get('Authorization', ''), f'Bearer {token}'):
+            return HttpResponseForbidden()
+    elif not _is_loopback(request.META.get('REMOTE_ADDR', '')):
+        return HttpResponseForbidden()
+    return HttpResponse(render_metrics(), content_type='text/plain; version=0.0.4; charset=utf-8')
+
+
+os.makedirs(settings.METRICS_DIR, exist_ok=True)
+store = MetricsStore(str(settings.METRICS_DIR), settings.METRICS_FLUSH_INTERVAL, settings.METRICS_STALE_SECONDS)
+atexit.register(store.flush)
@@ -0,0 +1,272 @@
+"""请求耗时统计：SQL 次数/耗时、模板渲染、JSON 编码，输出 Server-Timing 头、结构化日志和慢请求日志"""
+import json
+import logging
+import time
+from collections import defaultdict
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.db import connections
+from django.db.backends.signals import connection_created
+from django.http import JsonResponse
+from django.template.backends.django import Template as DjangoTemplate
+from whitenoise.middleware import WhiteNoiseMiddleware
+
+from . import metrics as prometheus
+
+logger = logging.getLogger('config.requests')
+slow_logger = logging.getLogger('config.slow_requests')
+
+# 每条慢请求日志最多列出的 SQL 语句数
+SLOW_LOG_STATEMENTS = 10
+
+_current = ContextVar('request_metrics', default=None)
+
+
+class RequestMetrics:
+    """单个请求的计时数据；SQL 按语句文本聚合，N+1 查询会显示为同一语句的高次数"""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.sql_count = 0
+        self.sql_ms = 0.0
+        self.template_ms = 0.0
+        self.json_ms = 0.0
+        self.total_ms = 0.0
+        self.statements = defaultdict(lambda: [0, 0.0])
+        # 各计时项当前的嵌套层数，只有最外层调用计时
+        self.timer_depth = defaultdict(int)
+
+    def add_query(self, sql, elapsed_ms):
+        self.sql_count += 1
+        self.sql_ms += elapsed_ms
+        entry = self.statements[sql]
+        entry[0] += 1
+        entry[1] += elapsed_ms
+
+    def finish(self):
+        self.total_ms = (time.perf_counter() - self.started) * 1000
+
+    def server_timing(self):
+        return ', '.join([
+            f'sql;dur={self.sql_ms:.1f};desc="{self.sql_count} queries"',
+            f'tpl;dur={self.template_ms:.1f}',
+            f'json;dur={self.json_ms:.1f}',
+            f'total;dur={self.total_ms:.1f}',
+        ])
+
+    def as_dict(self):
+        return {
+            'sql_count': self.sql_count,
+            'sql_ms': round(self.sql_ms, 2),
+            'template_ms': round(self.template_ms, 2),
+            'json_ms': round(self.json_ms, 2),
+            'total_ms': round(self.total_ms, 2),
+        }
+
+    def top_statements(self, limit=SLOW_LOG_STATEMENTS):
+        ranked = sorted(self.statements.items(), key=lambda item: item[1][1], reverse=True)
+        return [
+            {'count': count, 'ms': round(ms, 2), 'sql': sql}
+            for sql, (count, ms) in ranked[:limit]
+        ]
+
+
+def current_metrics():
+    """当前请求的计时对象（不在请求中时为 None）"""
+    return _current.get()
+
+
+def _timed(attribute, func):
+    def wrapper(*args, **kwargs):
+        metrics = _current.get()
+        if metrics is None or metrics.timer_depth[attribute]:
+            return func(*args, **kwargs)
+        metrics.timer_depth[attribute] += 1
+        started = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            metrics.timer_depth[attribute] -= 1
+            setattr(metrics, attribute, getattr(metrics, attribute) + (time.perf_counter() - started) * 1000)
+    wrapper.__wrapped__ = func
+    return wrapper
+
+
+def _install_timers():
+    # 表单控件等在模板渲染过程中会再次调用 render()，_timed 只计最外层，不会重复计时
+    if not hasattr(DjangoTemplate.render, '__wrapped__'):
+        DjangoTemplate.render = _timed('template_ms', DjangoTemplate.render)
+    if not hasattr(JsonResponse.__init__, '__wrapped__'):
+        JsonResponse.__init__ = _timed('json_ms', JsonResponse.__init__)
+
+
+def _sql_timer(execute, sql, params, many, context):
+    # 常驻在每个数据库连接上，按 contextvar 找到当前请求；
+    # ASGI 下查询在 sync_to_async 的线程里执行，contextvar 会随之传递
+    metrics = _current.get()
+    if metrics is None:
+        return execute(sql, params, many, context)
+    started = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        metrics.add_query(sql, (time.perf_counter() - started) * 1000)
+
+
+def _attach_sql_timer(connection, **kwargs):
+    if _sql_timer not in connection.execute_wrappers:
+        connection.execute_wrappers.insert(0, _sql_timer)
+
+
+def _install_sql_timer():
+    connection_created.connect(_attach_sql_timer, dispatch_uid='config.middleware.sql_timer')
+    for connection in connections.all(initialized_only=True):
+        _attach_sql_timer(connection)
+
+
+def _user_id(user):
+    return user.pk if user is not None and user.is_authenticated else None
+
+
+class RequestMetricsMiddleware:
+    """放在 MIDDLEWARE 最前面，会话、认证等中间件的查询也会计入；同时支持 WSGI 与 ASGI"""
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+        _install_timers()
+        _install_sql_timer()
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        metrics, token = self.start(request)
+        response = None
+        try:
+            response = self.get_response(request)
+        finally:
+            self.finish(request, response, metrics, token)
+        user = getattr(request, 'user', None)
+        return self.process(request, response, metrics, _user_id(user))
+
+    async def __acall__(self, request):
+        metrics, token = self.start(request)
+        response = None
+        try:
+            response = await self.get_response(request)
+        finally:
+            self.finish(request, response, metrics, token)
+        # 异步上下文中不能访问惰性的 request.user
+        user = await request.auser() if hasattr(request, 'auser') else None
+        return self.process(request, response, metrics, _user_id(user))
+
+    def start(self, request):
+        metrics = RequestMetrics()
+        token = _current.set(metrics)
+        if settings.METRICS_ENABLED:
+            prometheus.request_started(request)
+        return metrics, token
+
+    def finish(self, request, response, metrics, token):
+        _current.reset(token)
+        # 流式响应只统计到视图返回为止
+        metrics.finish()
+        if settings.METRICS_ENABLED:
+            prometheus.observe_request(request, response, metrics)
+
+    def process(self, request, response, metrics, user_id):
+        request.metrics = metrics
+        if settings.SERVER_TIMING:
+            response['Server-Timing'] = metrics.server_timing()
+        self.log(request, response, metrics, user_id)
+        return response
+
+    def log(self, request, response, metrics, user_id):
+        record = {
+            'method': request.method,
+            'path': request.path,
+            'status': response.status_code,
+            'user': user_id,
+            **metrics.as_dict(),
+        }
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(json.dumps(record))
+
+        if metrics.total_ms >= settings.SLOW_REQUEST_MS or metrics.sql_count > settings.SLOW_REQUEST_QUERIES:
+            record['statements'] = metrics.top_statements()
+            slow_logger.warning(json.dumps(record, ensure_ascii=False))
+
+
+class AsyncWhiteNoiseMiddleware(WhiteNoiseMiddleware):
+    """WhiteNoise 的中间件只有同步版本，ASGI 下会让每个请求多切换一次线程"""
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response=None, *args, **kwargs):
+        super().__init__(get_response, *args, **kwargs)
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        return super().__call__(request)
+
+    async def __acall__(self, request):
+        if self.autorefresh:
+            static_file = self.find_file(request.path_info)
+        else:
+            static_file = self.files.get(request.path_info)
+        if static_file is not None:
+            response = self.serve(static_file, request)
+            if response.streaming:
+                # 文件分块在线程池中读取，不阻塞事件循环
+                response.streaming_content = _read_in_thread(response.streaming_content)
+            return response
+        return await self.get_response(request)
+
+
+class AsyncStreamingMiddleware:
+    """
+    ASGI 下 Django 用 sync_to_async(list) 消费同步迭代器，整个文件或导出先读入内存才发送第一个字节；
+    这里改为逐块在线程中读取。WSGI 下不做处理
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        return self.get_response(request)
+
+    async def __acall__(self, request):
+        response = await self.get_response(request)
+        if response.streaming and not response.is_async:
+            # 导出的生成器在遍历时查询数据库，需留在本请求的同步线程中（与视图使用同一个数据库连接）
+            response.streaming_content = _read_in_thread(response.streaming_content, thread_sensitive=True)
+        return response
+
+
+async def _read_in_thread(chunks, thread_sensitive=False):
+    iterator = iter(chunks)
+    while True:
+        chunk = await sync_to_async(next, thread_sensitive=thread_sensitive)(iterator, None)
+        if chunk is None:
+            break
+        yield chunk
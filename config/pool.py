@@ -0,0 +1,15 @@
+"""管理命令共用的进程池"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import django
+
+
+def init_worker():
+    """spawn 方式启动的子进程需要重新初始化 Django（fork 方式下为空操作）"""
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
+    django.setup()
+
+
+def process_pool(workers):
+    return ProcessPoolExecutor(max_workers=workers, initializer=init_worker)
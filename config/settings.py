@@ -1,6 +1,8 @@
 import os
 from pathlib import Path
 
+from django.core.exceptions import ImproperlyConfigured
+
 
 def env_bool(name, default=False):
     value = os.getenv(name)
@@ -40,6 +42,9 @@ SECRET_KEY = os.getenv('SECRET_KEY', 'django-insecure-!*972fdn8(kxr%n8_55rgj#(1&
 DEBUG = env_bool('DEBUG', True)
 
 ALLOWED_HOSTS = env_list('ALLOWED_HOSTS', '*' if DEBUG else '')
+# 容器内的 HEALTHCHECK 通过 127.0.0.1 访问 /readyz/
+if '*' not in ALLOWED_HOSTS:
+    ALLOWED_HOSTS += ['127.0.0.1', 'localhost']
 
 # CSRF settings
 CSRF_TRUSTED_ORIGINS = env_list(
@@ -63,29 +68,40 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'config.middleware.RequestMetricsMiddleware',
+    'config.middleware.AsyncStreamingMiddleware',
+    'config.compression.CompressionMiddleware',
     'django.middleware.security.SecurityMiddleware',
-    'whitenoise.middleware.WhiteNoiseMiddleware',
+    'config.middleware.AsyncWhiteNoiseMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'pastpaper.profiling.ProfilingMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
 
 ROOT_URLCONF = 'config.urls'
 
+_TEMPLATE_LOADERS = [
+    'django.template.loaders.filesystem.Loader',
+    'django.template.loaders.app_directories.Loader',
+]
+
 TEMPLATES = [
     {
         'BACKEND': 'django.template.backends.django.DjangoTemplates',
         'DIRS': [BASE_DIR / 'templates'],
-        'APP_DIRS': True,
         'OPTIONS': {
+            # 生产环境模板只编译一次，之后从进程内缓存取；DEBUG 时每次读取文件，修改模板立即生效
+            'loaders': _TEMPLATE_LOADERS if DEBUG else [('django.template.loaders.cached.Loader', _TEMPLATE_LOADERS)],
             'context_processors': [
                 'django.template.context_processors.request',
                 'django.contrib.auth.context_processors.auth',
                 'django.contrib.messages.context_processors.messages',
                 'pastpaper.context_processors.permissions',
+                'pastpaper.context_processors.catalog',
             ],
         },
     },
@@ -107,6 +123,13 @@ DATABASES = {
     }
 }
 
+# 题库变更日志保留天数（manage.py prune_catalog_changes，boot 时执行）；更早的同步水位线会收到全量快照
+CATALOG_CHANGE_RETENTION_DAYS = int(os.getenv('CATALOG_CHANGE_RETENTION_DAYS', '180'))
+
+# 数据库快照（manage.py backup_db / restore_db）：压缩快照的目录和保留份数
+BACKUP_DIR = env_path('BACKUP_DIR', DATA_DIR / 'backups')
+BACKUP_KEEP = int(os.getenv('BACKUP_KEEP', '7'))
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
@@ -145,7 +168,11 @@ USE_TZ = True
 STATIC_URL = os.getenv('STATIC_URL', '/static/')
 STATICFILES_DIRS = [BASE_DIR / 'static']
 STATIC_ROOT = env_path('STATIC_ROOT', BASE_DIR / 'staticfiles')
-STATICFILES_STORAGE = 'whitenoise.storage.CompressedManifestStaticFilesStorage'
+# 文件名带内容哈希，WhiteNoise 对其返回 immutable 长期缓存；Django 5.1 起只读取 STORAGES
+STORAGES = {
+    'default': {'BACKEND': 'django.core.files.storage.FileSystemStorage'},
+    'staticfiles': {'BACKEND': 'config.storage.StaticFilesStorage'},
+}
 STATIC_ROOT.mkdir(parents=True, exist_ok=True)
 
 # Media files (User uploads)
@@ -153,6 +180,117 @@ MEDIA_URL = os.getenv('MEDIA_URL', '/media/')
 MEDIA_ROOT = env_path('MEDIA_ROOT', DATA_DIR / 'media')
 MEDIA_ROOT.mkdir(parents=True, exist_ok=True)
 
+# 动态 HTML / JSON 响应超过 COMPRESS_MIN_SIZE 字节时按 Accept-Encoding 使用 brotli 或 gzip 压缩；
+# /media/ 文件的预压缩版本由 manage.py compress_media 生成
+COMPRESS_RESPONSES = env_bool('COMPRESS_RESPONSES', True)
+COMPRESS_MIN_SIZE = int(os.getenv('COMPRESS_MIN_SIZE', '1024'))
+
+# Cache
+# CACHE_BACKEND:
+#   file   - default, files under CACHE_DIR shared by every worker process and kept across restarts
+#   locmem - per-process memory, each worker has its own copy
+CACHE_BACKENDS = {
+    'file': {
+        'BACKEND': 'config.cache.SharedFileCache',
+        'LOCATION': str(env_path('CACHE_DIR', DATA_DIR / 'cache')),
+        'OPTIONS': {
+            'MAX_ENTRIES': int(os.getenv('CACHE_MAX_ENTRIES', '20000')),
+            'CULL_FREQUENCY': 4,
+        },
+    },
+    'locmem': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'},
+}
+CACHE_BACKEND = os.getenv('CACHE_BACKEND', 'file').strip().lower()
+if CACHE_BACKEND not in CACHE_BACKENDS:
+    raise ImproperlyConfigured(
+        f"CACHE_BACKEND must be one of: {', '.join(CACHE_BACKENDS)} (got {CACHE_BACKEND!r})"
+    )
+CACHES = {'default': CACHE_BACKENDS[CACHE_BACKEND]}
+
+# Sessions
+# SESSION_STRATEGY:
+#   db             - default, every request reads django_session from SQLite
+#   cached_db      - cache first, DB fallback (needs a cache shared by all workers)
+#   cache          - cache only, sessions are lost when the cache is cleared
+#   signed_cookies - payload stored in a signed cookie, no server-side storage
+SESSION_ENGINES = {
+    'db': 'django.contrib.sessions.backends.db',
+    'cached_db': 'django.contrib.sessions.backends.cached_db',
+    'cache': 'django.contrib.sessions.backends.cache',
+    'signed_cookies': 'django.contrib.sessions.backends.signed_cookies',
+}
+SESSION_STRATEGY = os.getenv('SESSION_STRATEGY', 'db').strip().lower()
+if SESSION_STRATEGY not in SESSION_ENGINES:
+    raise ImproperlyConfigured(
+        f"SESSION_STRATEGY must be one of: {', '.join(SESSION_ENGINES)} (got {SESSION_STRATEGY!r})"
+    )
+SESSION_ENGINE = SESSION_ENGINES[SESSION_STRATEGY]
+SESSION_COOKIE_AGE = int(os.getenv('SESSION_COOKIE_AGE', str(60 * 60 * 24 * 14)))
+# 过期会话分批清理（manage.py purge_sessions）
+SESSION_PURGE_CHUNK_SIZE = int(os.getenv('SESSION_PURGE_CHUNK_SIZE', '1000'))
+
+# 登录准入控制（每个进程）：同时进行密码校验的请求数、排队上限与最长等待秒数
+LOGIN_CONCURRENCY = int(os.getenv('LOGIN_CONCURRENCY', str(max(1, os.cpu_count() or 1))))
+LOGIN_QUEUE_SIZE = int(os.getenv('LOGIN_QUEUE_SIZE', '16'))
+LOGIN_QUEUE_TIMEOUT = float(os.getenv('LOGIN_QUEUE_TIMEOUT', '5'))
+
+# JSON 接口使用 pastpaper/async_views.py 中的异步版本（config/asgi.py 默认开启，WSGI 下保持同步视图）
+ASYNC_VIEWS = env_bool('ASYNC_VIEWS', False)
+
+# 请求计时：Server-Timing 头、每个请求一行 JSON 日志（config.requests，REQUEST_LOG_LEVEL=INFO 时输出），
+# 超过阈值的请求连同耗时最多的 SQL 写入慢请求日志
+SERVER_TIMING = env_bool('SERVER_TIMING', True)
+SLOW_REQUEST_MS = float(os.getenv('SLOW_REQUEST_MS', '200'))
+SLOW_REQUEST_QUERIES = int(os.getenv('SLOW_REQUEST_QUERIES', '20'))
+SLOW_REQUEST_LOG = env_path('SLOW_REQUEST_LOG', DATA_DIR / 'logs' / 'slow_requests.log')
+SLOW_REQUEST_LOG.parent.mkdir(parents=True, exist_ok=True)
+
+# Prometheus 指标（/metrics/）：各进程把计数写入 METRICS_DIR，读取时合并；
+# 设置 METRICS_TOKEN 后需要带 Authorization: Bearer <token>，未设置时只允许本机访问
+METRICS_ENABLED = env_bool('METRICS_ENABLED', True)
+METRICS_TOKEN = os.getenv('METRICS_TOKEN', '')
+METRICS_DIR = env_path('METRICS_DIR', DATA_DIR / 'metrics')
+METRICS_FLUSH_INTERVAL = float(os.getenv('METRICS_FLUSH_INTERVAL', '1'))
+# 其他容器（共用 METRICS_DIR）的进程文件超过该秒数未更新即合并进 aggregate.json
+METRICS_STALE_SECONDS = float(os.getenv('METRICS_STALE_SECONDS', '600'))
+
+# 请求剖析：管理员加 ?_profile=1 或请求头 X-Profile: 1；PROFILE_SAMPLE_RATE=N 表示每 N 个请求随机剖析一个（0 关闭）
+PROFILE_SAMPLE_RATE = int(os.getenv('PROFILE_SAMPLE_RATE', '0'))
+PROFILE_SAMPLE_INTERVAL = float(os.getenv('PROFILE_SAMPLE_INTERVAL', '0.002'))
+PROFILE_KEEP = int(os.getenv('PROFILE_KEEP', '50'))
+PROFILE_DIR = env_path('PROFILE_DIR', DATA_DIR / 'profiles')
+
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'formatters': {
+        'plain': {'format': '%(asctime)s %(levelname)s %(name)s %(message)s'},
+    },
+    'handlers': {
+        'console': {'class': 'logging.StreamHandler', 'formatter': 'plain'},
+        'slow_requests': {
+            'class': 'logging.handlers.RotatingFileHandler',
+            'filename': SLOW_REQUEST_LOG,
+            'maxBytes': 10 * 1024 * 1024,
+            'backupCount': 3,
+            'encoding': 'utf-8',
+            'formatter': 'plain',
+        },
+    },
+    'loggers': {
+        'config.requests': {
+            'handlers': ['console'],
+            'level': os.getenv('REQUEST_LOG_LEVEL', 'WARNING').upper(),
+            'propagate': False,
+        },
+        'config.slow_requests': {
+            'handlers': ['slow_requests', 'console'],
+            'level': 'WARNING',
+            'propagate': False,
+        },
+    },
+}
+
 # Login URLs
 LOGIN_URL = 'accounts:login'
 LOGIN_REDIRECT_URL = 'pastpaper:home'
@@ -0,0 +1,23 @@
+from whitenoise.storage import CompressedManifestStaticFilesStorage
+
+
+def _without_source_maps(patterns):
+    result = []
+    for extension, rules in patterns:
+        rules = tuple(
+            rule for rule in rules
+            if 'sourceMappingURL' not in (rule if isinstance(rule, str) else rule[0])
+        )
+        if rules:
+            result.append((extension, rules))
+    return tuple(result)
+
+
+class StaticFilesStorage(CompressedManifestStaticFilesStorage):
+    """
+    带内容哈希的静态文件（WhiteNoise 对其返回 immutable 缓存头）。
+    不改写 sourceMappingURL：第三方库（pdfjs-dist、bootstrap）引用的 .map 文件没有随仓库提供，
+    改写时找不到文件会使 collectstatic 失败。
+    """
+
+    patterns = _without_source_maps(CompressedManifestStaticFilesStorage.patterns)
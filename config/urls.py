@@ -1,35 +1,74 @@
 """
 URL configuration for config project.
 """
+import os
+import uuid
+
 from django.contrib import admin
 from django.conf import settings
 from django.conf.urls.static import static
+from django.core.cache import cache
+from django.db import DatabaseError
 from django.http import JsonResponse
-from django.urls import include, path, re_path
-from django.views.static import serve
+from django.urls import include, path
+
+from pastpaper.models import catalog_version
+from pastpaper.warmup import catalog_cache_warm, warm_catalog_in_background
+
+from .compression import media_urlpatterns
+from .metrics import metrics_view
 
 
 def healthz(_request):
     """Lightweight container health check endpoint."""
     return JsonResponse({'status': 'ok'})
 
+
+def readyz(_request):
+    """
+    就绪检查（Docker HEALTHCHECK）：数据库可查询、媒体目录可读、共享缓存可读写且题库缓存已预热。
+    缓存为空（被清空或淘汰）时返回 503 并在后台预热，探针本身不等待预热完成。
+    """
+    checks = {}
+    try:
+        version = catalog_version()
+        checks['database'] = 'ok'
+    except DatabaseError as exc:
+        version = None
+        checks['database'] = str(exc)
+
+    media_ok = os.path.isdir(settings.MEDIA_ROOT) and os.access(settings.MEDIA_ROOT, os.R_OK | os.X_OK)
+    checks['media'] = 'ok' if media_ok else 'unreadable'
+
+    probe = uuid.uuid4().hex
+    try:
+        cache.set('readyz:probe', probe, 60)
+        cache_ok = cache.get('readyz:probe') == probe
+    except OSError:
+        cache_ok = False
+    checks['cache'] = 'ok' if cache_ok else 'unavailable'
+
+    if version is not None and cache_ok:
+        if catalog_cache_warm(version):
+            checks['catalog'] = 'ok'
+        else:
+            warm_catalog_in_background()
+            checks['catalog'] = 'warming'
+
+    ready = all(value == 'ok' for value in checks.values()) and 'catalog' in checks
+    return JsonResponse({'status': 'ready' if ready else 'not_ready', 'checks': checks}, status=200 if ready else 503)
+
+
 urlpatterns = [
     path('admin/', admin.site.urls),
     path('healthz/', healthz, name='healthz'),
+    path('readyz/', readyz, name='readyz'),
+    path('metrics/', metrics_view, name='metrics'),
     path('', include('pastpaper.urls')),
     path('accounts/', include('accounts.urls')),
 ]
 
+# 媒体文件在开发和生产环境都经过 serve_media（支持预压缩的 .br / .gz）
+urlpatterns += media_urlpatterns()
 if settings.DEBUG:
-    urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
     urlpatterns += static(settings.STATIC_URL, document_root=settings.STATIC_ROOT)
-else:
-    media_prefix = settings.MEDIA_URL.lstrip('/').rstrip('/')
-    if media_prefix:
-        urlpatterns += [
-            re_path(
-                rf'^{media_prefix}/(?P<path>.*)$',
-                serve,
-                {'document_root': settings.MEDIA_ROOT},
-            )
-        ]
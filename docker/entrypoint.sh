@@ -1,67 +1,37 @@
 #!/bin/sh
 set -eu
 
-APP_DIR="/app"
 DATA_DIR="${DATA_DIR:-/data}"
 SQLITE_PATH="${SQLITE_PATH:-$DATA_DIR/db.sqlite3}"
 MEDIA_ROOT="${MEDIA_ROOT:-$DATA_DIR/media}"
-BUNDLED_MEDIA_ROOT="${BUNDLED_MEDIA_ROOT:-$APP_DIR/media}"
 
 mkdir -p "$DATA_DIR" "$(dirname "$SQLITE_PATH")" "$MEDIA_ROOT"
 
-if [ -d "$BUNDLED_MEDIA_ROOT" ]; then
-  echo "Syncing bundled media into persistent media volume..."
-  cp -an "$BUNDLED_MEDIA_ROOT"/. "$MEDIA_ROOT"/
-fi
+# Shared with other containers on the same volume; files of exited processes are folded by /metrics/
+METRICS_DIR="${METRICS_DIR:-$DATA_DIR/metrics}"
+mkdir -p "$METRICS_DIR"
 
-python manage.py migrate --noinput
-python manage.py collectstatic --noinput
+# Media sync, migrate, collectstatic, cache warm-up, sample data and the superuser all run in
+# one Django process; steps whose inputs are unchanged are skipped
+python manage.py boot
 
-if [ "${DJANGO_LOAD_SAMPLE_DATA:-1}" = "1" ]; then
-  if ! python manage.py shell -c "from pastpaper.models import Subject; raise SystemExit(0 if Subject.objects.exists() else 1)"; then
-    echo "Loading initial sample data..."
-    python populate_data_v2.py
-  fi
+# Precompressing media takes minutes on a fresh volume, so it runs in the background at the
+# lowest priority; until a file has its .br/.gz copies it is served uncompressed
+if [ "${COMPRESS_MEDIA:-1}" = "1" ]; then
+  echo "Starting background media compression..."
+  nice -n 19 python manage.py compress_media --workers 1 &
 fi
 
-if [ -n "${DJANGO_SUPERUSER_USERNAME:-}" ] && [ -n "${DJANGO_SUPERUSER_PASSWORD:-}" ]; then
-  echo "Ensuring Django superuser exists..."
-  python manage.py shell <<'PY'
-import os
-
-from django.contrib.auth import get_user_model
-
-User = get_user_model()
-username = os.environ["DJANGO_SUPERUSER_USERNAME"]
-password = os.environ["DJANGO_SUPERUSER_PASSWORD"]
-email = os.environ.get("DJANGO_SUPERUSER_EMAIL", "")
-
-user, created = User.objects.get_or_create(
-    username=username,
-    defaults={
-        "email": email,
-        "is_staff": True,
-        "is_superuser": True,
-    },
-)
-
-dirty = created
-if email and user.email != email:
-    user.email = email
-    dirty = True
-if not user.is_staff:
-    user.is_staff = True
-    dirty = True
-if not user.is_superuser:
-    user.is_superuser = True
-    dirty = True
-if created or not user.check_password(password):
-    user.set_password(password)
-    dirty = True
+SESSION_PURGE_INTERVAL="${SESSION_PURGE_INTERVAL:-3600}"
+if [ "$SESSION_PURGE_INTERVAL" -gt 0 ] 2>/dev/null; then
+  echo "Starting background expired-session purge every ${SESSION_PURGE_INTERVAL}s..."
+  python manage.py purge_sessions --loop "$SESSION_PURGE_INTERVAL" &
+fi
 
-if dirty:
-    user.save()
-PY
+BACKUP_INTERVAL="${BACKUP_INTERVAL:-0}"
+if [ "$BACKUP_INTERVAL" -gt 0 ] 2>/dev/null; then
+  echo "Starting background database snapshots every ${BACKUP_INTERVAL}s..."
+  python manage.py backup_db --loop "$BACKUP_INTERVAL" &
 fi
 
 exec "$@"
@@ -1,6 +1,13 @@
+import io
+import os
+import pstats
+
 from django import forms
 from django.conf import settings
 from django.contrib import admin
+from django.core.exceptions import PermissionDenied
+from django.http import FileResponse, Http404
+from django.urls import path, reverse
 from django.utils.html import format_html
 
 from .models import (
@@ -11,8 +18,10 @@ from .models import (
     PastPaperTag,
     UserTag,
     HistoryRecord,
+    RequestProfile,
     Setting,
 )
+from .profiling import profile_path
 
 
 class SubjectAdminForm(forms.ModelForm):
@@ -140,3 +149,59 @@ class HistoryRecordAdmin(admin.ModelAdmin):
 class SettingAdmin(admin.ModelAdmin):
     list_display = ['key', 'value', 'description', 'updated_at']
     search_fields = ['key', 'description']
+
+
+@admin.register(RequestProfile)
+class RequestProfileAdmin(admin.ModelAdmin):
+    list_display = ['created_at', 'method', 'path', 'view_name', 'user', 'status', 'duration_ms', 'sql_count',
+                    'trigger', 'get_downloads']
+    list_filter = ['trigger', 'method', 'view_name']
+    search_fields = ['path', 'view_name', 'user__username']
+    ordering = ['-created_at']
+    readonly_fields = ['created_at', 'method', 'path', 'view_name', 'user', 'status', 'duration_ms', 'sql_count',
+                       'trigger', 'get_downloads', 'get_top_functions']
+    exclude = ['stats_file', 'collapsed_file']
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+    def get_urls(self):
+        return [
+            path(
+                '<int:pk>/download/<str:kind>/',
+                self.admin_site.admin_view(self.download_view),
+                name='pastpaper_requestprofile_download',
+            ),
+        ] + super().get_urls()
+
+    def download_view(self, request, pk, kind):
+        """下载 pstats（python -m pstats / snakeviz）或折叠栈（flamegraph.pl / speedscope）文件"""
+        profile = self.get_object(request, pk)
+        if profile is None or kind not in ('stats', 'collapsed'):
+            raise Http404
+        # admin_view 只检查 is_staff；性能剖析文件含请求路径和调用栈，需要查看权限
+        if not self.has_view_permission(request, profile):
+            raise PermissionDenied
+        name = profile.stats_file if kind == 'stats' else profile.collapsed_file
+        if not os.path.exists(profile_path(name)):
+            raise Http404
+        return FileResponse(open(profile_path(name), 'rb'), as_attachment=True, filename=name)
+
+    @admin.display(description="下载")
+    def get_downloads(self, obj):
+        return format_html(
+            '<a href="{}">pstats</a> | <a href="{}">flamegraph</a>',
+            reverse('admin:pastpaper_requestprofile_download', args=[obj.pk, 'stats']),
+            reverse('admin:pastpaper_requestprofile_download', args=[obj.pk, 'collapsed']),
+        )
+
+    @admin.display(description="耗时最多的函数")
+    def get_top_functions(self, obj):
+        if not os.path.exists(profile_path(obj.stats_file)):
+            return "-"
+        output = io.StringIO()
+        pstats.Stats(profile_path(obj.stats_file), stream=output).strip_dirs().sort_stats('cumulative').print_stats(30)
+        return format_html('<pre style="font-size: 12px;">{}</pre>', output.getvalue())
@@ -0,0 +1,317 @@
+"""教师端班级统计：汇总表的增量刷新与读取"""
+import hashlib
+from datetime import datetime, time, timedelta
+
+from django.db import transaction
+from django.db.models import Count, Q, Sum
+from django.db.models.functions import TruncDate
+from django.contrib.auth.models import User
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from .models import (
+    DailyActivity,
+    HistoryRecord,
+    PastPaper,
+    PastPaperStats,
+    PastPaperTag,
+    Question,
+    QuestionStats,
+    Setting,
+    Unit,
+    UnitStats,
+    UserTag,
+)
+from .permissions import TEACHER_GROUP_NAME
+
+
+WATERMARK_KEY = 'analytics.watermark'
+STUDENT_COUNT_KEY = 'analytics.student_count'
+STUDENTS_FINGERPRINT_KEY = 'analytics.students_fingerprint'
+CHUNK_SIZE = 500
+
+
+def student_filter(prefix=''):
+    """只统计启用的学生账号，排除教师、管理员和已停用的账号"""
+    return (
+        Q(**{f'{prefix}is_staff': False, f'{prefix}is_superuser': False, f'{prefix}is_active': True})
+        & ~Q(**{f'{prefix}groups__name': TEACHER_GROUP_NAME})
+    )
+
+
+def _chunks(ids, size=CHUNK_SIZE):
+    chunk = []
+    for value in ids:
+        chunk.append(value)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def students_fingerprint():
+    """
+    参与统计的学生集合的摘要。加入或移出教师组、停用账号、删除用户都不会更新标签的 updated_at，
+    增量刷新看不到；摘要变化时改为全量刷新。
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    ids = User.objects.filter(student_filter()).order_by('id').values_list('id', flat=True).distinct()
+    for user_id in ids.iterator(chunk_size=2000):
+        digest.update(b'%d,' % user_id)
+    return digest.hexdigest()
+
+
+def _get_setting(key):
+    return Setting.objects.filter(key=key).values_list('value', flat=True).first()
+
+
+def get_watermark():
+    value = _get_setting(WATERMARK_KEY)
+    return parse_datetime(value) if value else None
+
+
+def _set_setting(key, value, description):
+    Setting.objects.update_or_create(key=key, defaults={'value': value, 'description': description})
+
+
+def get_student_count():
+    value = _get_setting(STUDENT_COUNT_KEY)
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return 0
+
+
+def _tag_counts(queryset, key):
+    rows = (
+        queryset.filter(student_filter('user__'))
+        .values(key)
+        .annotate(
+            kill_count=Count('id', filter=Q(kill=True)),
+            saved_count=Count('id', filter=Q(saved=True)),
+        )
+    )
+    return {row[key]: row for row in rows}
+
+
+def refresh_question_stats(since=None):
+    """重新统计自 since 以来标签或题目本身有变化的题目；每批单独写入，不长时间占用 SQLite 写锁"""
+    if since is None:
+        question_ids = Question.objects.values_list('id', flat=True)
+    else:
+        question_ids = set(
+            UserTag.objects.filter(updated_at__gt=since).values_list('question_id', flat=True).distinct()
+        )
+        question_ids.update(Question.objects.filter(updated_at__gt=since).values_list('id', flat=True))
+
+    refreshed = 0
+    for chunk in _chunks(question_ids):
+        counts = _tag_counts(UserTag.objects.filter(question_id__in=chunk), 'question_id')
+        rows = []
+        for q in Question.objects.filter(id__in=chunk).values('id', 'subject_id', 'unit_id'):
+            row = counts.get(q['id'], {})
+            rows.append(QuestionStats(
+                question_id=q['id'],
+                subject_id=q['subject_id'],
+                unit_id=q['unit_id'],
+                kill_count=row.get('kill_count', 0),
+                saved_count=row.get('saved_count', 0),
+            ))
+        QuestionStats.objects.bulk_create(
+            rows,
+            update_conflicts=True,
+            unique_fields=['question'],
+            update_fields=['subject', 'unit', 'kill_count', 'saved_count', 'refreshed_at'],
+        )
+        refreshed += len(rows)
+    return refreshed
+
+
+def refresh_unit_stats():
+    """由题目汇总表重新计算单元汇总（单元数量很少，每次全量计算）"""
+    totals = {
+        row['unit_id']: row
+        for row in QuestionStats.objects.filter(unit__isnull=False).values('unit_id').annotate(
+            question_count=Count('question_id'),
+            kill_total=Sum('kill_count'),
+            saved_total=Sum('saved_count'),
+        )
+    }
+    rows = []
+    for unit in Unit.objects.values('id', 'subject_id'):
+        row = totals.get(unit['id'], {})
+        rows.append(UnitStats(
+            unit_id=unit['id'],
+            subject_id=unit['subject_id'],
+            question_count=row.get('question_count', 0),
+            kill_count=row.get('kill_total') or 0,
+            saved_count=row.get('saved_total') or 0,
+        ))
+    UnitStats.objects.bulk_create(
+        rows,
+        update_conflicts=True,
+        unique_fields=['unit'],
+        update_fields=['subject', 'question_count', 'kill_count', 'saved_count', 'refreshed_at'],
+    )
+    return len(rows)
+
+
+def refresh_past_paper_stats(since=None):
+    """重新统计自 since 以来有变化的历年试卷"""
+    if since is None:
+        paper_ids = PastPaper.objects.values_list('id', flat=True)
+    else:
+        paper_ids = set(
+            PastPaperTag.objects.filter(updated_at__gt=since).values_list('past_paper_id', flat=True).distinct()
+        )
+        paper_ids.update(PastPaper.objects.filter(updated_at__gt=since).values_list('id', flat=True))
+
+    refreshed = 0
+    for chunk in _chunks(paper_ids):
+        counts = _tag_counts(PastPaperTag.objects.filter(past_paper_id__in=chunk), 'past_paper_id')
+        rows = []
+        for pp in PastPaper.objects.filter(id__in=chunk).values('id', 'subject_id'):
+            row = counts.get(pp['id'], {})
+            rows.append(PastPaperStats(
+                past_paper_id=pp['id'],
+                subject_id=pp['subject_id'],
+                kill_count=row.get('kill_count', 0),
+                saved_count=row.get('saved_count', 0),
+            ))
+        PastPaperStats.objects.bulk_create(
+            rows,
+            update_conflicts=True,
+            unique_fields=['past_paper'],
+            update_fields=['subject', 'kill_count', 'saved_count', 'refreshed_at'],
+        )
+        refreshed += len(rows)
+    return refreshed
+
+
+def refresh_daily_activity(since=None):
+    """重新汇总 since 当天及之后的浏览记录（按天整体覆盖，保证重复执行结果一致）"""
+    records = HistoryRecord.objects.filter(student_filter('user__'))
+    existing = DailyActivity.objects.all()
+    if since is not None:
+        day = timezone.localdate(since)
+        day_start = timezone.make_aware(datetime.combine(day, time.min), timezone.get_current_timezone())
+        records = records.filter(visited_at__gte=day_start)
+        existing = existing.filter(date__gte=day)
+
+    rows = [
+        DailyActivity(
+            subject_id=row['question__subject_id'],
+            date=row['day'],
+            views=row['views'],
+            active_users=row['active_users'],
+        )
+        for row in records.annotate(day=TruncDate('visited_at')).values('question__subject_id', 'day').annotate(
+            views=Count('id'),
+            active_users=Count('user_id', distinct=True),
+        )
+    ]
+    # 天数 × 学科的行数很少，整段替换放在一个短事务里；已没有浏览记录的天随之删除
+    with transaction.atomic():
+        existing.delete()
+        DailyActivity.objects.bulk_create(rows, batch_size=CHUNK_SIZE)
+    return len(rows)
+
+
+def refresh_summaries(full=False):
+    """
+    刷新全部汇总表；默认只处理上次水位线之后的变化，学生集合变化时自动改为全量刷新。
+    各表分批写入、各自提交，刷新期间教师页面读到的是新旧混合但各行自洽的数据；
+    中途失败时水位线不前移，下次从原位置重做（重复统计是幂等的）。
+    """
+    started_at = timezone.now()
+    fingerprint = students_fingerprint()
+    if not full and _get_setting(STUDENTS_FINGERPRINT_KEY) != fingerprint:
+        full = True
+    since = None if full else get_watermark()
+
+    result = {
+        'questions': refresh_question_stats(since),
+        'units': refresh_unit_stats(),
+        'past_papers': refresh_past_paper_stats(since),
+        'activity_days': refresh_daily_activity(since),
+    }
+    if full:
+        # 全量刷新覆盖了所有现存的题目和试卷，未被覆盖的行属于已不存在的对象
+        QuestionStats.objects.filter(refreshed_at__lt=started_at).delete()
+        PastPaperStats.objects.filter(refreshed_at__lt=started_at).delete()
+
+    student_count = User.objects.filter(student_filter()).distinct().count()
+    with transaction.atomic():
+        _set_setting(STUDENT_COUNT_KEY, str(student_count), '班级统计：学生人数')
+        _set_setting(STUDENTS_FINGERPRINT_KEY, fingerprint, '班级统计：学生集合摘要')
+        # 水位线取开始时间，刷新期间写入的标签下次会再统计一次
+        _set_setting(WATERMARK_KEY, started_at.isoformat(), '班级统计：上次刷新时间')
+
+    result['students'] = student_count
+    result['since'] = since
+    result['full'] = full
+    return result
+
+
+def _rate(done, total):
+    if not total:
+        return 0
+    return round(done * 100 / total, 1)
+
+
+def dashboard_data(subject, days=30, top=10):
+    """读取教师仪表盘所需数据，只访问汇总表"""
+    student_count = get_student_count()
+
+    units = []
+    for stats in UnitStats.objects.filter(subject=subject).select_related('unit').order_by('unit__unit_num'):
+        units.append({
+            'unit_num': stats.unit.unit_num,
+            'name': stats.unit.name,
+            'question_count': stats.question_count,
+            'kill_count': stats.kill_count,
+            'saved_count': stats.saved_count,
+            'completion_rate': _rate(stats.kill_count, stats.question_count * student_count),
+        })
+
+    papers = []
+    for stats in PastPaperStats.objects.filter(subject=subject).select_related('past_paper').order_by(
+        '-past_paper__year', 'past_paper__session', 'past_paper__paper_num'
+    ):
+        papers.append({
+            'code': stats.past_paper.code,
+            'kill_count': stats.kill_count,
+            'saved_count': stats.saved_count,
+            'completion_rate': _rate(stats.kill_count, student_count),
+        })
+
+    struggling = [
+        {
+            'code': stats.question.code,
+            'saved_count': stats.saved_count,
+            'kill_count': stats.kill_count,
+        }
+        for stats in QuestionStats.objects.filter(subject=subject, saved_count__gt=0)
+        .select_related('question')
+        .order_by('-saved_count')[:top]
+    ]
+
+    since_day = timezone.localdate() - timedelta(days=days - 1)
+    activity = list(
+        DailyActivity.objects.filter(subject=subject, date__gte=since_day)
+        .order_by('date')
+        .values('date', 'views', 'active_users')
+    )
+    peak_views = max((row['views'] for row in activity), default=0)
+    for row in activity:
+        row['bar_width'] = _rate(row['views'], peak_views)
+
+    return {
+        'student_count': student_count,
+        'refreshed_at': get_watermark(),
+        'units': units,
+        'papers': papers,
+        'struggling': struggling,
+        'activity': activity,
+    }
@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class PastpaperConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'pastpaper'
+
+    def ready(self):
+        # 注册用户组变更信号，用于角色缓存失效；剖析记录删除时清理文件
+        from . import permissions, profiling  # noqa: F401
@@ -0,0 +1,197 @@
+"""
+JSON 接口的原生异步版本（使用异步 ORM），ASGI 部署时由 urls.py 替换同名的同步视图。
+返回结构与 views.py 完全一致，序列化逻辑共用。
+"""
+from django.contrib.auth.decorators import login_required
+from django.http import JsonResponse
+from django.views.decorators.http import require_POST
+
+from .models import HistoryRecord, PastPaper, PastPaperTag, Question, Subject, Unit, UserTag
+from .pagination import (
+    PAST_PAPER_COUNT_NAME,
+    PAST_PAPER_KEYSET,
+    QUESTION_COUNT_NAME,
+    QUESTION_KEYSET,
+    InvalidPage,
+    acached_count,
+    apaginate,
+    parse_page,
+)
+from .views import (
+    _empty_list,
+    _history_payload,
+    _list_response,
+    _past_papers_columns,
+    _past_papers_payload,
+    _question_list_columns,
+    _question_list_payload,
+    _units_payload,
+    history_is_duplicate,
+    tag_state,
+)
+
+
+@login_required
+@require_POST
+async def get_units(request):
+    """获取指定学科的所有单元列表"""
+    subject = await Subject.objects.filter(code=request.POST.get('subject', 'cs')).afirst()
+    if subject is None:
+        return JsonResponse([], safe=False)
+    units = [unit async for unit in Unit.objects.filter(subject=subject).order_by('unit_num')]
+    return JsonResponse(_units_payload(subject, units), safe=False)
+
+
+@login_required
+@require_POST
+async def get_list(request):
+    """获取指定单元的题目列表；分页参数见 views.get_list"""
+    unit_num = request.POST.get('unit')
+    if not unit_num:
+        return JsonResponse({'error': 'Unit number is required'}, status=400)
+    try:
+        limit, cursor = parse_page(request.POST)
+    except InvalidPage as e:
+        return JsonResponse({'error': str(e)}, status=400)
+
+    user = await request.auser()
+    unit = await Unit.objects.select_related('subject').filter(
+        unit_num=unit_num, subject__code=request.POST.get('subject', 'cs')
+    ).afirst()
+    if unit is None:
+        return _empty_list(request, limit)
+
+    next_cursor = total = None
+    questions = Question.objects.filter(unit=unit).select_related('unit')
+    user_tags = UserTag.objects.filter(user=user)
+    if limit is None:
+        questions = [q async for q in questions.order_by(*QUESTION_KEYSET.ordering)]
+        user_tags = user_tags.filter(question__unit=unit)
+    else:
+        try:
+            questions, next_cursor = await apaginate(questions, QUESTION_KEYSET, limit, cursor)
+        except InvalidPage as e:
+            return JsonResponse({'error': str(e)}, status=400)
+        user_tags = user_tags.filter(question_id__in=[q.id for q in questions])
+    tags = {
+        question_id: (kill, saved)
+        async for question_id, kill, saved in user_tags.values_list('question_id', 'kill', 'saved')
+    }
+    if limit is not None and not cursor:
+        total = await acached_count(QUESTION_COUNT_NAME.format(unit.id), Question.objects.filter(unit=unit))
+    return _list_response(
+        request, limit,
+        lambda: _question_list_payload(unit.subject, questions, tags),
+        lambda: _question_list_columns(unit.subject, questions, tags),
+        next_cursor, total,
+    )
+
+
+@login_required
+@require_POST
+async def get_past_papers(request):
+    """获取指定学科的所有历年试卷"""
+    try:
+        limit, cursor = parse_page(request.POST)
+    except InvalidPage as e:
+        return JsonResponse({'error': str(e)}, status=400)
+
+    user = await request.auser()
+    subject = await Subject.objects.filter(code=request.POST.get('subject', 'cs')).afirst()
+    if subject is None:
+        return _empty_list(request, limit)
+
+    next_cursor = total = None
+    past_papers = PastPaper.objects.filter(subject=subject)
+    paper_tags = PastPaperTag.objects.filter(user=user)
+    if limit is None:
+        past_papers = [pp async for pp in past_papers.order_by(*PAST_PAPER_KEYSET.ordering)]
+        paper_tags = paper_tags.filter(past_paper__subject=subject)
+    else:
+        try:
+            past_papers, next_cursor = await apaginate(past_papers, PAST_PAPER_KEYSET, limit, cursor)
+        except InvalidPage as e:
+            return JsonResponse({'error': str(e)}, status=400)
+        paper_tags = paper_tags.filter(past_paper_id__in=[pp.id for pp in past_papers])
+    tags = {
+        past_paper_id: (kill, saved)
+        async for past_paper_id, kill, saved in paper_tags.values_list('past_paper_id', 'kill', 'saved')
+    }
+    if limit is not None and not cursor:
+        total = await acached_count(PAST_PAPER_COUNT_NAME.format(subject.id), PastPaper.objects.filter(subject=subject))
+    return _list_response(
+        request, limit,
+        lambda: _past_papers_payload(past_papers, tags),
+        lambda: _past_papers_columns(past_papers, tags),
+        next_cursor, total,
+    )
+
+
+@login_required
+@require_POST
+async def get_history(request):
+    """获取用户浏览历史"""
+    user = await request.auser()
+    history = [
+        h async for h in HistoryRecord.objects.filter(user=user).select_related('question').order_by('-visited_at')[:20]
+    ]
+    return JsonResponse(_history_payload(history), safe=False)
+
+
+@login_required
+@require_POST
+async def update_user_tags(request):
+    """更新用户题目或Past Paper标签"""
+    user = await request.auser()
+    item_type = request.POST.get('item_type', 'question')
+    state = tag_state(request.POST.get('kill', '0'), request.POST.get('save', '0'))
+
+    async def apply_tag_state(tag_obj):
+        if state is not None:
+            tag_obj.kill, tag_obj.saved = state
+        await tag_obj.asave()
+        return {'kill': tag_obj.kill, 'saved': tag_obj.saved}
+
+    if item_type == 'past_paper':
+        paper_code = request.POST.get('code')
+        if not paper_code:
+            return JsonResponse({'success': False, 'error': 'Past paper code is required'}, status=400)
+        past_paper = await PastPaper.objects.filter(code=paper_code).afirst()
+        if past_paper is None:
+            return JsonResponse({'success': False, 'error': 'Past paper not found'}, status=404)
+        try:
+            tag, _ = await PastPaperTag.objects.aget_or_create(user=user, past_paper=past_paper)
+            return JsonResponse({'success': True, 'item_type': 'past_paper', 'state': await apply_tag_state(tag)})
+        except Exception as e:
+            return JsonResponse({'success': False, 'error': str(e)}, status=500)
+
+    question_id = request.POST.get('id')
+    if not question_id:
+        return JsonResponse({'success': False, 'error': 'Question ID is required'}, status=400)
+    question = await Question.objects.filter(id=question_id).afirst() if question_id.isdigit() else None
+    if question is None:
+        return JsonResponse({'success': False, 'error': 'Question not found'}, status=404)
+    try:
+        tag, _ = await UserTag.objects.aget_or_create(user=user, question=question)
+        return JsonResponse({'success': True, 'item_type': 'question', 'state': await apply_tag_state(tag)})
+    except Exception as e:
+        return JsonResponse({'success': False, 'error': str(e)}, status=500)
+
+
+@login_required
+@require_POST
+async def update_history(request):
+    """更新用户浏览历史"""
+    code = request.POST.get('code')
+    if not code:
+        return JsonResponse({'success': False, 'error': 'Code is required'}, status=400)
+
+    user = await request.auser()
+    question = await Question.objects.filter(code=code).afirst()
+    if question is None:
+        return JsonResponse({'success': False, 'error': 'Question not found'}, status=404)
+
+    recent_history = await HistoryRecord.objects.filter(user=user, question=question).order_by('-visited_at').afirst()
+    if not history_is_duplicate(recent_history):
+        await HistoryRecord.objects.acreate(user=user, question=question)
+    return JsonResponse({'success': True})
@@ -1,9 +1,24 @@
-from .permissions import has_question_editor_privileges, TEACHER_GROUP_NAME
+from django.utils.functional import SimpleLazyObject
+
+from .permissions import get_user_roles, has_question_editor_privileges, TEACHER_GROUP_NAME
+from .subjects import all_subjects, catalog_cache_version
 
 
 def permissions(request):
     user = getattr(request, 'user', None)
     return {
         'can_create_questions': has_question_editor_privileges(user),
+        'user_roles': get_user_roles(user),
         'teacher_group_name': TEACHER_GROUP_NAME,
     }
+
+
+def catalog(request):
+    """
+    base.html 导航栏片段的缓存键和学科列表。惰性求值：视图已通过 subject_context 提供时不再查询，
+    片段命中缓存时不读取学科列表。
+    """
+    return {
+        'catalog_cache_version': SimpleLazyObject(catalog_cache_version),
+        'all_subjects': SimpleLazyObject(all_subjects),
+    }
@@ -0,0 +1,170 @@
+"""学生学习进度导出（CSV / JSONL 流式输出）"""
+import csv
+import json
+from datetime import datetime, time, timedelta
+
+from django.utils import timezone
+from django.utils.dateparse import parse_date
+
+from .models import HistoryRecord, PastPaperTag, Subject, UserTag
+
+
+CHUNK_SIZE = 2000
+EXPORT_FORMATS = ('csv', 'jsonl')
+
+# 每种导出：查询集、时间字段、输出列（列名 -> values() 字段）
+EXPORT_KINDS = {
+    'tags': {
+        'queryset': lambda: UserTag.objects.all(),
+        'time_field': 'updated_at',
+        'subject_field': 'question__subject__code',
+        'unit_field': 'question__unit__unit_num',
+        'columns': {
+            'username': 'user__username',
+            'subject': 'question__subject__code',
+            'unit': 'question__unit__unit_num',
+            'question': 'question__code',
+            'kill': 'kill',
+            'saved': 'saved',
+            'updated_at': 'updated_at',
+        },
+    },
+    'paper_tags': {
+        'queryset': lambda: PastPaperTag.objects.all(),
+        'time_field': 'updated_at',
+        'subject_field': 'past_paper__subject__code',
+        'unit_field': None,
+        'columns': {
+            'username': 'user__username',
+            'subject': 'past_paper__subject__code',
+            'past_paper': 'past_paper__code',
+            'kill': 'kill',
+            'saved': 'saved',
+            'updated_at': 'updated_at',
+        },
+    },
+    'history': {
+        'queryset': lambda: HistoryRecord.objects.all(),
+        'time_field': 'visited_at',
+        'subject_field': 'question__subject__code',
+        'unit_field': 'question__unit__unit_num',
+        'columns': {
+            'username': 'user__username',
+            'subject': 'question__subject__code',
+            'unit': 'question__unit__unit_num',
+            'question': 'question__code',
+            'visited_at': 'visited_at',
+        },
+    },
+}
+
+
+def _day_start(day):
+    return timezone.make_aware(datetime.combine(day, time.min), timezone.get_current_timezone())
+
+
+def _parse_day(value, name):
+    try:
+        day = parse_date(value)
+    except ValueError:
+        day = None
+    if day is None:
+        raise ValueError(f'{name} must be a date in YYYY-MM-DD format')
+    return day
+
+
+def parse_export_filters(params):
+    """从请求参数或命令行参数中解析筛选条件，参数不合法时抛出 ValueError"""
+    kind = params.get('kind') or 'tags'
+    if kind not in EXPORT_KINDS:
+        raise ValueError(f"kind must be one of: {', '.join(EXPORT_KINDS)}")
+
+    filters = {'kind': kind}
+    if params.get('subject'):
+        # 学科代码会写入导出文件名，只接受数据库中存在的学科
+        subject = Subject.objects.filter(code=params['subject']).values_list('code', flat=True).first()
+        if subject is None:
+            raise ValueError(f"unknown subject: {params['subject']}")
+        filters['subject'] = subject
+    if params.get('group'):
+        filters['group'] = params['group']
+    if params.get('unit'):
+        if EXPORT_KINDS[kind]['unit_field'] is None:
+            raise ValueError(f'unit filter is not supported for {kind}')
+        try:
+            filters['unit'] = int(params['unit'])
+        except (TypeError, ValueError):
+            raise ValueError('unit must be an integer')
+    if params.get('date_from'):
+        filters['date_from'] = _parse_day(params['date_from'], 'date_from')
+    if params.get('date_to'):
+        filters['date_to'] = _parse_day(params['date_to'], 'date_to')
+    return filters
+
+
+def export_queryset(filters):
+    """根据筛选条件构造只取所需列的查询集"""
+    spec = EXPORT_KINDS[filters['kind']]
+    queryset = spec['queryset']()
+    time_field = spec['time_field']
+
+    if 'subject' in filters:
+        queryset = queryset.filter(**{spec['subject_field']: filters['subject']})
+    if 'unit' in filters:
+        queryset = queryset.filter(**{spec['unit_field']: filters['unit']})
+    if 'group' in filters:
+        queryset = queryset.filter(user__groups__name=filters['group'])
+    # 使用时间范围而不是 __date 查询，保证能用上时间字段索引
+    if 'date_from' in filters:
+        queryset = queryset.filter(**{f'{time_field}__gte': _day_start(filters['date_from'])})
+    if 'date_to' in filters:
+        queryset = queryset.filter(**{f'{time_field}__lt': _day_start(filters['date_to'] + timedelta(days=1))})
+
+    return queryset.order_by('id').values_list(*spec['columns'].values())
+
+
+def iter_export_rows(filters, chunk_size=CHUNK_SIZE):
+    """逐行产出字典 —— 使用服务端游标分块读取，内存占用与总行数无关"""
+    columns = list(EXPORT_KINDS[filters['kind']]['columns'])
+    for row in export_queryset(filters).iterator(chunk_size=chunk_size):
+        yield dict(zip(columns, row))
+
+
+class _Echo:
+    """csv.writer 需要的伪文件对象，write 直接返回内容"""
+
+    def write(self, value):
+        return value
+
+
+def _format_value(value):
+    if isinstance(value, datetime):
+        return timezone.localtime(value).isoformat()
+    return value
+
+
+def stream_export(filters, fmt='csv', chunk_size=CHUNK_SIZE):
+    """生成导出文件内容（逐行字符串），可直接交给 StreamingHttpResponse"""
+    columns = list(EXPORT_KINDS[filters['kind']]['columns'])
+    rows = iter_export_rows(filters, chunk_size=chunk_size)
+    if fmt == 'jsonl':
+        for row in rows:
+            yield json.dumps({key: _format_value(value) for key, value in row.items()}, ensure_ascii=False) + '\n'
+        return
+
+    writer = csv.writer(_Echo())
+    # BOM让Excel正确识别UTF-8（中文用户名）
+    yield '\ufeff' + writer.writerow(columns)
+    for row in rows:
+        yield writer.writerow([_format_value(row[column]) for column in columns])
+
+
+def export_filename(filters, fmt):
+    stamp = timezone.localtime().strftime('%Y%m%d-%H%M')
+    parts = ['progress', filters['kind']]
+    if 'subject' in filters:
+        parts.append(filters['subject'])
+    if 'unit' in filters:
+        parts.append(f"unit{filters['unit']}")
+    parts.append(stamp)
+    return f"{'-'.join(parts)}.{fmt}"
@@ -0,0 +1,56 @@
+"""backup_db / restore_db 共用的快照工具（以下划线开头，Django 不会把它当作命令）"""
+import gzip
+import os
+import shutil
+import sqlite3
+
+from django.conf import settings
+
+SNAPSHOT_PREFIX = 'db-'
+SNAPSHOT_SUFFIX = '.sqlite3.gz'
+
+
+def snapshot_name(moment):
+    return f"{SNAPSHOT_PREFIX}{moment.strftime('%Y%m%d-%H%M%S')}{SNAPSHOT_SUFFIX}"
+
+
+def list_snapshots(directory=None):
+    """按时间从新到旧排列的快照路径（文件名中的时间戳可直接按字符串排序）"""
+    directory = str(directory or settings.BACKUP_DIR)
+    try:
+        names = os.listdir(directory)
+    except FileNotFoundError:
+        return []
+    names = [name for name in names if name.startswith(SNAPSHOT_PREFIX) and name.endswith(SNAPSHOT_SUFFIX)]
+    return [os.path.join(directory, name) for name in sorted(names, reverse=True)]
+
+
+def integrity_errors(path):
+    """PRAGMA integrity_check 的结果；完好时为空列表"""
+    conn = sqlite3.connect(path)
+    try:
+        rows = [row[0] for row in conn.execute('PRAGMA integrity_check')]
+    except sqlite3.DatabaseError as exc:
+        return [str(exc)]
+    finally:
+        conn.close()
+    return [] if rows == ['ok'] else rows
+
+
+def gzip_file(source, target):
+    tmp = f'{target}.tmp'
+    with open(source, 'rb') as src, gzip.open(tmp, 'wb', compresslevel=6) as dst:
+        shutil.copyfileobj(src, dst, 1 << 20)
+    os.replace(tmp, target)
+
+
+def gunzip_file(source, target):
+    with gzip.open(source, 'rb') as src, open(target, 'wb') as dst:
+        shutil.copyfileobj(src, dst, 1 << 20)
+
+
+def remove_quietly(path):
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
@@ -0,0 +1,107 @@
+import os
+import sqlite3
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from ._snapshots import gzip_file, integrity_errors, list_snapshots, remove_quietly, snapshot_name
+
+
+class _Restarted(Exception):
+    """复制期间其他连接写入次数过多，本轮放弃，用更大的步长重试"""
+
+
+class Command(BaseCommand):
+    help = (
+        '用 SQLite 在线备份接口分步复制数据库，步与步之间让出锁，不阻塞正常写入；'
+        '快照经 integrity_check 校验后压缩保存到 BACKUP_DIR，并只保留最近的若干份'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--pages', type=int, default=256, help='每步复制的页数（默认页大小 4 KB，即每步约 1 MB）')
+        parser.add_argument('--pause', type=float, default=0.02, help='两步之间暂停的秒数，让出读锁给写入')
+        parser.add_argument(
+            '--max-restarts', type=int, default=3,
+            help='复制过程中源库被写入会导致从头开始；超过该次数后以 4 倍步长重试，最终一步复制完',
+        )
+        parser.add_argument('--keep', type=int, default=settings.BACKUP_KEEP, help='保留的快照份数')
+        parser.add_argument('--output-dir', default=str(settings.BACKUP_DIR), help='快照目录')
+        parser.add_argument('--loop', type=int, default=0, help='每隔N秒重复执行（0表示只执行一次）')
+
+    def copy_database(self, target, pages, pause, max_restarts):
+        """返回 (复制步数, 重新开始次数, 最后一轮的每步页数，-1 表示一步复制整库)"""
+        steps = restarts = 0
+        while True:
+            attempt = {'remaining': None, 'restarts': 0}
+
+            def progress(status, remaining, total):
+                nonlocal steps, restarts
+                steps += 1
+                if status == sqlite3.SQLITE_OK and attempt['remaining'] is not None and remaining >= attempt['remaining']:
+                    # 其他连接写入了源库，这一步从头开始复制，剩余页数没有减少
+                    restarts += 1
+                    attempt['restarts'] += 1
+                    if pages > 0 and attempt['restarts'] > max_restarts:
+                        raise _Restarted
+                attempt['remaining'] = remaining
+                if status == sqlite3.SQLITE_OK and remaining and pause:
+                    time.sleep(pause)
+
+            remove_quietly(target)
+            source = sqlite3.connect(settings.DATABASES['default']['NAME'], timeout=30)
+            destination = sqlite3.connect(target)
+            try:
+                # 源库正被写入（SQLITE_BUSY）时等待 pause 秒后重试这一步
+                source.backup(destination, pages=pages, progress=progress, sleep=pause)
+                return steps, restarts, pages
+            except _Restarted:
+                # 步数越少，被写入打断的机会越少；最后一次整库一步复制，期间写入需要等待
+                total = source.execute('PRAGMA page_count').fetchone()[0]
+                pages = pages * 4 if pages * 4 < total else -1
+            finally:
+                destination.close()
+                source.close()
+
+    def backup_once(self, options):
+        directory = options['output_dir']
+        os.makedirs(directory, exist_ok=True)
+        name = snapshot_name(timezone.now())
+        raw = os.path.join(directory, f'{name}.raw.tmp')
+        started = time.perf_counter()
+        try:
+            steps, restarts, pages = self.copy_database(raw, options['pages'], options['pause'], options['max_restarts'])
+            errors = integrity_errors(raw)
+            if errors:
+                raise CommandError(f"Snapshot failed integrity_check: {'; '.join(errors[:5])}")
+            size = os.path.getsize(raw)
+            target = os.path.join(directory, name)
+            gzip_file(raw, target)
+        except (sqlite3.Error, OSError) as exc:
+            raise CommandError(f'Backup failed: {exc}')
+        finally:
+            remove_quietly(raw)
+
+        removed = 0
+        for path in list_snapshots(directory)[max(1, options['keep']):]:
+            remove_quietly(path)
+            removed += 1
+        self.stdout.write(self.style.SUCCESS(
+            f'Snapshot {target}: {size} -> {os.path.getsize(target)} bytes in {time.perf_counter() - started:.1f}s '
+            f"({steps} steps of {pages if pages > 0 else 'all'} pages, {restarts} restarts), "
+            f'integrity ok, {removed} old snapshots removed.'
+        ))
+
+    def handle(self, *args, **options):
+        while True:
+            try:
+                self.backup_once(options)
+            except CommandError as exc:
+                if options['loop'] <= 0:
+                    raise
+                # 常驻时一次失败不退出，下一轮再试
+                self.stderr.write(str(exc))
+            if options['loop'] <= 0:
+                break
+            time.sleep(options['loop'])
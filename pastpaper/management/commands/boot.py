@@ -0,0 +1,282 @@
+import hashlib
+import io
+import json
+import os
+import runpy
+import shutil
+import time
+
+from django.apps import apps
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.staticfiles.finders import get_finders
+from django.core.management import call_command
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.utils.crypto import salted_hmac
+
+from pastpaper.models import Subject
+from pastpaper.subjects import bump_cache_generation
+from pastpaper.warmup import warm_catalog
+
+# 各步骤上次完成时的指纹；迁移和缓存状态跟随数据卷
+STATE_NAME = 'boot_state.json'
+# 上次同步到 MEDIA_ROOT 的打包媒体清单
+SYNCED_MEDIA_NAME = 'bundled_media_synced.json'
+# 构建镜像时预先生成的打包媒体清单（boot --prepare），启动时不需要遍历和哈希打包目录
+BUNDLE_MANIFEST_NAME = '.bundle-manifest.json'
+# collectstatic 完成时写入 STATIC_ROOT；STATIC_ROOT 在镜像内，不在数据卷上
+STATIC_FINGERPRINT_NAME = '.boot-fingerprint'
+
+
+def _file_digest(path):
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, 'rb') as fh:
+        for chunk in iter(lambda: fh.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _fingerprint(items):
+    """items 为可 JSON 序列化的对象，顺序固定"""
+    return hashlib.blake2b(json.dumps(items, sort_keys=True).encode(), digest_size=16).hexdigest()
+
+
+def _tree(root, skip=()):
+    """root 下所有文件的 {相对路径: [大小, 内容摘要]}"""
+    entries = {}
+    for directory, dirs, names in os.walk(root):
+        dirs[:] = [name for name in dirs if name != '__pycache__']
+        for name in names:
+            if name in skip or name.endswith('.pyc'):
+                continue
+            path = os.path.join(directory, name)
+            entries[os.path.relpath(path, root)] = [os.path.getsize(path), _file_digest(path)]
+    return entries
+
+
+def _read_json(path, default):
+    try:
+        with open(path, encoding='utf-8') as fh:
+            return json.load(fh)
+    except (OSError, ValueError):
+        return default
+
+
+def _write_json(path, data):
+    tmp = f'{path}.tmp'
+    with open(tmp, 'w', encoding='utf-8') as fh:
+        json.dump(data, fh)
+    os.replace(tmp, path)
+
+
+def bundled_media_root():
+    return os.environ.get('BUNDLED_MEDIA_ROOT', str(settings.BASE_DIR / 'media'))
+
+
+class Command(BaseCommand):
+    help = (
+        '容器启动流程（一个进程内完成）：同步打包媒体、迁移、collectstatic、示例数据、'
+        '缓存预热、清理过期的题库变更日志和管理员账号；输入指纹未变化的步骤直接跳过。'
+        '媒体预压缩耗时较长，由 entrypoint 在后台运行 compress_media'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--prepare', action='store_true',
+            help='构建镜像时使用：生成打包媒体清单并执行 collectstatic，启动时即可跳过这两步',
+        )
+        parser.add_argument('--force', action='store_true', help='忽略指纹，所有步骤都重新执行')
+
+    def handle(self, *args, **options):
+        self.force = options['force']
+        self.state_path = os.path.join(settings.DATA_DIR, STATE_NAME)
+        self.state = _read_json(self.state_path, {})
+        self.static_fingerprint_value = None
+        started = time.perf_counter()
+
+        if options['prepare']:
+            self.step('bundled media manifest', self.write_bundle_manifest)
+            self.step('collectstatic', self.collectstatic)
+            return
+
+        self.step('bundled media', self.sync_bundled_media)
+        self.step('migrate', self.migrate)
+        self.step('collectstatic', self.collectstatic)
+        if os.environ.get('DJANGO_LOAD_SAMPLE_DATA', '1') == '1':
+            self.step('sample data', self.load_sample_data)
+        self.step('caches', self.warm_caches)
+        self.step('catalog changes', self.prune_catalog_changes)
+        self.step('superuser', self.ensure_superuser)
+
+        self.stdout.write(self.style.SUCCESS(f'Boot finished in {time.perf_counter() - started:.1f}s.'))
+
+    def step(self, name, func):
+        started = time.perf_counter()
+        result = func()
+        self.stdout.write(f'{name}: {result} ({(time.perf_counter() - started) * 1000:.0f} ms)')
+
+    def save_state(self, **values):
+        self.state.update(values)
+        _write_json(self.state_path, self.state)
+
+    # 打包媒体：按清单差异只复制新增或修改过的文件
+
+    def bundle_manifest(self, root):
+        manifest = _read_json(os.path.join(root, BUNDLE_MANIFEST_NAME), None)
+        if manifest is None:
+            manifest = _tree(root, skip={BUNDLE_MANIFEST_NAME})
+        return manifest
+
+    def write_bundle_manifest(self):
+        root = bundled_media_root()
+        if not os.path.isdir(root):
+            return 'no bundled media'
+        manifest = _tree(root, skip={BUNDLE_MANIFEST_NAME})
+        _write_json(os.path.join(root, BUNDLE_MANIFEST_NAME), manifest)
+        return f'{len(manifest)} files'
+
+    def sync_bundled_media(self):
+        root = bundled_media_root()
+        if not os.path.isdir(root):
+            return 'no bundled media'
+        manifest = self.bundle_manifest(root)
+        fingerprint = _fingerprint(manifest)
+        if not self.force and self.state.get('bundled_media') == fingerprint:
+            return 'unchanged, skipped'
+
+        synced_path = os.path.join(settings.DATA_DIR, SYNCED_MEDIA_NAME)
+        synced = _read_json(synced_path, {})
+        copied = 0
+        for relpath, entry in manifest.items():
+            if synced.get(relpath) == entry:
+                # 上次已同步且打包版本未变；之后在 MEDIA_ROOT 中被替换或删除的文件保持原样
+                continue
+            target = os.path.join(settings.MEDIA_ROOT, relpath)
+            if os.path.exists(target) and relpath not in synced:
+                # 不是由打包媒体同步来的同名文件，不覆盖（与 cp -n 相同）
+                continue
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            tmp = f'{target}.tmp'
+            shutil.copy2(os.path.join(root, relpath), tmp)
+            os.replace(tmp, target)
+            copied += 1
+        _write_json(synced_path, manifest)
+        self.save_state(bundled_media=fingerprint)
+        return f'{copied} of {len(manifest)} files copied'
+
+    # 迁移：迁移文件和 Django 版本都没变、且数据库中的迁移记录数与上次一致时跳过
+
+    def migration_fingerprint(self):
+        import django
+
+        files = {}
+        for app_config in apps.get_app_configs():
+            directory = os.path.join(app_config.path, 'migrations')
+            if os.path.isdir(directory):
+                files[app_config.label] = _tree(directory)
+        return _fingerprint([django.get_version(), files])
+
+    def applied_migrations(self):
+        if 'django_migrations' not in connection.introspection.table_names():
+            return 0
+        with connection.cursor() as cursor:
+            cursor.execute('SELECT COUNT(*) FROM django_migrations')
+            return cursor.fetchone()[0]
+
+    def migrate(self):
+        fingerprint = self.migration_fingerprint()
+        applied = self.applied_migrations()
+        if not self.force and self.state.get('migrations') == [fingerprint, applied]:
+            return 'unchanged, skipped'
+        call_command('migrate', interactive=False, verbosity=0)
+        self.save_state(migrations=[fingerprint, self.applied_migrations()])
+        return 'applied'
+
+    # collectstatic：静态源文件和存储配置都没变、且 manifest 存在时跳过
+
+    def static_fingerprint(self):
+        files = {}
+        for finder in get_finders():
+            for path, storage in finder.list(['CVS', '.*', '*~']):
+                files[path] = _file_digest(storage.path(path))
+        return _fingerprint([settings.STORAGES['staticfiles'], settings.STATIC_URL, files])
+
+    def collectstatic(self):
+        fingerprint = self.static_fingerprint()
+        fingerprint_path = os.path.join(settings.STATIC_ROOT, STATIC_FINGERPRINT_NAME)
+        manifest_exists = os.path.exists(os.path.join(settings.STATIC_ROOT, 'staticfiles.json'))
+        if not self.force and manifest_exists and _read_json(fingerprint_path, None) == fingerprint:
+            self.static_fingerprint_value = fingerprint
+            return 'unchanged, skipped'
+        call_command('collectstatic', interactive=False, verbosity=0)
+        _write_json(fingerprint_path, fingerprint)
+        self.static_fingerprint_value = fingerprint
+        return 'collected'
+
+    # 缓存：模板或静态文件变化（新版本）时换用新的缓存代数，旧模板渲染的页面片段不再命中；
+    # 不清空整个缓存，cache / cached_db 会话保持登录
+
+    def warm_caches(self):
+        templates = {}
+        for directory in settings.TEMPLATES[0]['DIRS']:
+            templates[str(directory)] = _tree(directory)
+        for app_config in apps.get_app_configs():
+            directory = os.path.join(app_config.path, 'templates')
+            if os.path.isdir(directory):
+                templates[app_config.label] = _tree(directory)
+        release = _fingerprint([templates, self.static_fingerprint_value])
+        invalidated = self.force or self.state.get('release') != release
+        if invalidated:
+            bump_cache_generation()
+        stats = warm_catalog()
+        self.save_state(release=release)
+        return f"{'invalidated, ' if invalidated else ''}warmed {stats['subjects']} subjects, {stats['units']} units"
+
+    def prune_catalog_changes(self):
+        output = io.StringIO()
+        call_command('prune_catalog_changes', stdout=output)
+        return output.getvalue().strip()
+
+    def load_sample_data(self):
+        if Subject.objects.exists():
+            return 'present, skipped'
+        runpy.run_path(str(settings.BASE_DIR / 'populate_data_v2.py'), run_name='__main__')
+        return 'loaded'
+
+    def ensure_superuser(self):
+        username = os.environ.get('DJANGO_SUPERUSER_USERNAME', '')
+        password = os.environ.get('DJANGO_SUPERUSER_PASSWORD', '')
+        if not username or not password:
+            return 'not configured'
+        email = os.environ.get('DJANGO_SUPERUSER_EMAIL', '')
+
+        User = get_user_model()
+        # 密码校验要做一次完整的密码哈希；配置未变且账号仍是超级管理员时跳过（指纹用 SECRET_KEY 加密，不保存密码摘要）
+        fingerprint = salted_hmac('boot.superuser', f'{username}\0{email}\0{password}').hexdigest()
+        if (
+            not self.force and self.state.get('superuser') == fingerprint
+            and User.objects.filter(username=username, is_staff=True, is_superuser=True).exists()
+        ):
+            return 'unchanged, skipped'
+        user, created = User.objects.get_or_create(
+            username=username,
+            defaults={'email': email, 'is_staff': True, 'is_superuser': True},
+        )
+        dirty = created
+        if email and user.email != email:
+            user.email = email
+            dirty = True
+        if not user.is_staff:
+            user.is_staff = True
+            dirty = True
+        if not user.is_superuser:
+            user.is_superuser = True
+            dirty = True
+        if created or not user.check_password(password):
+            user.set_password(password)
+            dirty = True
+        if dirty:
+            user.save()
+        self.save_state(superuser=fingerprint)
+        return 'created' if created else ('updated' if dirty else 'unchanged')
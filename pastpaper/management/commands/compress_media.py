@@ -0,0 +1,148 @@
+import json
+import os
+
+try:
+    import fcntl
+except ImportError:  # Windows 开发环境：不做跨进程加锁
+    fcntl = None
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from config.compression import MIN_RATIO, compress_bytes, is_compressible, precompressed_paths
+from config.pool import process_pool
+
+# 小文件压缩收益不足以抵消额外的文件和判断
+MIN_FILE_SIZE = 1024
+
+# 记录每个文件上次处理时的 (mtime, 大小, 保留的编码)，包括不值得压缩的文件，避免每次启动重复压缩；
+# 放在 DATA_DIR 而不是 MEDIA_ROOT，不会被 /media/ 访问到
+MANIFEST_NAME = 'compress_media.json'
+# 同一数据卷上同时只运行一个压缩进程（容器启动时在后台运行，也可能被手动执行）
+LOCK_NAME = 'compress_media.lock'
+
+
+def _compress(path):
+    """写入 .br / .gz；返回 (原始字节数, {编码: 压缩后字节数}, 错误)"""
+    try:
+        with open(path, 'rb') as fh:
+            data = fh.read()
+        kept = {}
+        for encoding, target in precompressed_paths(path):
+            compressed = compress_bytes(data, encoding, offline=True)
+            if len(compressed) > len(data) * MIN_RATIO:
+                # 压缩无效（如内容已压缩的 PDF），请求时直接返回原文件
+                if os.path.exists(target):
+                    os.remove(target)
+                continue
+            tmp = f'{target}.tmp'
+            with open(tmp, 'wb') as fh:
+                fh.write(compressed)
+            os.replace(tmp, target)
+            kept[encoding] = len(compressed)
+        return len(data), kept, None
+    except OSError as exc:
+        return 0, {}, str(exc)
+
+
+class Command(BaseCommand):
+    help = '为 MEDIA_ROOT 中的文件生成 .br / .gz 预压缩版本（只处理新增或修改过的文件）'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help='压缩进程数')
+        parser.add_argument('--force', action='store_true', help='文件未修改时也重新压缩')
+
+    def handle(self, *args, **options):
+        if fcntl is None:
+            self.compress(options)
+            return
+        with open(os.path.join(settings.DATA_DIR, LOCK_NAME), 'a') as lock:
+            try:
+                fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                self.stdout.write('Another compress_media run is in progress, skipped.')
+                return
+            try:
+                self.compress(options)
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+    def compress(self, options):
+        root = str(settings.MEDIA_ROOT)
+        manifest_path = os.path.join(settings.DATA_DIR, MANIFEST_NAME)
+        try:
+            with open(manifest_path, encoding='utf-8') as fh:
+                manifest = json.load(fh)
+        except (OSError, ValueError):
+            manifest = {}
+
+        suffixes = tuple(suffix for _, suffix in precompressed_paths(''))
+        current, jobs = {}, []
+        for directory, _, names in os.walk(root):
+            for name in names:
+                path = os.path.join(directory, name)
+                relpath = os.path.relpath(path, root)
+                if name.endswith(suffixes):
+                    # 压缩版本不单独处理；本身就是 .gz 的上传文件（如 notes.tar.gz）也不压缩
+                    continue
+                if name.endswith('.tmp') or not is_compressible(name):
+                    continue
+                stat = os.stat(path)
+                if stat.st_size < MIN_FILE_SIZE:
+                    continue
+                previous = manifest.get(relpath)
+                if (
+                    not options['force'] and previous
+                    and previous[:2] == [stat.st_mtime_ns, stat.st_size]
+                    and all(os.path.exists(target) for encoding, target in precompressed_paths(path)
+                            if encoding in previous[2])
+                ):
+                    current[relpath] = previous
+                    continue
+                current[relpath] = [stat.st_mtime_ns, stat.st_size, []]
+                jobs.append(relpath)
+
+        unchanged = len(current) - len(jobs)
+        removed = 0
+        # 只删除本命令生成过、且原文件已删除（或不再需要压缩）的版本，MEDIA_ROOT 中其他 .br / .gz 文件保持原样
+        for relpath, previous in manifest.items():
+            if relpath in current:
+                continue
+            for encoding, target in precompressed_paths(os.path.join(root, relpath)):
+                if encoding in previous[2] and os.path.exists(target):
+                    os.remove(target)
+                    removed += 1
+
+        paths = [os.path.join(root, relpath) for relpath in jobs]
+        if options['workers'] > 1 and len(paths) > 1:
+            with process_pool(options['workers']) as pool:
+                outcomes = list(pool.map(_compress, paths))
+        else:
+            outcomes = [_compress(path) for path in paths]
+
+        original = compressed = failed = 0
+        for relpath, (size, kept, error) in zip(jobs, outcomes):
+            if error:
+                failed += 1
+                # 保留上次的记录，下次仍能识别并清理之前生成的版本
+                if relpath in manifest:
+                    current[relpath] = manifest[relpath]
+                else:
+                    del current[relpath]
+                self.stderr.write(f'{relpath}: {error}')
+                continue
+            current[relpath][2] = sorted(kept)
+            original += size
+            compressed += min(kept.values(), default=size)
+            if options['verbosity'] > 1:
+                self.stdout.write(f'{relpath}: {size} -> {kept or "not compressible"}')
+
+        tmp = f'{manifest_path}.tmp'
+        with open(tmp, 'w', encoding='utf-8') as fh:
+            json.dump(current, fh)
+        os.replace(tmp, manifest_path)
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Compressed {len(jobs) - failed} files ({original} -> {compressed} bytes with the best encoding), '
+            f'{unchanged} unchanged, {failed} failed, {removed} orphaned variants removed.'
+        ))
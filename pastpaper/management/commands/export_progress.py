@@ -0,0 +1,34 @@
+import sys
+
+from django.core.management.base import BaseCommand, CommandError
+
+from pastpaper.exports import EXPORT_FORMATS, EXPORT_KINDS, parse_export_filters, stream_export
+
+
+class Command(BaseCommand):
+    help = '流式导出学生学习进度（CSV / JSONL），内存占用不随行数增长'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--kind', choices=list(EXPORT_KINDS), default='tags', help='导出内容')
+        parser.add_argument('--format', choices=EXPORT_FORMATS, default='csv', help='输出格式')
+        parser.add_argument('--subject', help='学科代码，例如 cs')
+        parser.add_argument('--unit', help='单元编号')
+        parser.add_argument('--group', help='用户组名称（班级）')
+        parser.add_argument('--date-from', help='开始日期 YYYY-MM-DD（含）')
+        parser.add_argument('--date-to', help='结束日期 YYYY-MM-DD（含）')
+        parser.add_argument('--output', '-o', help='输出文件路径，默认输出到标准输出')
+        parser.add_argument('--chunk-size', type=int, default=2000, help='每次从数据库读取的行数')
+
+    def handle(self, *args, **options):
+        try:
+            filters = parse_export_filters(options)
+        except ValueError as exc:
+            raise CommandError(str(exc))
+
+        chunks = stream_export(filters, options['format'], chunk_size=options['chunk_size'])
+        if options['output']:
+            with open(options['output'], 'w', encoding='utf-8', newline='') as fh:
+                fh.writelines(chunks)
+            self.stderr.write(self.style.SUCCESS(f"Exported to {options['output']}"))
+        else:
+            sys.stdout.writelines(chunks)
@@ -0,0 +1,222 @@
+import random
+import time
+from contextlib import contextmanager
+from datetime import timedelta
+
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.utils import timezone
+
+from accounts.models import UserProfile
+from pastpaper.models import (
+    CATALOG_MODELS,
+    CatalogChange,
+    HistoryRecord,
+    PastPaper,
+    PastPaperTag,
+    Question,
+    Subject,
+    Unit,
+    UserTag,
+)
+
+SESSIONS = ('s', 'w', 'm')
+LOAD_PASSWORD = 'load-test-password'
+
+
+@contextmanager
+def explicit_timestamps(*models):
+    """临时关闭 auto_now / auto_now_add，让 bulk_create 写入生成的时间而不是当前时间"""
+    saved = []
+    for model in models:
+        for field in model._meta.concrete_fields:
+            if getattr(field, 'auto_now', False) or getattr(field, 'auto_now_add', False):
+                saved.append((field, field.auto_now, field.auto_now_add))
+                field.auto_now = field.auto_now_add = False
+    try:
+        yield
+    finally:
+        for field, auto_now, auto_now_add in saved:
+            field.auto_now, field.auto_now_add = auto_now, auto_now_add
+
+
+class Command(BaseCommand):
+    help = '生成用于压力测试的大规模模拟数据（固定随机种子，可重复生成）；请在单独的 DATA_DIR 中运行'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--subjects', type=int, default=3, help='学科数')
+        parser.add_argument('--units', type=int, default=20, help='每个学科的单元数')
+        parser.add_argument('--years', type=int, default=10, help='每个学科的试卷年份数')
+        parser.add_argument('--papers-per-year', type=int, default=6, help='每年的试卷数（分布在各考试季）')
+        parser.add_argument('--questions-per-paper', type=int, default=10, help='每份试卷的题目数')
+        parser.add_argument('--users', type=int, default=1000, help='学生账号数')
+        parser.add_argument('--tags-per-user', type=int, default=200, help='每个学生的题目标签数')
+        parser.add_argument('--paper-tags-per-user', type=int, default=10, help='每个学生的试卷标签数')
+        parser.add_argument('--history-per-user', type=int, default=500, help='每个学生的浏览记录数')
+        parser.add_argument('--days', type=int, default=180, help='标签和浏览记录分布的天数')
+        parser.add_argument('--seed', type=int, default=42, help='随机种子')
+        parser.add_argument('--prefix', default='load', help='生成的学科代码和用户名前缀')
+        parser.add_argument('--batch-size', type=int, default=5000, help='每条 INSERT 语句写入的行数')
+
+    def handle(self, *args, **options):
+        self.rng = random.Random(options['seed'])
+        self.batch_size = options['batch_size']
+        self.now = timezone.now().replace(microsecond=0)
+        self.days = max(1, options['days'])
+        prefix = options['prefix']
+
+        if Subject.objects.filter(code__startswith=prefix).exists() or \
+                User.objects.filter(username__startswith=prefix).exists():
+            raise CommandError(f"Data with prefix '{prefix}' already exists; use another --prefix or a fresh DATA_DIR")
+        if options['subjects'] > 1000:
+            raise CommandError('At most 1000 subjects (exam codes are four digits)')
+
+        started = time.monotonic()
+        subjects = self.create_catalog(prefix, options)
+        users = self.create_users(prefix, options['users'])
+        counts = self.create_activity(subjects, users, options)
+        elapsed = time.monotonic() - started
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Generated in {elapsed:.1f}s: {len(subjects)} subjects, {counts['units']} units, "
+            f"{counts['past_papers']} past papers, {counts['questions']} questions, {len(users)} users, "
+            f"{counts['tags']} question tags, {counts['paper_tags']} paper tags, {counts['history']} history rows."
+        ))
+        self.stdout.write('Run `manage.py refresh_class_analytics --full` to rebuild the teacher summaries.')
+
+    def random_time(self):
+        return self.now - timedelta(seconds=self.rng.randrange(self.days * 86400))
+
+    @transaction.atomic
+    def create_catalog(self, prefix, options):
+        Subject.objects.bulk_create([
+            Subject(code=f'{prefix}{i}', name=f'Load Subject {i}', exam_code=str(8000 + i))
+            for i in range(options['subjects'])
+        ])
+        subjects = list(Subject.objects.filter(code__startswith=prefix).order_by('id'))
+
+        Unit.objects.bulk_create(
+            [
+                Unit(subject=subject, unit_num=num, name=f'Unit {num}', syllabus_page=num)
+                for subject in subjects for num in range(1, options['units'] + 1)
+            ],
+            batch_size=self.batch_size,
+        )
+        units = {}
+        for unit_id, subject_id in Unit.objects.filter(subject__in=subjects).values_list('id', 'subject_id'):
+            units.setdefault(subject_id, []).append(unit_id)
+
+        papers = []
+        first_year = self.now.year - options['years']
+        for subject in subjects:
+            for year in range(first_year, self.now.year):
+                for n in range(options['papers_per_year']):
+                    session = SESSIONS[n % len(SESSIONS)]
+                    paper_num = f'{n // len(SESSIONS) + 1}{n % 3 + 1}'
+                    papers.append(PastPaper(
+                        subject=subject,
+                        code=f'{subject.exam_code}_{session}{year % 100:02d}_{paper_num}',
+                        year=year,
+                        session=session,
+                        paper_num=paper_num,
+                    ))
+        PastPaper.objects.bulk_create(papers, batch_size=self.batch_size, ignore_conflicts=True)
+
+        questions = []
+        for paper in papers:
+            created = self.now - timedelta(days=(self.now.year - paper.year) * 365, seconds=self.rng.randrange(86400))
+            for q in range(1, options['questions_per_paper'] + 1):
+                questions.append(Question(
+                    code=f'{paper.code}-Q{q}',
+                    subject=paper.subject,
+                    unit_id=self.rng.choice(units[paper.subject_id]) if units.get(paper.subject_id) else None,
+                    qpage=q * 2,
+                    apage=q,
+                    created_at=created + timedelta(seconds=q),
+                    updated_at=created + timedelta(seconds=q),
+                ))
+        with explicit_timestamps(Question):
+            Question.objects.bulk_create(questions, batch_size=self.batch_size, ignore_conflicts=True)
+
+        # bulk_create 不触发信号，手动写入变更日志，保证 /sync/ 的增量同步能看到这些数据
+        changes = [CatalogChange(model='subject', object_id=s.pk, subject_pk=s.pk) for s in subjects]
+        for model in (Unit, PastPaper, Question):
+            for pk, subject_id in model.objects.filter(subject__in=subjects).values_list('id', 'subject_id'):
+                changes.append(CatalogChange(model=CATALOG_MODELS[model], object_id=pk, subject_pk=subject_id))
+        CatalogChange.objects.bulk_create(changes, batch_size=self.batch_size)
+        return subjects
+
+    @transaction.atomic
+    def create_users(self, prefix, count):
+        # 所有账号共用一个密码哈希，只计算一次 PBKDF2
+        password = make_password(LOAD_PASSWORD)
+        User.objects.bulk_create(
+            [User(username=f'{prefix}{i:06d}', password=password) for i in range(count)],
+            batch_size=self.batch_size,
+        )
+        user_ids = list(User.objects.filter(username__startswith=prefix).order_by('id').values_list('id', flat=True))
+        UserProfile.objects.bulk_create(
+            [UserProfile(user_id=user_id) for user_id in user_ids],
+            batch_size=self.batch_size,
+        )
+        return user_ids
+
+    def create_activity(self, subjects, users, options):
+        question_ids = {}
+        for qid, subject_id in Question.objects.filter(subject__in=subjects).values_list('id', 'subject_id'):
+            question_ids.setdefault(subject_id, []).append(qid)
+        paper_ids = {}
+        for ppid, subject_id in PastPaper.objects.filter(subject__in=subjects).values_list('id', 'subject_id'):
+            paper_ids.setdefault(subject_id, []).append(ppid)
+        subject_ids = [subject.pk for subject in subjects]
+
+        counts = {
+            'units': Unit.objects.filter(subject__in=subjects).count(),
+            'past_papers': sum(len(ids) for ids in paper_ids.values()),
+            'questions': sum(len(ids) for ids in question_ids.values()),
+            'tags': 0,
+            'paper_tags': 0,
+            'history': 0,
+        }
+        tags, paper_tags, history = [], [], []
+
+        def flush(force=False):
+            # 缓冲区达到批量大小时写入，内存占用与总行数无关
+            for model, rows, key in ((UserTag, tags, 'tags'), (PastPaperTag, paper_tags, 'paper_tags'),
+                                     (HistoryRecord, history, 'history')):
+                if rows and (force or len(rows) >= self.batch_size):
+                    with transaction.atomic():
+                        model.objects.bulk_create(rows, batch_size=self.batch_size)
+                    counts[key] += len(rows)
+                    rows.clear()
+
+        with explicit_timestamps(UserTag, PastPaperTag, HistoryRecord):
+            for index, user_id in enumerate(users):
+                # 每个学生主要学习一个学科
+                subject_id = subject_ids[index % len(subject_ids)]
+                pool = question_ids.get(subject_id, [])
+                for qid in self.rng.sample(pool, min(options['tags_per_user'], len(pool))):
+                    roll = self.rng.random()
+                    created = self.random_time()
+                    tags.append(UserTag(
+                        user_id=user_id, question_id=qid, kill=roll < 0.7, saved=0.7 <= roll < 0.9,
+                        created_at=created, updated_at=created,
+                    ))
+                pool = paper_ids.get(subject_id, [])
+                for ppid in self.rng.sample(pool, min(options['paper_tags_per_user'], len(pool))):
+                    created = self.random_time()
+                    paper_tags.append(PastPaperTag(
+                        user_id=user_id, past_paper_id=ppid, kill=self.rng.random() < 0.8,
+                        saved=self.rng.random() < 0.1, created_at=created, updated_at=created,
+                    ))
+                pool = question_ids.get(subject_id, [])
+                if pool:
+                    for _ in range(options['history_per_user']):
+                        history.append(HistoryRecord(
+                            user_id=user_id, question_id=self.rng.choice(pool), visited_at=self.random_time(),
+                        ))
+                flush()
+            flush(force=True)
+        return counts
@@ -0,0 +1,50 @@
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from pastpaper.models import CatalogChange
+
+
+class Command(BaseCommand):
+    help = (
+        '分批删除早于保留期的题库变更日志（墓碑）；始终保留最新一条，目录版本号不回退。'
+        '水位线早于剩余日志的客户端下次同步时收到全量快照'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--days', type=int, default=settings.CATALOG_CHANGE_RETENTION_DAYS,
+            help='保留最近N天的变更日志',
+        )
+        parser.add_argument('--chunk-size', type=int, default=1000, help='每批删除的行数')
+        parser.add_argument('--pause', type=float, default=0.05, help='两批之间暂停的秒数，让出写锁')
+
+    def prune(self, days, chunk_size, pause):
+        newest = CatalogChange.objects.order_by('-id').values_list('id', flat=True).first()
+        if newest is None:
+            return 0
+        stale = CatalogChange.objects.filter(changed_at__lt=timezone.now() - timedelta(days=days), id__lt=newest)
+        # 按 id 从旧到新删除，中途中断时剩余日志仍是连续的一段
+        boundary = stale.order_by('-id').values_list('id', flat=True).first()
+        if boundary is None:
+            return 0
+        total = 0
+        while True:
+            ids = list(
+                CatalogChange.objects.filter(id__lte=boundary).order_by('id').values_list('id', flat=True)[:chunk_size]
+            )
+            if not ids:
+                break
+            deleted, _ = CatalogChange.objects.filter(id__in=ids).delete()
+            total += deleted
+            if len(ids) < chunk_size:
+                break
+            time.sleep(pause)
+        return total
+
+    def handle(self, *args, **options):
+        total = self.prune(options['days'], options['chunk_size'], options['pause'])
+        self.stdout.write(f"Pruned {total} catalog changes older than {options['days']} days.")
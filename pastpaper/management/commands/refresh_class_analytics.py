@@ -0,0 +1,23 @@
+from django.core.management.base import BaseCommand
+
+from pastpaper.analytics import refresh_summaries
+
+
+class Command(BaseCommand):
+    help = '增量刷新教师端班级统计汇总表（建议用 cron 定时执行）'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--full',
+            action='store_true',
+            help='忽略水位线全量重建（学生集合变化时增量刷新会自动改为全量）',
+        )
+
+    def handle(self, *args, **options):
+        result = refresh_summaries(full=options['full'])
+        since = result['since'].isoformat() if result['since'] else 'beginning (full refresh)'
+        self.stdout.write(self.style.SUCCESS(
+            f"Refreshed since {since}: {result['questions']} questions, {result['units']} units, "
+            f"{result['past_papers']} past papers, {result['activity_days']} activity days, "
+            f"{result['students']} students."
+        ))
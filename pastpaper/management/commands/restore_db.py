@@ -0,0 +1,82 @@
+import os
+import sqlite3
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+from django.db.migrations.executor import MigrationExecutor
+
+from pastpaper.permissions import bump_roles_version
+from pastpaper.subjects import bump_cache_generation
+
+from ._snapshots import gunzip_file, integrity_errors, list_snapshots, remove_quietly
+
+
+class Command(BaseCommand):
+    help = (
+        '用 backup_db 生成的快照恢复数据库：先解压并做 integrity_check，再用在线备份接口写回当前数据库，'
+        '运行中的进程下一次查询即读到恢复后的数据，不需要停机或替换文件'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('snapshot', nargs='?', help='快照路径或 BACKUP_DIR 中的文件名，默认最新的一份')
+        parser.add_argument(
+            '--noinput', '--no-input', action='store_false', dest='interactive',
+            help='不询问确认',
+        )
+
+    def resolve_snapshot(self, snapshot):
+        if not snapshot:
+            snapshots = list_snapshots()
+            if not snapshots:
+                raise CommandError(f'No snapshots in {settings.BACKUP_DIR}')
+            return snapshots[0]
+        for path in (snapshot, os.path.join(settings.BACKUP_DIR, snapshot)):
+            if os.path.isfile(path):
+                return path
+        raise CommandError(f'Snapshot not found: {snapshot}')
+
+    def handle(self, *args, **options):
+        snapshot = self.resolve_snapshot(options['snapshot'])
+        database = str(settings.DATABASES['default']['NAME'])
+        if options['interactive']:
+            answer = input(f'Replace all data in {database} with {snapshot}? Type "yes" to continue: ')
+            if answer != 'yes':
+                raise CommandError('Restore cancelled.')
+
+        started = time.perf_counter()
+        # 解压到数据库所在目录，保证空间足够时再动正式数据库
+        raw = os.path.join(os.path.dirname(database), f'.restore-{os.getpid()}.sqlite3')
+        try:
+            gunzip_file(snapshot, raw)
+            errors = integrity_errors(raw)
+            if errors:
+                raise CommandError(f"Snapshot failed integrity_check: {'; '.join(errors[:5])}")
+
+            connections.close_all()
+            source = sqlite3.connect(raw)
+            destination = sqlite3.connect(database, timeout=30)
+            try:
+                # 一步写回：持有写锁直到完成，其他进程的查询在此期间等待，之后看到的是完整的新数据
+                source.backup(destination)
+            finally:
+                destination.close()
+                source.close()
+        except (sqlite3.Error, OSError, EOFError) as exc:
+            raise CommandError(f'Restore failed: {exc}')
+        finally:
+            remove_quietly(raw)
+
+        # 缓存中的列表、计数、页面片段和角色属于旧数据；只换用新版本号，不清空缓存，会话保留
+        bump_cache_generation()
+        bump_roles_version()
+        self.stdout.write(self.style.SUCCESS(
+            f'Restored {database} from {snapshot} in {time.perf_counter() - started:.1f}s; caches invalidated.'
+        ))
+
+        executor = MigrationExecutor(connections['default'])
+        if executor.migration_plan(executor.loader.graph.leaf_nodes()):
+            self.stdout.write(self.style.WARNING(
+                'The snapshot predates some migrations; run "python manage.py migrate" before serving traffic.'
+            ))
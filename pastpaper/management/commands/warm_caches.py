@@ -0,0 +1,26 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from pastpaper.subjects import bump_cache_generation
+from pastpaper.warmup import warm_catalog
+
+
+class Command(BaseCommand):
+    help = '预热共享缓存（学科列表、列表总数、角色缓存版本号）'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--clear', action='store_true',
+            help='先使题库缓存和页面片段失效（部署新版本后，旧模板渲染的片段不再有效）；会话等其他缓存保留',
+        )
+
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+        if options['clear']:
+            bump_cache_generation()
+        stats = warm_catalog()
+        self.stdout.write(self.style.SUCCESS(
+            f"Warmed catalog version {stats['catalog_version']}: {stats['subjects']} subjects, "
+            f"{stats['units']} units in {(time.perf_counter() - started) * 1000:.0f} ms."
+        ))
@@ -0,0 +1,115 @@
+# Generated by Django 5.2.18 on 2026-10-19 00:10
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('pastpaper', '0005_alter_subject_syllabus_url'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DailyActivity',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField(verbose_name='日期')),
+                ('views', models.PositiveIntegerField(default=0, verbose_name='浏览次数')),
+                ('active_users', models.PositiveIntegerField(default=0, verbose_name='活跃学生数')),
+            ],
+            options={
+                'verbose_name': '每日活跃度',
+                'verbose_name_plural': '每日活跃度',
+                'ordering': ['-date'],
+            },
+        ),
+        migrations.CreateModel(
+            name='PastPaperStats',
+            fields=[
+                ('past_paper', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='stats', serialize=False, to='pastpaper.pastpaper', verbose_name='历年试卷')),
+                ('kill_count', models.PositiveIntegerField(default=0, verbose_name='完成人数')),
+                ('saved_count', models.PositiveIntegerField(default=0, verbose_name='保存人数')),
+                ('refreshed_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': '试卷统计',
+                'verbose_name_plural': '试卷统计',
+            },
+        ),
+        migrations.CreateModel(
+            name='QuestionStats',
+            fields=[
+                ('question', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='stats', serialize=False, to='pastpaper.question', verbose_name='题目')),
+                ('kill_count', models.PositiveIntegerField(default=0, verbose_name='完成人数')),
+                ('saved_count', models.PositiveIntegerField(default=0, verbose_name='保存人数')),
+                ('refreshed_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': '题目统计',
+                'verbose_name_plural': '题目统计',
+            },
+        ),
+        migrations.CreateModel(
+            name='UnitStats',
+            fields=[
+                ('unit', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='stats', serialize=False, to='pastpaper.unit', verbose_name='单元')),
+                ('question_count', models.PositiveIntegerField(default=0, verbose_name='题目数')),
+                ('kill_count', models.PositiveIntegerField(default=0, verbose_name='完成次数')),
+                ('saved_count', models.PositiveIntegerField(default=0, verbose_name='保存次数')),
+                ('refreshed_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': '单元统计',
+                'verbose_name_plural': '单元统计',
+            },
+        ),
+        migrations.AddIndex(
+            model_name='historyrecord',
+            index=models.Index(fields=['visited_at'], name='pastpaper_h_visited_5ef1fc_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='pastpapertag',
+            index=models.Index(fields=['updated_at'], name='pastpaper_p_updated_f2a6f0_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='usertag',
+            index=models.Index(fields=['updated_at'], name='pastpaper_u_updated_4483cd_idx'),
+        ),
+        migrations.AddField(
+            model_name='dailyactivity',
+            name='subject',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='pastpaper.subject', verbose_name='所属学科'),
+        ),
+        migrations.AddField(
+            model_name='pastpaperstats',
+            name='subject',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='pastpaper.subject', verbose_name='所属学科'),
+        ),
+        migrations.AddField(
+            model_name='questionstats',
+            name='subject',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='pastpaper.subject', verbose_name='所属学科'),
+        ),
+        migrations.AddField(
+            model_name='questionstats',
+            name='unit',
+            field=models.ForeignKey(null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='pastpaper.unit', verbose_name='所属单元'),
+        ),
+        migrations.AddField(
+            model_name='unitstats',
+            name='subject',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='pastpaper.subject', verbose_name='所属学科'),
+        ),
+        migrations.AlterUniqueTogether(
+            name='dailyactivity',
+            unique_together={('subject', 'date')},
+        ),
+        migrations.AddIndex(
+            model_name='questionstats',
+            index=models.Index(fields=['subject', '-saved_count'], name='pastpaper_q_subject_4e3758_idx'),
+        ),
+    ]
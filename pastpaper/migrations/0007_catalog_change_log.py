@@ -0,0 +1,50 @@
+# Generated by Django 5.2.18 on 2026-10-19 00:11
+
+from django.db import migrations, models
+
+
+def seed_catalog_changes(apps, schema_editor):
+    """为已有题库数据写入初始变更记录，让客户端从非零版本开始增量同步"""
+    CatalogChange = apps.get_model('pastpaper', 'CatalogChange')
+    sources = [
+        ('subject', apps.get_model('pastpaper', 'Subject'), 'id'),
+        ('unit', apps.get_model('pastpaper', 'Unit'), 'subject_id'),
+        ('question', apps.get_model('pastpaper', 'Question'), 'subject_id'),
+        ('past_paper', apps.get_model('pastpaper', 'PastPaper'), 'subject_id'),
+    ]
+    for model_name, model, subject_field in sources:
+        CatalogChange.objects.bulk_create(
+            [
+                CatalogChange(model=model_name, object_id=pk, subject_pk=subject_pk)
+                for pk, subject_pk in model.objects.values_list('id', subject_field).iterator()
+            ],
+            batch_size=500,
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('pastpaper', '0006_class_analytics'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CatalogChange',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('model', models.CharField(choices=[('subject', '学科'), ('unit', '单元'), ('question', '题目'), ('past_paper', '历年试卷')], max_length=20, verbose_name='模型')),
+                ('object_id', models.BigIntegerField(verbose_name='对象ID')),
+                ('subject_pk', models.BigIntegerField(verbose_name='学科ID')),
+                ('deleted', models.BooleanField(default=False, verbose_name='已删除')),
+                ('changed_at', models.DateTimeField(auto_now_add=True, verbose_name='变更时间')),
+            ],
+            options={
+                'verbose_name': '题库变更',
+                'verbose_name_plural': '题库变更',
+                'ordering': ['id'],
+                'indexes': [models.Index(fields=['subject_pk', 'id'], name='pastpaper_c_subject_e4bcc5_idx')],
+            },
+        ),
+        migrations.RunPython(seed_catalog_changes, migrations.RunPython.noop),
+    ]
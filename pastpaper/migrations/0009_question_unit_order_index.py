@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-19 00:14
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('pastpaper', '0008_tag_sync_cursor'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='question',
+            index=models.Index(fields=['unit', '-created_at', '-id'], name='pastpaper_q_unit_id_6084e1_idx'),
+        ),
+    ]
@@ -0,0 +1,38 @@
+# Generated by Django 5.2.18 on 2026-10-19 00:36
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('pastpaper', '0009_question_unit_order_index'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RequestProfile',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('method', models.CharField(max_length=10, verbose_name='请求方法')),
+                ('path', models.CharField(max_length=500, verbose_name='路径')),
+                ('view_name', models.CharField(blank=True, max_length=200, verbose_name='视图')),
+                ('status', models.PositiveSmallIntegerField(default=0, verbose_name='状态码')),
+                ('duration_ms', models.FloatField(verbose_name='耗时(ms)')),
+                ('sql_count', models.PositiveIntegerField(default=0, verbose_name='SQL次数')),
+                ('trigger', models.CharField(choices=[('manual', '手动'), ('sample', '随机采样')], max_length=10, verbose_name='触发方式')),
+                ('stats_file', models.CharField(max_length=255, verbose_name='pstats文件')),
+                ('collapsed_file', models.CharField(max_length=255, verbose_name='折叠栈文件')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='记录时间')),
+                ('user', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to=settings.AUTH_USER_MODEL, verbose_name='用户')),
+            ],
+            options={
+                'verbose_name': '请求剖析',
+                'verbose_name_plural': '请求剖析',
+                'ordering': ['-created_at'],
+            },
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-19 00:44
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('pastpaper', '0010_request_profile'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='pastpaper',
+            index=models.Index(fields=['subject', '-year', 'session', 'paper_num', 'id'], name='pastpaper_p_subject_b6e040_idx'),
+        ),
+    ]
@@ -3,6 +3,15 @@ from urllib.parse import urljoin
 from django.conf import settings
 from django.db import models
 from django.contrib.auth.models import User
+from django.db.models.signals import post_delete, post_save
+
+
+def media_file_url(filename):
+    """拼接MEDIA_URL后返回media目录下文件的访问URL"""
+    media_url = settings.MEDIA_URL or '/media/'
+    if not media_url.endswith('/'):
+        media_url = f"{media_url}/"
+    return urljoin(media_url, filename)
 
 
 class Subject(models.Model):
@@ -50,10 +59,7 @@ class Subject(models.Model):
         filename = self.syllabus_filename
         if not filename:
             return ''
-        media_url = settings.MEDIA_URL or '/media/'
-        if not media_url.endswith('/'):
-            media_url = f"{media_url}/"
-        return urljoin(media_url, filename)
+        return media_file_url(filename)
 
 
 class Unit(models.Model):
@@ -97,6 +103,8 @@ class PastPaper(models.Model):
 
     class Meta:
         ordering = ['-year', 'session', 'paper_num']
+        # 与 get_past_papers 的游标分页排序一致
+        indexes = [models.Index(fields=['subject', '-year', 'session', 'paper_num', 'id'])]
         verbose_name = "历年试卷"
         verbose_name_plural = "历年试卷"
 
@@ -135,6 +143,7 @@ class PastPaperTag(models.Model):
 
     class Meta:
         unique_together = ['user', 'past_paper']
+        indexes = [models.Index(fields=['updated_at'])]
         verbose_name = "历年试卷标签"
         verbose_name_plural = "历年试卷标签"
 
@@ -166,6 +175,7 @@ class Question(models.Model):
 
     class Meta:
         ordering = ['-created_at']
+        indexes = [models.Index(fields=['unit', '-created_at', '-id'])]
         verbose_name = "题目"
         verbose_name_plural = "题目"
 
@@ -188,6 +198,27 @@ class Question(models.Model):
         paper = parts[9:11]
         return f"{base}ms_{paper}.pdf"
 
+    @property
+    def qp_url(self):
+        return media_file_url(self.qp_filename)
+
+    @property
+    def ms_url(self):
+        return media_file_url(self.ms_filename)
+
+    def unit_neighbors(self):
+        """返回同单元列表（按 -created_at, -id 排序）中的上一题和下一题"""
+        if not self.unit_id:
+            return None, None
+        siblings = Question.objects.filter(unit_id=self.unit_id).select_related('unit')
+        previous = siblings.filter(
+            models.Q(created_at__gt=self.created_at) | models.Q(created_at=self.created_at, id__gt=self.id)
+        ).order_by('created_at', 'id').first()
+        following = siblings.filter(
+            models.Q(created_at__lt=self.created_at) | models.Q(created_at=self.created_at, id__lt=self.id)
+        ).order_by('-created_at', '-id').first()
+        return previous, following
+
     @property
     def syllabus_page(self):
         """������Ŀ������Ԫ�Ĵ�Ҫҳ��"""
@@ -217,6 +248,7 @@ class UserTag(models.Model):
 
     class Meta:
         unique_together = ['user', 'question']
+        indexes = [models.Index(fields=['updated_at'])]
         verbose_name = "用户标签"
         verbose_name_plural = "用户标签"
 
@@ -224,6 +256,27 @@ class UserTag(models.Model):
         return f"{self.user.username} - {self.question.code}"
 
 
+class TagSyncCursor(models.Model):
+    """批量标签同步的客户端序号水位，序号不大于 last_seq 的操作视为重试直接跳过"""
+    user = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        related_name='tag_sync_cursors',
+        verbose_name="用户"
+    )
+    client_id = models.CharField(max_length=64, verbose_name="客户端ID")
+    last_seq = models.BigIntegerField(default=0, verbose_name="最后应用序号")
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        unique_together = ['user', 'client_id']
+        verbose_name = "标签同步进度"
+        verbose_name_plural = "标签同步进度"
+
+    def __str__(self):
+        return f"{self.user_id}/{self.client_id}: {self.last_seq}"
+
+
 class HistoryRecord(models.Model):
     """用户浏览历史模型"""
     user = models.ForeignKey(
@@ -242,6 +295,7 @@ class HistoryRecord(models.Model):
 
     class Meta:
         ordering = ['-visited_at']
+        indexes = [models.Index(fields=['visited_at'])]
         verbose_name = "浏览历史"
         verbose_name_plural = "浏览历史"
 
@@ -263,3 +317,179 @@ class Setting(models.Model):
 
     def __str__(self):
         return self.key
+
+
+class QuestionStats(models.Model):
+    """题目标签汇总（由 refresh_class_analytics 命令维护）"""
+    question = models.OneToOneField(
+        Question,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='stats',
+        verbose_name="题目"
+    )
+    subject = models.ForeignKey(Subject, on_delete=models.CASCADE, related_name='+', verbose_name="所属学科")
+    unit = models.ForeignKey(Unit, on_delete=models.CASCADE, null=True, related_name='+', verbose_name="所属单元")
+    kill_count = models.PositiveIntegerField(default=0, verbose_name="完成人数")
+    saved_count = models.PositiveIntegerField(default=0, verbose_name="保存人数")
+    refreshed_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [models.Index(fields=['subject', '-saved_count'])]
+        verbose_name = "题目统计"
+        verbose_name_plural = "题目统计"
+
+    def __str__(self):
+        return f"{self.question_id}: {self.kill_count}/{self.saved_count}"
+
+
+class UnitStats(models.Model):
+    """单元完成度汇总"""
+    unit = models.OneToOneField(
+        Unit,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='stats',
+        verbose_name="单元"
+    )
+    subject = models.ForeignKey(Subject, on_delete=models.CASCADE, related_name='+', verbose_name="所属学科")
+    question_count = models.PositiveIntegerField(default=0, verbose_name="题目数")
+    kill_count = models.PositiveIntegerField(default=0, verbose_name="完成次数")
+    saved_count = models.PositiveIntegerField(default=0, verbose_name="保存次数")
+    refreshed_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = "单元统计"
+        verbose_name_plural = "单元统计"
+
+    def __str__(self):
+        return f"Unit {self.unit_id}: {self.kill_count}/{self.question_count}"
+
+
+class PastPaperStats(models.Model):
+    """历年试卷完成度汇总"""
+    past_paper = models.OneToOneField(
+        PastPaper,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='stats',
+        verbose_name="历年试卷"
+    )
+    subject = models.ForeignKey(Subject, on_delete=models.CASCADE, related_name='+', verbose_name="所属学科")
+    kill_count = models.PositiveIntegerField(default=0, verbose_name="完成人数")
+    saved_count = models.PositiveIntegerField(default=0, verbose_name="保存人数")
+    refreshed_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = "试卷统计"
+        verbose_name_plural = "试卷统计"
+
+    def __str__(self):
+        return f"{self.past_paper_id}: {self.kill_count}/{self.saved_count}"
+
+
+class DailyActivity(models.Model):
+    """按天汇总的学生浏览活跃度"""
+    subject = models.ForeignKey(Subject, on_delete=models.CASCADE, related_name='+', verbose_name="所属学科")
+    date = models.DateField(verbose_name="日期")
+    views = models.PositiveIntegerField(default=0, verbose_name="浏览次数")
+    active_users = models.PositiveIntegerField(default=0, verbose_name="活跃学生数")
+
+    class Meta:
+        ordering = ['-date']
+        unique_together = ['subject', 'date']
+        verbose_name = "每日活跃度"
+        verbose_name_plural = "每日活跃度"
+
+    def __str__(self):
+        return f"{self.subject_id} {self.date}: {self.views}"
+
+
+class CatalogChange(models.Model):
+    """题库变更日志：自增 id 即目录版本号，删除记录作为墓碑供增量同步使用"""
+    MODEL_CHOICES = [
+        ('subject', '学科'),
+        ('unit', '单元'),
+        ('question', '题目'),
+        ('past_paper', '历年试卷'),
+    ]
+
+    model = models.CharField(max_length=20, choices=MODEL_CHOICES, verbose_name="模型")
+    object_id = models.BigIntegerField(verbose_name="对象ID")
+    # 不使用外键：学科被删除后墓碑仍需保留
+    subject_pk = models.BigIntegerField(verbose_name="学科ID")
+    deleted = models.BooleanField(default=False, verbose_name="已删除")
+    changed_at = models.DateTimeField(auto_now_add=True, verbose_name="变更时间")
+
+    class Meta:
+        ordering = ['id']
+        indexes = [models.Index(fields=['subject_pk', 'id'])]
+        verbose_name = "题库变更"
+        verbose_name_plural = "题库变更"
+
+    def __str__(self):
+        action = 'delete' if self.deleted else 'upsert'
+        return f"#{self.id} {action} {self.model}:{self.object_id}"
+
+
+class RequestProfile(models.Model):
+    """请求性能剖析记录，文件保存在 PROFILE_DIR（环形缓冲，只保留最近 PROFILE_KEEP 条）"""
+    TRIGGER_CHOICES = [
+        ('manual', '手动'),
+        ('sample', '随机采样'),
+    ]
+
+    method = models.CharField(max_length=10, verbose_name="请求方法")
+    path = models.CharField(max_length=500, verbose_name="路径")
+    view_name = models.CharField(max_length=200, blank=True, verbose_name="视图")
+    user = models.ForeignKey(
+        User,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='+',
+        verbose_name="用户"
+    )
+    status = models.PositiveSmallIntegerField(default=0, verbose_name="状态码")
+    duration_ms = models.FloatField(verbose_name="耗时(ms)")
+    sql_count = models.PositiveIntegerField(default=0, verbose_name="SQL次数")
+    trigger = models.CharField(max_length=10, choices=TRIGGER_CHOICES, verbose_name="触发方式")
+    stats_file = models.CharField(max_length=255, verbose_name="pstats文件")
+    collapsed_file = models.CharField(max_length=255, verbose_name="折叠栈文件")
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name="记录时间")
+
+    class Meta:
+        ordering = ['-created_at']
+        verbose_name = "请求剖析"
+        verbose_name_plural = "请求剖析"
+
+    def __str__(self):
+        return f"{self.method} {self.path} ({self.duration_ms:.0f} ms)"
+
+
+CATALOG_MODELS = {
+    Subject: 'subject',
+    Unit: 'unit',
+    Question: 'question',
+    PastPaper: 'past_paper',
+}
+
+
+def catalog_version():
+    """当前题库版本号（最新变更日志 id）"""
+    return CatalogChange.objects.order_by('-id').values_list('id', flat=True).first() or 0
+
+
+def record_catalog_change(sender, instance, **kwargs):
+    """题库对象保存/删除时写入变更日志（bulk_create/update 不触发信号，需要自行记录）"""
+    CatalogChange.objects.create(
+        model=CATALOG_MODELS[sender],
+        object_id=instance.pk,
+        subject_pk=instance.pk if sender is Subject else instance.subject_id,
+        deleted=kwargs.get('signal') is post_delete,
+    )
+
+
+for _model in CATALOG_MODELS:
+    post_save.connect(record_catalog_change, sender=_model, dispatch_uid=f'catalog_save_{_model.__name__}')
+    post_delete.connect(record_catalog_change, sender=_model, dispatch_uid=f'catalog_delete_{_model.__name__}')
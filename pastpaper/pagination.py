@@ -0,0 +1,156 @@
+"""
+列表接口的游标（keyset）分页：按列表自身的排序字段定位下一页，不使用 OFFSET，
+翻到后面的页也只扫描一页的索引范围；期间插入或删除的行不会导致重复或漏行。
+"""
+import base64
+import json
+
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
+from django.db.models import Q
+
+from config.metrics import record_cache
+
+from .models import CatalogChange
+from .subjects import acache_generation, catalog_cache_version
+
+PAGE_SIZE_DEFAULT = 50
+PAGE_SIZE_MAX = 200
+
+# 总数按题库版本（含缓存代数，见 subjects.catalog_cache_version）缓存，题库变化后自动换用新键；超时只是兜底
+COUNT_CACHE_TIMEOUT = 3600
+
+# cached_count 的名称（warm_caches 按相同名称预热）
+QUESTION_COUNT_NAME = 'questions:unit:{}'
+PAST_PAPER_COUNT_NAME = 'past_papers:subject:{}'
+
+
+class InvalidPage(ValueError):
+    pass
+
+
+class Keyset:
+    """排序字段（'-' 表示降序）；最后一个字段必须唯一，保证游标位置确定"""
+
+    def __init__(self, *ordering):
+        self.ordering = ordering
+        self.fields = [field.lstrip('-') for field in ordering]
+
+    def after(self, values):
+        """排在 values 之后的行：(a < x) OR (a = x AND b > y) OR ..."""
+        condition = Q()
+        equal = {}
+        for field, name, value in zip(self.ordering, self.fields, values):
+            lookup = f'{name}__lt' if field.startswith('-') else f'{name}__gt'
+            condition |= Q(**equal, **{lookup: value})
+            equal[name] = value
+        return condition
+
+    def encode(self, obj):
+        values = []
+        for name in self.fields:
+            value = getattr(obj, name)
+            # 时间保留微秒，截断会使同一时刻的行被跳过
+            values.append(value.isoformat() if hasattr(value, 'isoformat') else value)
+        raw = json.dumps(values, separators=(',', ':')).encode()
+        return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+    def decode(self, cursor):
+        try:
+            raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+            values = json.loads(raw)
+        except (ValueError, TypeError):
+            raise InvalidPage('Invalid cursor')
+        if not isinstance(values, list) or len(values) != len(self.fields):
+            raise InvalidPage('Invalid cursor')
+        # 字符型字段会把列表、对象转换成字符串参与比较，不会报错，这里直接拒绝
+        if not all(isinstance(value, (str, int, float)) for value in values):
+            raise InvalidPage('Invalid cursor')
+        return values
+
+
+QUESTION_KEYSET = Keyset('-created_at', '-id')
+PAST_PAPER_KEYSET = Keyset('-year', 'session', 'paper_num', 'id')
+
+
+def parse_page(data):
+    """
+    返回 (limit, cursor)。两个参数都没有时返回 (None, None)，接口按原格式返回完整列表。
+    """
+    limit, cursor = data.get('limit'), data.get('cursor') or None
+    if limit in (None, '') and cursor is None:
+        return None, None
+    if limit in (None, ''):
+        return PAGE_SIZE_DEFAULT, cursor
+    try:
+        limit = int(limit)
+    except (TypeError, ValueError):
+        raise InvalidPage('limit must be an integer')
+    return min(max(limit, 1), PAGE_SIZE_MAX), cursor
+
+
+def _page_queryset(queryset, keyset, limit, cursor):
+    queryset = queryset.order_by(*keyset.ordering)
+    if cursor is not None:
+        try:
+            queryset = queryset.filter(keyset.after(keyset.decode(cursor)))
+        except (TypeError, ValueError, ValidationError):
+            # 游标内容被篡改（类型不符）
+            raise InvalidPage('Invalid cursor')
+    # 多取一行判断是否还有下一页
+    return queryset[:limit + 1]
+
+
+def _split(rows, keyset, limit):
+    if len(rows) > limit:
+        rows = rows[:limit]
+        return rows, keyset.encode(rows[-1])
+    return rows, None
+
+
+def paginate(queryset, keyset, limit, cursor):
+    """返回 (本页对象列表, 下一页游标或 None)"""
+    rows = list(_page_queryset(queryset, keyset, limit, cursor))
+    return _split(rows, keyset, limit)
+
+
+async def apaginate(queryset, keyset, limit, cursor):
+    rows = [row async for row in _page_queryset(queryset, keyset, limit, cursor)]
+    return _split(rows, keyset, limit)
+
+
+def _count_key(name, cache_version):
+    return f'pastpaper:count:{name}:{cache_version}'
+
+
+def cached_count(name, queryset, cache_version=None):
+    """总数提示：同一题库版本内只计算一次"""
+    key = _count_key(name, catalog_cache_version() if cache_version is None else cache_version)
+    total = cache.get(key)
+    record_cache('list_count', total is not None)
+    if total is None:
+        total = queryset.count()
+        cache.set(key, total, COUNT_CACHE_TIMEOUT)
+    return total
+
+
+async def acached_count(name, queryset):
+    version = await CatalogChange.objects.order_by('-id').values_list('id', flat=True).afirst() or 0
+    key = _count_key(name, f'{await acache_generation()}.{version}')
+    total = await cache.aget(key)
+    record_cache('list_count', total is not None)
+    if total is None:
+        total = await queryset.acount()
+        await cache.aset(key, total, COUNT_CACHE_TIMEOUT)
+    return total
+
+
+def page_fields(next_cursor, total=None):
+    fields = {'next_cursor': next_cursor}
+    if total is not None:
+        fields['total'] = total
+    return fields
+
+
+def page_payload(items, next_cursor, total=None):
+    return {'items': items, **page_fields(next_cursor, total)}
@@ -1,13 +1,80 @@
+from django.contrib.auth.models import Group, User
+from django.core.cache import cache
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+from config.metrics import record_cache
+
 TEACHER_GROUP_NAME = '教师'
 
+ROLE_TEACHER = 'teacher'
+ROLE_STAFF = 'staff'
+ROLE_SUPERUSER = 'superuser'
+EDITOR_ROLES = frozenset({ROLE_TEACHER, ROLE_STAFF, ROLE_SUPERUSER})
 
-def user_is_teacher(user):
+# 组成员关系缓存：版本号在用户组变化时递增，旧缓存随之失效；超时兜底各进程本地缓存不同步的情况
+ROLES_VERSION_KEY = 'permissions:roles_version'
+ROLES_CACHE_TIMEOUT = 300
+
+
+def _roles_version():
+    version = cache.get(ROLES_VERSION_KEY)
+    if version is None:
+        cache.add(ROLES_VERSION_KEY, 1, None)
+        version = cache.get(ROLES_VERSION_KEY, 1)
+    return version
+
+
+def bump_roles_version():
+    """使所有用户的角色缓存失效"""
+    try:
+        cache.incr(ROLES_VERSION_KEY)
+    except ValueError:
+        cache.set(ROLES_VERSION_KEY, 2, None)
+
+
+def _in_teacher_group(user):
+    key = f'permissions:teacher:{user.pk}:{_roles_version()}'
+    is_teacher = cache.get(key)
+    record_cache('roles', is_teacher is not None)
+    if is_teacher is None:
+        is_teacher = user.groups.filter(name=TEACHER_GROUP_NAME).exists()
+        cache.set(key, is_teacher, ROLES_CACHE_TIMEOUT)
+    return is_teacher
+
+
+def get_user_roles(user):
+    """计算用户角色；结果保存在 user 对象上，同一请求内只计算一次"""
     if not user or not user.is_authenticated:
-        return False
-    return user.groups.filter(name=TEACHER_GROUP_NAME).exists()
+        return frozenset()
+    roles = getattr(user, '_pastpaper_roles', None)
+    if roles is None:
+        roles = set()
+        if user.is_superuser:
+            roles.add(ROLE_SUPERUSER)
+        if user.is_staff:
+            roles.add(ROLE_STAFF)
+        if _in_teacher_group(user):
+            roles.add(ROLE_TEACHER)
+        roles = frozenset(roles)
+        user._pastpaper_roles = roles
+    return roles
+
+
+def user_is_teacher(user):
+    return ROLE_TEACHER in get_user_roles(user)
 
 
 def has_question_editor_privileges(user):
-    if not user or not user.is_authenticated:
-        return False
-    return user.is_superuser or user.is_staff or user_is_teacher(user)
+    return bool(get_user_roles(user) & EDITOR_ROLES)
+
+
+@receiver(m2m_changed, sender=User.groups.through)
+def user_groups_changed(sender, **kwargs):
+    bump_roles_version()
+
+
+@receiver(post_save, sender=Group)
+@receiver(post_delete, sender=Group)
+def group_changed(sender, **kwargs):
+    bump_roles_version()
@@ -0,0 +1,229 @@
+"""
+按需剖析线上请求：管理员在请求上加 ?_profile=1 或 X-Profile: 1，或按 PROFILE_SAMPLE_RATE 随机抽样。
+同时记录 cProfile（pstats，函数级累计耗时）和采样得到的折叠栈（可直接交给 flamegraph.pl / speedscope）。
+"""
+import cProfile
+import logging
+import os
+import random
+import sys
+import threading
+import time
+import uuid
+from collections import Counter
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.db.models.signals import post_delete
+from django.dispatch import receiver
+
+from config.middleware import current_metrics
+
+from .models import RequestProfile
+
+logger = logging.getLogger(__name__)
+
+PROFILE_QUERY_PARAM = '_profile'
+PROFILE_HEADER = 'X-Profile'
+
+# 同一进程同一时间只能有一个 cProfile 在运行（Python 3.12 起第二个 enable() 会抛 ValueError），
+# 剖析进行中时其他被选中的请求照常处理、不剖析
+_profiling_lock = threading.Lock()
+
+
+class StackSampler:
+    """后台线程定时抓取目标线程的调用栈，按栈计数"""
+
+    def __init__(self, thread_id, interval):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.counts = Counter()
+        self._labels = {}
+        # 文件名去掉项目目录和 sys.path 前缀，较长的前缀优先
+        self._prefixes = sorted(
+            {str(settings.BASE_DIR) + os.sep, *(path + os.sep for path in sys.path if path)},
+            key=len,
+            reverse=True,
+        )
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread.ident is not None:
+            self._thread.join()
+
+    def _label(self, code):
+        label = self._labels.get(code)
+        if label is None:
+            filename = code.co_filename
+            for prefix in self._prefixes:
+                if filename.startswith(prefix):
+                    filename = filename[len(prefix):]
+                    break
+            # 折叠栈格式用分号分隔栈帧（计数在最后一个空格之后），名称中不能出现分号
+            label = f'{code.co_name} ({filename}:{code.co_firstlineno})'.replace(';', ',')
+            self._labels[code] = label
+        return label
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None:
+                stack.append(self._label(frame.f_code))
+                frame = frame.f_back
+            if stack:
+                self.counts[';'.join(reversed(stack))] += 1
+
+    def collapsed(self):
+        return ''.join(f'{stack} {count}\n' for stack, count in self.counts.most_common())
+
+
+def profile_trigger(request, user):
+    """返回触发方式，不需要剖析时返回 None"""
+    if user is not None and user.is_staff and (
+        request.GET.get(PROFILE_QUERY_PARAM) == '1' or request.headers.get(PROFILE_HEADER) == '1'
+    ):
+        return 'manual'
+    rate = settings.PROFILE_SAMPLE_RATE
+    if rate > 0 and random.randrange(rate) == 0:
+        return 'sample'
+    return None
+
+
+def profile_path(name):
+    return os.path.join(settings.PROFILE_DIR, name)
+
+
+def _remove(names):
+    for name in names:
+        try:
+            os.remove(profile_path(name))
+        except FileNotFoundError:
+            pass
+
+
+def save_profile(request, user, response, trigger, profiler, sampler, duration_ms):
+    base = f"{time.strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:8]}"
+    stats_file, collapsed_file = f'{base}.prof', f'{base}.collapsed'
+    os.makedirs(settings.PROFILE_DIR, exist_ok=True)
+    profiler.dump_stats(profile_path(stats_file))
+    with open(profile_path(collapsed_file), 'w', encoding='utf-8') as fh:
+        fh.write(sampler.collapsed())
+
+    match = getattr(request, 'resolver_match', None)
+    metrics = current_metrics()
+    profile = RequestProfile.objects.create(
+        method=request.method,
+        path=request.get_full_path()[:500],
+        view_name=match.view_name if match else '',
+        user=user if user is not None and user.is_authenticated else None,
+        status=response.status_code,
+        duration_ms=round(duration_ms, 2),
+        sql_count=metrics.sql_count if metrics else 0,
+        trigger=trigger,
+        stats_file=stats_file,
+        collapsed_file=collapsed_file,
+    )
+
+    # 环形缓冲：超出数量的旧记录连同文件一起删除
+    stale = RequestProfile.objects.order_by('-created_at', '-id').values_list('id', flat=True)[settings.PROFILE_KEEP:]
+    for old in RequestProfile.objects.filter(id__in=list(stale)):
+        old.delete()
+    return profile
+
+
+@receiver(post_delete, sender=RequestProfile)
+def delete_profile_files(sender, instance, **kwargs):
+    _remove([instance.stats_file, instance.collapsed_file])
+
+
+class ProfilingMiddleware:
+    """
+    放在 AuthenticationMiddleware 之后（需要 request.user 判断是否为管理员）。
+    ASGI 下剖析的是事件循环线程，同一时间段内其他请求的协程也会出现在结果里。
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        user = getattr(request, 'user', None)
+        trigger = profile_trigger(request, user)
+        if trigger is None:
+            return self.get_response(request)
+
+        started = self.start()
+        if started is None:
+            return self.get_response(request)
+        profiler, sampler, started = started
+        try:
+            response = self.get_response(request)
+        finally:
+            self.stop(profiler, sampler)
+        duration_ms = (time.perf_counter() - started) * 1000
+        return self.save(request, user, response, trigger, profiler, sampler, duration_ms)
+
+    async def __acall__(self, request):
+        user = await request.auser() if hasattr(request, 'auser') else None
+        trigger = profile_trigger(request, user)
+        if trigger is None:
+            return await self.get_response(request)
+
+        started = self.start()
+        if started is None:
+            return await self.get_response(request)
+        profiler, sampler, started = started
+        try:
+            response = await self.get_response(request)
+        finally:
+            self.stop(profiler, sampler)
+        duration_ms = (time.perf_counter() - started) * 1000
+        return await sync_to_async(self.save)(request, user, response, trigger, profiler, sampler, duration_ms)
+
+    def start(self):
+        """返回 (profiler, sampler, 开始时间)；已有请求在剖析或启动失败时返回 None"""
+        if not _profiling_lock.acquire(blocking=False):
+            return None
+        sampler = None
+        try:
+            profiler = cProfile.Profile()
+            sampler = StackSampler(threading.get_ident(), settings.PROFILE_SAMPLE_INTERVAL)
+            started = time.perf_counter()
+            sampler.start()
+            profiler.enable()
+        except Exception:  # 例如其他剖析工具（调试器、覆盖率）正在运行
+            logger.exception('Failed to start request profiler')
+            if sampler is not None:
+                sampler.stop()
+            _profiling_lock.release()
+            return None
+        return profiler, sampler, started
+
+    def stop(self, profiler, sampler):
+        try:
+            profiler.disable()
+            sampler.stop()
+        finally:
+            _profiling_lock.release()
+
+    def save(self, request, user, response, trigger, profiler, sampler, duration_ms):
+        try:
+            profile = save_profile(request, user, response, trigger, profiler, sampler, duration_ms)
+        except Exception:  # 剖析失败不能影响正常响应
+            logger.exception('Failed to save request profile')
+        else:
+            response['X-Profile-Id'] = str(profile.pk)
+        return response
@@ -0,0 +1,81 @@
+"""
+页面视图共用的学科查询：学科列表按题库版本缓存，题库变化后自动换用新键。
+"""
+from django.core.cache import cache
+
+from config.metrics import record_cache
+
+from .models import Subject, catalog_version
+
+DEFAULT_SUBJECT_CODE = 'cs'
+
+# 键中带题库版本，超时只是兜底
+SUBJECTS_CACHE_TIMEOUT = 3600
+
+# 缓存代数：部署了新模板或恢复了数据库时递增（boot / warm_caches --clear / restore_db），
+# 学科列表、列表总数和导航栏片段随之换用新键；不清空整个缓存，会话可能也保存在其中
+CACHE_GENERATION_KEY = 'pastpaper:cache_generation'
+
+
+def cache_generation():
+    generation = cache.get(CACHE_GENERATION_KEY)
+    if generation is None:
+        cache.add(CACHE_GENERATION_KEY, 1, None)
+        generation = cache.get(CACHE_GENERATION_KEY, 1)
+    return generation
+
+
+async def acache_generation():
+    generation = await cache.aget(CACHE_GENERATION_KEY)
+    if generation is None:
+        await cache.aadd(CACHE_GENERATION_KEY, 1, None)
+        generation = await cache.aget(CACHE_GENERATION_KEY, 1)
+    return generation
+
+
+def bump_cache_generation():
+    """使题库相关的缓存和页面片段失效"""
+    try:
+        cache.incr(CACHE_GENERATION_KEY)
+    except ValueError:
+        cache.set(CACHE_GENERATION_KEY, 2, None)
+
+
+def catalog_cache_version(version=None):
+    """缓存键中使用的版本：缓存代数.题库版本"""
+    if version is None:
+        version = catalog_version()
+    return f'{cache_generation()}.{version}'
+
+
+def subjects_cache_key(cache_version):
+    return f'pastpaper:subjects:{cache_version}'
+
+
+def all_subjects(cache_version=None):
+    """按 id 排序的学科列表；cache_version 由 catalog_cache_version() 给出"""
+    if cache_version is None:
+        cache_version = catalog_cache_version()
+    key = subjects_cache_key(cache_version)
+    subjects = cache.get(key)
+    record_cache('subjects', subjects is not None)
+    if subjects is None:
+        subjects = list(Subject.objects.order_by('id'))
+        cache.set(key, subjects, SUBJECTS_CACHE_TIMEOUT)
+    return subjects
+
+
+def subject_context(code=None, default=DEFAULT_SUBJECT_CODE):
+    """
+    页面公共上下文：current_subject 按 code 查找，找不到时依次回退到 default 和第一个学科；
+    catalog_cache_version 同时用作 base.html 导航栏片段缓存的键。
+    """
+    version = catalog_cache_version()
+    subjects = all_subjects(version)
+    by_code = {subject.code: subject for subject in subjects}
+    current = by_code.get(code) or by_code.get(default) or (subjects[0] if subjects else None)
+    return {
+        'current_subject': current,
+        'all_subjects': subjects,
+        'catalog_cache_version': version,
+    }
@@ -0,0 +1,270 @@
+"""增量同步：根据客户端水位线返回题库与用户标签的变化，以及批量标签写入"""
+from datetime import timedelta
+
+from django.db import transaction
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from .models import (
+    CatalogChange,
+    PastPaper,
+    PastPaperTag,
+    Question,
+    Subject,
+    TagSyncCursor,
+    Unit,
+    UserTag,
+    catalog_version,
+)
+
+
+# updated_at 在写入前由 Django 生成，事务可能在之后才提交（SQLite 写锁默认最多等待 5 秒）：
+# 晚提交但时间戳更早的标签会落在上次水位线之前，因此每次多读水位线之前这段时间的标签，重复发送的状态客户端覆盖即可
+TAGS_OVERLAP = timedelta(seconds=60)
+
+
+def serialize_subject(subject):
+    return {
+        'id': subject.id,
+        'code': subject.code,
+        'name': subject.name,
+        'exam_code': subject.exam_code,
+        'syllabus_url': subject.syllabus_media_url,
+    }
+
+
+def serialize_unit(unit):
+    return {
+        'id': unit.id,
+        'unit_num': unit.unit_num,
+        'name': unit.name,
+        'syllabus_page': unit.syllabus_page,
+    }
+
+
+def serialize_question(question):
+    # syllabus_page 由客户端根据 unit_id 从单元数据中获取，单元修改时无需重发所有题目
+    return {
+        'id': question.id,
+        'code': question.code,
+        'unit_id': question.unit_id,
+        'qpage': question.qpage,
+        'apage': question.apage,
+    }
+
+
+def serialize_past_paper(pp):
+    return {
+        'id': pp.id,
+        'code': pp.code,
+        'year': pp.year,
+        'session': pp.session,
+        'paper_num': pp.paper_num,
+    }
+
+
+SYNC_SECTIONS = [
+    ('subjects', 'subject', Subject, serialize_subject),
+    ('units', 'unit', Unit, serialize_unit),
+    ('questions', 'question', Question, serialize_question),
+    ('past_papers', 'past_paper', PastPaper, serialize_past_paper),
+]
+
+
+def parse_catalog_version(value):
+    try:
+        return max(int(value), 0)
+    except (TypeError, ValueError):
+        return 0
+
+
+def _catalog_payload(subject, since_version, current_version):
+    """since_version 为 0、比服务端还新（如数据库被重置）或早于已清理的变更日志时返回全量快照"""
+    # prune_catalog_changes 删除了 oldest 之前的日志，更早的水位线无法补齐其间的变更
+    oldest = CatalogChange.objects.order_by('id').values_list('id', flat=True).first()
+    full = since_version <= 0 or since_version > current_version or (oldest is not None and since_version < oldest - 1)
+    payload = {'full': full}
+
+    if full:
+        for section, _, model, serialize in SYNC_SECTIONS:
+            queryset = model.objects.filter(pk=subject.pk) if model is Subject else model.objects.filter(subject=subject)
+            payload[section] = {'upserts': [serialize(obj) for obj in queryset], 'deleted': []}
+        return payload
+
+    # 同一对象的多次变更只保留最后一次
+    latest = {}
+    changes = CatalogChange.objects.filter(
+        subject_pk=subject.pk,
+        id__gt=since_version,
+        id__lte=current_version,
+    ).values_list('model', 'object_id', 'deleted')
+    for model_name, object_id, deleted in changes:
+        latest[(model_name, object_id)] = deleted
+
+    for section, model_name, model, serialize in SYNC_SECTIONS:
+        changed_ids = {oid for (name, oid), deleted in latest.items() if name == model_name and not deleted}
+        deleted_ids = {oid for (name, oid), deleted in latest.items() if name == model_name and deleted}
+        upserts = [serialize(obj) for obj in model.objects.filter(pk__in=changed_ids)] if changed_ids else []
+        # 日志显示已更新但查询不到的对象，视为已删除
+        deleted_ids.update(changed_ids - {row['id'] for row in upserts})
+        payload[section] = {'upserts': upserts, 'deleted': sorted(deleted_ids)}
+    return payload
+
+
+def _tags_payload(user, subject, since):
+    question_tags = UserTag.objects.filter(user=user, question__subject=subject)
+    paper_tags = PastPaperTag.objects.filter(user=user, past_paper__subject=subject)
+    if since is not None:
+        question_tags = question_tags.filter(updated_at__gt=since - TAGS_OVERLAP)
+        paper_tags = paper_tags.filter(updated_at__gt=since - TAGS_OVERLAP)
+
+    question_rows = list(question_tags.values_list('question_id', 'kill', 'saved', 'updated_at'))
+    paper_rows = list(paper_tags.values_list('past_paper_id', 'kill', 'saved', 'updated_at'))
+    newest = max([row[3] for row in question_rows + paper_rows] + ([since] if since else []), default=None)
+
+    return {
+        'questions': [{'id': qid, 'checked': kill, 'save': saved} for qid, kill, saved, _ in question_rows],
+        'past_papers': [{'id': ppid, 'checked': kill, 'save': saved} for ppid, kill, saved, _ in paper_rows],
+    }, newest
+
+
+def parse_tags_since(value):
+    """空值表示全量；格式不合法时抛出 ValueError"""
+    if not value:
+        return None
+    since = parse_datetime(value)
+    if since is None:
+        raise ValueError('tags_since must be an ISO 8601 datetime')
+    if timezone.is_naive(since):
+        since = timezone.make_aware(since, timezone.get_current_timezone())
+    return since
+
+
+def build_sync_payload(user, subject, since_version, tags_since_raw):
+    """组装同步响应；客户端保存返回的 catalog_version 和 tags_version 作为下次的水位线"""
+    current_version = catalog_version()
+    tags_since = parse_tags_since(tags_since_raw)
+
+    payload = {'subject': subject.code, 'catalog_version': current_version}
+    payload.update(_catalog_payload(subject, since_version, current_version))
+    payload['tags'], newest = _tags_payload(user, subject, tags_since)
+    payload['tags_version'] = newest.isoformat() if newest else None
+    return payload
+
+
+MAX_BATCH_OPS = 500
+
+
+def _op_state(op):
+    """与 update_user_tags 相同的规则：kill 优先，其次 save；都为 0 时不修改"""
+    if str(op.get('kill', '0')) == '1':
+        return True, False
+    if str(op.get('save', '0')) == '1':
+        return False, True
+    return None
+
+
+def _validate_ops(ops):
+    if not isinstance(ops, list):
+        raise ValueError('ops must be a list')
+    if len(ops) > MAX_BATCH_OPS:
+        raise ValueError(f'At most {MAX_BATCH_OPS} ops per batch')
+    for op in ops:
+        if not isinstance(op, dict):
+            raise ValueError('each op must be an object')
+        seq = op.get('seq')
+        if isinstance(seq, bool) or not isinstance(seq, int) or seq <= 0:
+            raise ValueError('each op needs a positive integer seq')
+    return sorted(ops, key=lambda op: op['seq'])
+
+
+def apply_tag_batch(user, client_id, ops):
+    """
+    在一个事务内按序号顺序应用一批标签操作。
+    同一题目/试卷只保留最后一次状态，用单条 upsert 语句写入；
+    已应用过的序号（重试）直接跳过，保证幂等。
+    """
+    ops = _validate_ops(ops)
+    results = []
+
+    with transaction.atomic():
+        cursor, _ = TagSyncCursor.objects.select_for_update().get_or_create(user=user, client_id=client_id)
+        last_seq = cursor.last_seq
+
+        pending = []
+        for op in ops:
+            if op['seq'] <= last_seq:
+                results.append({'seq': op['seq'], 'status': 'duplicate'})
+            else:
+                pending.append(op)
+
+        question_ids = {
+            str(op.get('id')) for op in pending if op.get('item_type', 'question') == 'question'
+        }
+        paper_codes = {str(op.get('code')) for op in pending if op.get('item_type') == 'past_paper'}
+        valid_questions = set(
+            Question.objects.filter(id__in=[int(qid) for qid in question_ids if qid.isdigit()])
+            .values_list('id', flat=True)
+        )
+        paper_ids = dict(PastPaper.objects.filter(code__in=paper_codes).values_list('code', 'id'))
+
+        question_states = {}
+        paper_states = {}
+        for op in pending:
+            state = _op_state(op)
+            item_type = op.get('item_type', 'question')
+            if item_type == 'past_paper':
+                target = paper_ids.get(str(op.get('code')))
+                states = paper_states
+            elif item_type == 'question':
+                target = int(op['id']) if str(op.get('id')).isdigit() else None
+                target = target if target in valid_questions else None
+                states = question_states
+            else:
+                results.append({'seq': op['seq'], 'status': 'invalid'})
+                continue
+
+            if target is None:
+                results.append({'seq': op['seq'], 'status': 'not_found'})
+                continue
+            if state is not None:
+                states[target] = state
+            results.append({'seq': op['seq'], 'status': 'applied'})
+
+        if question_states:
+            UserTag.objects.bulk_create(
+                [
+                    UserTag(user=user, question_id=qid, kill=kill, saved=saved)
+                    for qid, (kill, saved) in question_states.items()
+                ],
+                update_conflicts=True,
+                unique_fields=['user', 'question'],
+                update_fields=['kill', 'saved', 'updated_at'],
+            )
+        if paper_states:
+            PastPaperTag.objects.bulk_create(
+                [
+                    PastPaperTag(user=user, past_paper_id=ppid, kill=kill, saved=saved)
+                    for ppid, (kill, saved) in paper_states.items()
+                ],
+                update_conflicts=True,
+                unique_fields=['user', 'past_paper'],
+                update_fields=['kill', 'saved', 'updated_at'],
+            )
+
+        if pending:
+            cursor.last_seq = pending[-1]['seq']
+            cursor.save(update_fields=['last_seq', 'updated_at'])
+
+    results.sort(key=lambda row: row['seq'])
+    return {
+        'applied_seq': cursor.last_seq,
+        'results': results,
+        'states': {
+            'questions': [{'id': qid, 'kill': k, 'saved': sv} for qid, (k, sv) in question_states.items()],
+            'past_papers': [
+                {'code': code, 'kill': paper_states[ppid][0], 'saved': paper_states[ppid][1]}
+                for code, ppid in paper_ids.items() if ppid in paper_states
+            ],
+        },
+    }
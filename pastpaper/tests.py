@@ -1,3 +1,836 @@
-from django.test import TestCase
+import asyncio
+import base64
+import cProfile
+import io
+import json
+import os
+import re
+import shutil
+import subprocess
+import tempfile
+import threading
+import time
+from datetime import timedelta
+from unittest import mock, skipUnless
 
-# Create your tests here.
+from asgiref.sync import async_to_sync
+
+from django.contrib.auth.models import Group, User
+from django.contrib.staticfiles import finders
+from django.core.cache import cache
+from django.core.handlers.asgi import ASGIHandler
+from django.core.management import call_command
+from django.http import FileResponse, HttpResponse, StreamingHttpResponse
+from django.middleware.csrf import get_token
+from django.test import RequestFactory, SimpleTestCase, TestCase, override_settings
+from django.urls import path, reverse
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from django.utils.http import http_date
+
+from config.compression import CompressionMiddleware, serve_media
+from config.metrics import AGGREGATE_NAME, HOSTNAME, MetricsStore, metrics_view
+from config.middleware import RequestMetrics, _current, _timed
+
+from .analytics import get_watermark, refresh_summaries
+from .columnar import COLUMNAR_CONTENT_TYPE, TAG_CHECKED, TAG_SAVED
+from .models import (
+    CatalogChange,
+    DailyActivity,
+    HistoryRecord,
+    PastPaper,
+    PastPaperTag,
+    Question,
+    QuestionStats,
+    RequestProfile,
+    Subject,
+    Unit,
+    UserTag,
+)
+from .pagination import PAST_PAPER_KEYSET
+from .permissions import TEACHER_GROUP_NAME
+from .profiling import ProfilingMiddleware
+from .warmup import catalog_cache_warm, warm_catalog
+
+# 页面体积预算（字节，未压缩）：(HTML 文档, 页面引用的本地 JS 合计)。
+# 页面脚本应放在 static/js 中由浏览器长期缓存，不应内联在模板里；PDF.js 只在打开查看器时加载。
+PAGE_BUDGETS = {
+    'accounts:login': (6_000, 100_000),
+    'accounts:register': (6_000, 100_000),
+    'pastpaper:home': (12_000, 150_000),
+    'pastpaper:create_question': (14_000, 140_000),
+    'pastpaper:theme_settings': (10_000, 120_000),
+}
+
+# 单个页面中内联 <script> 的总字节数上限
+INLINE_SCRIPT_BUDGET = 2_000
+
+_script_re = re.compile(r'<script\b([^>]*)>(.*?)</script>', re.S | re.I)
+_src_re = re.compile(r'\bsrc="([^"]+)"')
+
+# 测试中不读取 collectstatic 生成的 manifest，static 标签直接返回原文件名
+PLAIN_STORAGES = {
+    'default': {'BACKEND': 'django.core.files.storage.FileSystemStorage'},
+    'staticfiles': {'BACKEND': 'django.contrib.staticfiles.storage.StaticFilesStorage'},
+}
+
+
+@override_settings(
+    STORAGES=PLAIN_STORAGES,
+    CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}},
+    COMPRESS_RESPONSES=False,
+)
+class PageWeightTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        Subject.objects.create(code='cs', name='Computer Science', exam_code='9618')
+        cls.user = User.objects.create_user('budget', password='budget-pass', is_staff=True)
+
+    def page(self, name):
+        if name.startswith('pastpaper:'):
+            self.client.force_login(self.user)
+        else:
+            self.client.logout()
+        response = self.client.get(reverse(name))
+        self.assertEqual(response.status_code, 200, name)
+        return response.content.decode()
+
+    def scripts(self, html):
+        """返回 (外部脚本路径列表, 内联脚本字节数)"""
+        sources, inline = [], 0
+        for attrs, body in _script_re.findall(html):
+            match = _src_re.search(attrs)
+            if match:
+                sources.append(match.group(1))
+            else:
+                inline += len(body.encode())
+        return sources, inline
+
+    def test_pages_within_budget(self):
+        for name, (html_budget, js_budget) in PAGE_BUDGETS.items():
+            with self.subTest(page=name):
+                html = self.page(name)
+                sources, inline = self.scripts(html)
+                js_bytes = 0
+                for src in sources:
+                    if src.startswith('/static/'):
+                        path = finders.find(src.removeprefix('/static/'))
+                        self.assertIsNotNone(path, src)
+                        with open(path, 'rb') as fh:
+                            js_bytes += len(fh.read())
+                self.assertLessEqual(len(html.encode()), html_budget)
+                self.assertLessEqual(js_bytes + inline, js_budget)
+                self.assertLessEqual(inline, INLINE_SCRIPT_BUDGET)
+
+    def test_pdfjs_not_loaded_eagerly(self):
+        for name in PAGE_BUDGETS:
+            with self.subTest(page=name):
+                sources, _ = self.scripts(self.page(name))
+                self.assertFalse([src for src in sources if 'pdf' in src.rsplit('/', 1)[-1]])
+
+
+class ProfilingMiddlewareTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user('profiler', password='profiler-pass', is_staff=True)
+
+    def setUp(self):
+        profile_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, profile_dir, ignore_errors=True)
+        settings_override = override_settings(PROFILE_DIR=profile_dir, PROFILE_SAMPLE_RATE=0)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+    def profiled_request(self, path):
+        request = RequestFactory().get(path, {'_profile': '1'})
+        request.user = self.user
+        return request
+
+    def test_overlapping_requests_profile_one_and_serve_both(self):
+        responses = {}
+
+        def get_response(request):
+            if request.path == '/outer/':
+                # 外层请求剖析进行中，另一个线程里的请求同样要求剖析
+                thread = threading.Thread(
+                    target=lambda: responses.update(inner=middleware(self.profiled_request('/inner/')))
+                )
+                thread.start()
+                thread.join()
+            return HttpResponse(request.path)
+
+        middleware = ProfilingMiddleware(get_response)
+        with mock.patch('cProfile.Profile', wraps=cProfile.Profile) as profile_class:
+            outer = middleware(self.profiled_request('/outer/'))
+
+        self.assertEqual(profile_class.call_count, 1)
+        self.assertEqual(outer.status_code, 200)
+        self.assertEqual(responses['inner'].status_code, 200)
+        self.assertIn('X-Profile-Id', outer)
+        self.assertNotIn('X-Profile-Id', responses['inner'])
+        self.assertEqual(RequestProfile.objects.count(), 1)
+        # 剖析结束后下一个请求可以再次剖析
+        self.assertIn('X-Profile-Id', middleware(self.profiled_request('/next/')))
+
+    def test_profiler_start_failure_serves_request(self):
+        middleware = ProfilingMiddleware(lambda request: HttpResponse('ok'))
+        threads = threading.active_count()
+        with mock.patch('cProfile.Profile.enable', side_effect=ValueError('Another profiling tool is already active')):
+            with self.assertLogs('pastpaper.profiling', 'ERROR'):
+                response = middleware(self.profiled_request('/failing/'))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn('X-Profile-Id', response)
+        self.assertEqual(threading.active_count(), threads)
+        self.assertIn('X-Profile-Id', middleware(self.profiled_request('/next/')))
+
+    def test_download_requires_view_permission(self):
+        ProfilingMiddleware(lambda request: HttpResponse('ok'))(self.profiled_request('/profiled/'))
+        url = reverse('admin:pastpaper_requestprofile_download', args=[RequestProfile.objects.get().pk, 'stats'])
+
+        self.client.force_login(self.user)
+        self.assertEqual(self.client.get(url).status_code, 403)
+
+        self.client.force_login(User.objects.create_superuser('profile-admin', password='admin-pass'))
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        response.close()
+
+
+@override_settings(
+    STORAGES=PLAIN_STORAGES,
+    CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}},
+    COMPRESS_RESPONSES=False,
+)
+class RolesCacheTests(TestCase):
+    def test_group_changes_apply_on_next_request(self):
+        group = Group.objects.create(name=TEACHER_GROUP_NAME)
+        teacher = User.objects.create_user('roles-teacher', password='teacher-pass')
+        self.client.force_login(teacher)
+        url = reverse('pastpaper:teacher_dashboard')
+        self.assertEqual(self.client.get(url).status_code, 302)
+
+        teacher.groups.add(group)
+        self.assertEqual(self.client.get(url).status_code, 200)
+        # 角色已缓存；移出教师组（m2m_changed）后下一个请求即失去权限
+        self.assertEqual(self.client.get(url).status_code, 200)
+        teacher.groups.remove(group)
+        self.assertEqual(self.client.get(url).status_code, 302)
+
+        group.user_set.add(teacher)
+        self.assertEqual(self.client.get(url).status_code, 200)
+        group.user_set.clear()
+        self.assertEqual(self.client.get(url).status_code, 302)
+
+        group.user_set.add(teacher)
+        self.assertEqual(self.client.get(url).status_code, 200)
+        group.delete()
+        self.assertEqual(self.client.get(url).status_code, 302)
+
+
+class MetricsStoreTests(SimpleTestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory, ignore_errors=True)
+
+    def write_snapshot(self, name, host, pid, requests, inflight=0):
+        with open(os.path.join(self.directory, name), 'w', encoding='utf-8') as fh:
+            json.dump({
+                'host': host, 'pid': pid, 'started': None,
+                'counters': [['courser_http_requests_total', [], requests]],
+                'gauges': [['courser_inflight_requests', [], inflight]],
+                'histograms': [],
+            }, fh)
+        return os.path.join(self.directory, name)
+
+    def requests_total(self, store):
+        counters, gauges, _ = store.collect()
+        return counters[('courser_http_requests_total', ())], gauges[('courser_inflight_requests', ())]
+
+    def test_exited_processes_fold_into_aggregate(self):
+        store = MetricsStore(self.directory, 1, stale_seconds=60)
+        # 同一主机上已退出的进程（pid 不存在）与超过 stale_seconds 未更新的其他容器进程
+        dead = self.write_snapshot(f'{HOSTNAME}-999999999-a.json', HOSTNAME, 999999999, 5, inflight=1)
+        stale = self.write_snapshot('other-7-b.json', 'other', 7, 3)
+        os.utime(stale, (0, 0))
+        live = self.write_snapshot('other-7-c.json', 'other', 7, 2, inflight=1)
+
+        self.assertEqual(self.requests_total(store), (10, 1))
+        self.assertFalse(os.path.exists(dead))
+        self.assertFalse(os.path.exists(stale))
+        self.assertTrue(os.path.exists(live))
+        self.assertTrue(os.path.exists(os.path.join(self.directory, AGGREGATE_NAME)))
+        # 再次读取不会重复计数
+        self.assertEqual(self.requests_total(store), (10, 1))
+
+    def test_idle_process_folded_by_another_is_not_double_counted(self):
+        idle = MetricsStore(self.directory, 1, stale_seconds=60)
+        idle.inc('courser_http_requests_total', value=4)
+        idle.flush()
+        os.remove(idle.path)
+        with open(os.path.join(self.directory, AGGREGATE_NAME), 'w', encoding='utf-8') as fh:
+            json.dump({'counters': [['courser_http_requests_total', [], 4]], 'gauges': [], 'histograms': []}, fh)
+
+        idle.inc('courser_http_requests_total', value=1)
+        idle.flush()
+        reader = MetricsStore(self.directory, 1, stale_seconds=60)
+        self.assertEqual(self.requests_total(reader), (5, 0))
+
+
+class MetricsAccessTests(SimpleTestCase):
+    def status(self, remote_addr, **headers):
+        return metrics_view(RequestFactory().get('/metrics/', REMOTE_ADDR=remote_addr, **headers)).status_code
+
+    @override_settings(METRICS_TOKEN='')
+    def test_without_token_only_loopback_is_allowed(self):
+        self.assertEqual(self.status('127.0.0.1'), 200)
+        self.assertEqual(self.status('::1'), 200)
+        self.assertEqual(self.status('172.18.0.5'), 403)
+        self.assertEqual(self.status(''), 403)
+
+    @override_settings(METRICS_TOKEN='scrape-token')
+    def test_token_is_required_from_any_address(self):
+        self.assertEqual(self.status('127.0.0.1'), 403)
+        self.assertEqual(self.status('172.18.0.5', HTTP_AUTHORIZATION='Bearer wrong'), 403)
+        self.assertEqual(self.status('172.18.0.5', HTTP_AUTHORIZATION='Bearer scrape-token'), 200)
+
+
+class RequestTimingTests(SimpleTestCase):
+    def test_nested_render_counted_once(self):
+        # 表单控件在页面模板渲染过程中再次调用模板引擎，只应计最外层
+        def render(depth):
+            time.sleep(0.02)
+            if depth:
+                render_timed(depth - 1)
+
+        render_timed = _timed('template_ms', render)
+        metrics = RequestMetrics()
+        token = _current.set(metrics)
+        try:
+            started = time.perf_counter()
+            render_timed(2)
+            elapsed_ms = (time.perf_counter() - started) * 1000
+        finally:
+            _current.reset(token)
+        self.assertLessEqual(metrics.template_ms, elapsed_ms)
+        self.assertFalse(any(metrics.timer_depth.values()))
+
+
+@override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+class ReadinessTests(TestCase):
+    def test_cold_catalog_is_not_ready_and_warms_in_background(self):
+        cache.clear()
+        with mock.patch('config.urls.warm_catalog_in_background') as warm:
+            response = self.client.get(reverse('readyz'))
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(response.json()['checks']['catalog'], 'warming')
+        warm.assert_called_once_with()
+
+        warm_catalog()
+        response = self.client.get(reverse('readyz'))
+        self.assertEqual(response.json()['checks']['catalog'], 'ok')
+
+
+@override_settings(
+    STORAGES=PLAIN_STORAGES,
+    CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}},
+    SESSION_ENGINE='django.contrib.sessions.backends.cache',
+    COMPRESS_RESPONSES=False,
+)
+class CacheGenerationTests(TestCase):
+    def test_invalidation_keeps_cached_sessions(self):
+        subject = Subject.objects.create(code='cs', name='Old Subject Name', exam_code='9618')
+        self.client.force_login(User.objects.create_user('generation', password='generation-pass'))
+        self.assertContains(self.client.get(reverse('pastpaper:home')), 'Old Subject Name')
+
+        # 绕过信号直接改库：题库版本不变，导航栏片段和学科列表仍命中缓存
+        Subject.objects.filter(pk=subject.pk).update(name='Informatics')
+        self.assertContains(self.client.get(reverse('pastpaper:home')), 'Old Subject Name')
+
+        call_command('warm_caches', clear=True, stdout=io.StringIO())
+        self.assertTrue(catalog_cache_warm())
+        response = self.client.get(reverse('pastpaper:home'))
+        self.assertTrue(response.wsgi_request.user.is_authenticated)
+        self.assertContains(response, 'Informatics')
+        self.assertNotContains(response, 'Old Subject Name')
+
+
+class CompressionTests(SimpleTestCase):
+    def setUp(self):
+        self.factory = RequestFactory()
+        self.middleware = CompressionMiddleware(lambda request: HttpResponse())
+
+    def compress(self, request):
+        response = HttpResponse(b'<p>csrfmiddlewaretoken</p>' * 200, content_type='text/html')
+        return self.middleware.process_response(request, response)
+
+    def test_pages_with_csrf_token_use_padded_gzip(self):
+        request = self.factory.get('/', HTTP_ACCEPT_ENCODING='gzip, br')
+        self.assertEqual(self.compress(request)['Content-Encoding'], 'br')
+
+        get_token(request)
+        self.assertEqual(self.compress(request)['Content-Encoding'], 'gzip')
+
+        # 只接受 brotli 的客户端拿到未压缩的页面
+        request = self.factory.get('/', HTTP_ACCEPT_ENCODING='br')
+        get_token(request)
+        self.assertFalse(self.compress(request).has_header('Content-Encoding'))
+
+    def test_not_modified_media_varies_on_accept_encoding(self):
+        with tempfile.TemporaryDirectory() as root:
+            with open(os.path.join(root, 'notes.txt'), 'w') as fh:
+                fh.write('notes')
+            request = self.factory.get('/media/notes.txt', HTTP_IF_MODIFIED_SINCE=http_date(time.time() + 60))
+            response = serve_media(request, 'notes.txt', document_root=root)
+        self.assertEqual(response.status_code, 304)
+        self.assertIn('Accept-Encoding', response['Vary'])
+
+
+@override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+class ExportFilenameTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        Subject.objects.create(code='cs', name='Computer Science', exam_code='9618')
+        cls.user = User.objects.create_user('exporter', password='exporter-pass', is_staff=True)
+
+    def setUp(self):
+        self.client.force_login(self.user)
+
+    def test_filename_uses_known_subject_code(self):
+        response = self.client.get(reverse('pastpaper:export_progress'), {'subject': 'cs'})
+        self.assertEqual(response.status_code, 200)
+        self.assertRegex(response['Content-Disposition'], r'^attachment; filename="progress-tags-cs-[\d-]+\.csv"$')
+
+    def test_unknown_subject_is_rejected(self):
+        response = self.client.get(reverse('pastpaper:export_progress'), {'subject': 'cs"\r\nX-Injected: 1'})
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(response.has_header('X-Injected'))
+
+
+class _CountingFile(io.BytesIO):
+    """记录已读取的块数"""
+
+    def __init__(self, data):
+        super().__init__(data)
+        self.reads = 0
+
+    def read(self, size=-1):
+        self.reads += 1
+        return super().read(size)
+
+
+_streamed = {}
+
+
+def _stream_generator_view(request):
+    def rows():
+        for index in range(50):
+            _streamed['produced'] = index + 1
+            yield f'{index},{"x" * 1000}\n'
+    return StreamingHttpResponse(rows(), content_type='text/csv')
+
+
+def _stream_file_view(request):
+    _streamed['file'] = _CountingFile(b'%PDF' * 100_000)
+    return FileResponse(_streamed['file'], content_type='application/pdf')
+
+
+urlpatterns = [
+    path('stream/rows/', _stream_generator_view),
+    path('stream/file/', _stream_file_view),
+]
+
+
+@override_settings(ROOT_URLCONF=__name__)
+class AsyncStreamingTests(SimpleTestCase):
+    def serve(self, path, progress):
+        """通过 ASGIHandler 处理请求，返回发送第一个响应体消息时的读取进度和响应体"""
+        seen = []
+        body = []
+
+        async def receive():
+            if not seen:
+                seen.append(None)
+                return {'type': 'http.request', 'body': b'', 'more_body': False}
+            await asyncio.Event().wait()
+
+        async def send(message):
+            if message['type'] == 'http.response.body':
+                if len(body) == 0:
+                    seen.append(progress())
+                body.append(message.get('body', b''))
+
+        scope = {
+            'type': 'http', 'asgi': {'version': '3.0'}, 'http_version': '1.1', 'method': 'GET',
+            'scheme': 'http', 'path': path, 'raw_path': path.encode(), 'query_string': b'', 'root_path': '',
+            'headers': [(b'host', b'testserver')], 'client': ('127.0.0.1', 1234), 'server': ('testserver', 80),
+        }
+        async_to_sync(ASGIHandler())(scope, receive, send)
+        return seen[1], b''.join(body)
+
+    def test_generator_is_sent_while_it_runs(self):
+        produced, body = self.serve('/stream/rows/', lambda: _streamed['produced'])
+        self.assertEqual(body.count(b'\n'), 50)
+        self.assertLess(produced, 50)
+
+    def test_file_is_sent_while_it_is_read(self):
+        reads, body = self.serve('/stream/file/', lambda: _streamed['file'].reads)
+        self.assertEqual(len(body), 400_000)
+        # ASGIHandler 以 chunk_size 为块大小读取 FileResponse
+        self.assertLess(reads, 400_000 // ASGIHandler.chunk_size)
+
+
+@override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+class SyncTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.subject = Subject.objects.create(code='cs', name='Computer Science', exam_code='9618')
+        cls.unit = Unit.objects.create(subject=cls.subject, unit_num=1, name='Data')
+        cls.questions = [
+            Question.objects.create(code=f'9618_s23_1{i}_q1', unit=cls.unit, subject=cls.subject, qpage=1, apage=1)
+            for i in range(3)
+        ]
+        cls.user = User.objects.create_user('syncer', password='syncer-pass')
+
+    def setUp(self):
+        self.client.force_login(self.user)
+
+    def sync(self, **params):
+        response = self.client.post(reverse('pastpaper:sync'), {'subject': 'cs', **params})
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def test_delta_returns_upserts_and_tombstones(self):
+        first = self.sync()
+        self.assertTrue(first['full'])
+        self.assertEqual(len(first['questions']['upserts']), 3)
+
+        deleted_id = self.questions[0].id
+        self.questions[0].delete()
+        self.questions[1].qpage = 7
+        self.questions[1].save()
+
+        delta = self.sync(catalog_version=first['catalog_version'])
+        self.assertFalse(delta['full'])
+        self.assertEqual(delta['questions']['deleted'], [deleted_id])
+        self.assertEqual([row['id'] for row in delta['questions']['upserts']], [self.questions[1].id])
+        self.assertGreater(delta['catalog_version'], first['catalog_version'])
+
+        # 水位线已是最新时没有变化
+        again = self.sync(catalog_version=delta['catalog_version'])
+        self.assertEqual(again['questions'], {'upserts': [], 'deleted': []})
+
+    def test_version_older_than_pruned_log_gets_full_snapshot(self):
+        first = self.sync()
+        self.questions[0].save()
+        CatalogChange.objects.update(changed_at=timezone.now() - timedelta(days=365))
+        call_command('prune_catalog_changes', days=30, stdout=io.StringIO())
+
+        self.assertEqual(CatalogChange.objects.count(), 1)
+        self.assertEqual(self.sync()['catalog_version'], CatalogChange.objects.get().id)
+        self.assertTrue(self.sync(catalog_version=first['catalog_version'] - 1)['full'])
+        self.assertFalse(self.sync(catalog_version=first['catalog_version'])['full'])
+
+    def test_tags_committed_late_are_not_skipped(self):
+        UserTag.objects.create(user=self.user, question=self.questions[0], kill=True)
+        first = self.sync()
+        self.assertEqual([row['id'] for row in first['tags']['questions']], [self.questions[0].id])
+
+        # 时间戳早于水位线、但在上次同步之后才提交的标签
+        tag = UserTag.objects.create(user=self.user, question=self.questions[1], saved=True)
+        UserTag.objects.filter(pk=tag.pk).update(
+            updated_at=parse_datetime(first['tags_version']) - timedelta(seconds=1),
+        )
+        delta = self.sync(tags_since=first['tags_version'])
+        self.assertIn(self.questions[1].id, [row['id'] for row in delta['tags']['questions']])
+        self.assertEqual(delta['tags_version'], first['tags_version'])
+
+    def test_malformed_tags_since_is_rejected(self):
+        response = self.client.post(reverse('pastpaper:sync'), {'subject': 'cs', 'tags_since': 'yesterday'})
+        self.assertEqual(response.status_code, 400)
+
+
+@override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+class AnalyticsRefreshTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        subject = Subject.objects.create(code='cs', name='Computer Science', exam_code='9618')
+        unit = Unit.objects.create(subject=subject, unit_num=1, name='Data')
+        cls.question = Question.objects.create(code='9618_s23_11_q1', unit=unit, subject=subject, qpage=1, apage=1)
+        cls.students = [User.objects.create_user(f'student{i}', password='student-pass') for i in range(3)]
+        for student in cls.students:
+            UserTag.objects.create(user=student, question=cls.question, kill=True)
+            HistoryRecord.objects.create(user=student, question=cls.question)
+
+    def refresh(self):
+        result = refresh_summaries()
+        stats = QuestionStats.objects.get(question=self.question)
+        return result, stats.kill_count, DailyActivity.objects.get().active_users
+
+    def test_membership_changes_trigger_full_refresh(self):
+        result, kills, active = self.refresh()
+        self.assertEqual((result['students'], kills, active), (3, 3, 3))
+        self.assertFalse(self.refresh()[0]['full'])
+
+        # 以下变化都不更新标签的 updated_at
+        Group.objects.get_or_create(name=TEACHER_GROUP_NAME)[0].user_set.add(self.students[0])
+        result, kills, active = self.refresh()
+        self.assertTrue(result['full'])
+        self.assertEqual((result['students'], kills, active), (2, 2, 2))
+
+        User.objects.filter(pk=self.students[1].pk).update(is_active=False)
+        result, kills, active = self.refresh()
+        self.assertEqual((result['students'], kills, active), (1, 1, 1))
+
+        self.students[2].delete()
+        result = refresh_summaries()
+        self.assertTrue(result['full'])
+        self.assertEqual(result['students'], 0)
+        self.assertEqual(QuestionStats.objects.get(question=self.question).kill_count, 0)
+        self.assertFalse(DailyActivity.objects.exists())
+
+    def test_failed_refresh_keeps_watermark(self):
+        refresh_summaries()
+        watermark = get_watermark()
+        with mock.patch('pastpaper.analytics.refresh_past_paper_stats', side_effect=RuntimeError):
+            with self.assertRaises(RuntimeError):
+                refresh_summaries()
+        self.assertEqual(get_watermark(), watermark)
+
+
+class TagBatchTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        subject = Subject.objects.create(code='cs', name='Computer Science', exam_code='9618')
+        unit = Unit.objects.create(subject=subject, unit_num=1, name='Data')
+        cls.questions = [
+            Question.objects.create(code=f'9618_s23_1{i}_q1', unit=unit, subject=subject, qpage=1, apage=1)
+            for i in range(3)
+        ]
+        cls.user = User.objects.create_user('tagger', password='tagger-pass')
+
+    def setUp(self):
+        self.client.force_login(self.user)
+
+    def send(self, ops, client_id='tab-1'):
+        response = self.client.post(
+            reverse('pastpaper:update_user_tags_batch'),
+            json.dumps({'client_id': client_id, 'ops': ops}),
+            content_type='application/json',
+        )
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def op(self, seq, index, kill=0, save=0):
+        return {'seq': seq, 'item_type': 'question', 'id': self.questions[index].id, 'kill': kill, 'save': save}
+
+    def tag(self, index):
+        return UserTag.objects.filter(user=self.user, question=self.questions[index]).values_list('kill', 'saved').first()
+
+    def test_replayed_batch_is_not_applied_twice(self):
+        batch = [self.op(1, 0, kill=1), self.op(2, 1, save=1)]
+        self.assertEqual(self.send(batch)['applied_seq'], 2)
+        # 两次发送之间标签被另一个客户端改过，重放不能把它改回去
+        self.send([self.op(1, 0, save=1)], client_id='tab-2')
+
+        replay = self.send(batch)
+        self.assertEqual(replay['applied_seq'], 2)
+        self.assertEqual({row['status'] for row in replay['results']}, {'duplicate'})
+        self.assertEqual(self.tag(0), (False, True))
+
+    def test_lower_seq_after_higher_is_a_duplicate(self):
+        self.send([self.op(5, 0, kill=1)])
+        result = self.send([self.op(3, 0, save=1)])
+        self.assertEqual(result['results'], [{'seq': 3, 'status': 'duplicate'}])
+        self.assertEqual(result['applied_seq'], 5)
+        self.assertEqual(self.tag(0), (True, False))
+
+    def test_partially_applied_batch_applies_only_new_ops(self):
+        self.send([self.op(1, 0, kill=1), self.op(2, 1, kill=1)])
+        # 重试时队列中多了新操作；同一题目以序号最大的操作为准，不存在的题目单独报告
+        result = self.send([
+            self.op(1, 0, kill=1),
+            self.op(2, 1, kill=1),
+            self.op(3, 1, save=1),
+            {'seq': 4, 'item_type': 'question', 'id': 999_999, 'kill': 1},
+            self.op(5, 2, kill=1),
+        ])
+        self.assertEqual(
+            [(row['seq'], row['status']) for row in result['results']],
+            [(1, 'duplicate'), (2, 'duplicate'), (3, 'applied'), (4, 'not_found'), (5, 'applied')],
+        )
+        self.assertEqual(result['applied_seq'], 5)
+        self.assertEqual([self.tag(0), self.tag(1), self.tag(2)], [(True, False), (False, True), (True, False)])
+
+    def test_client_ids_have_independent_sequences(self):
+        # 每个标签页有自己的 client_id，相同的序号不会互相覆盖
+        self.send([self.op(1, 0, kill=1)], client_id='tab-1')
+        result = self.send([self.op(1, 1, save=1)], client_id='tab-2')
+        self.assertEqual(result['results'], [{'seq': 1, 'status': 'applied'}])
+        self.assertEqual([self.tag(0), self.tag(1)], [(True, False), (False, True)])
+
+
+def _cursor(values):
+    return base64.urlsafe_b64encode(json.dumps(values).encode()).decode().rstrip('=')
+
+
+@override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+class KeysetPaginationTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.subject = Subject.objects.create(code='cs', name='Computer Science', exam_code='9618')
+        unit = Unit.objects.create(subject=cls.subject, unit_num=1, name='Data')
+        for i in range(7):
+            Question.objects.create(code=f'9618_q{i}', unit=unit, subject=cls.subject, qpage=1, apage=1)
+        # 排序字段相同的行只能靠最后的唯一字段区分
+        Question.objects.update(created_at=timezone.now())
+        for i in range(5):
+            PastPaper.objects.create(code=f'9618_s23_1{i}', subject=cls.subject, year=2023, session='s', paper_num='1')
+        cls.user = User.objects.create_user('pager', password='pager-pass')
+
+    def setUp(self):
+        self.client.force_login(self.user)
+
+    def fetch(self, name, cursor=None, **params):
+        data = {'subject': 'cs', 'limit': 3, **params}
+        if cursor:
+            data['cursor'] = cursor
+        return self.client.post(reverse(f'pastpaper:{name}'), data)
+
+    def walk(self, name, **params):
+        ids, cursor = [], None
+        while True:
+            payload = self.fetch(name, cursor, **params).json()
+            ids.extend(item['code'] for item in payload['items'])
+            cursor = payload['next_cursor']
+            if cursor is None:
+                return ids
+
+    def test_pages_cover_every_row_once_in_order_despite_ties(self):
+        questions = list(Question.objects.order_by('-created_at', '-id').values_list('code', flat=True))
+        self.assertEqual(self.walk('get_list', unit=1), questions)
+        papers = list(PastPaper.objects.order_by('-year', 'session', 'paper_num', 'id').values_list('code', flat=True))
+        self.assertEqual(self.walk('get_past_papers'), papers)
+
+    def test_cursor_round_trip(self):
+        first = self.fetch('get_past_papers').json()
+        self.assertEqual(first['total'], 5)
+        last_row = PastPaper.objects.get(code=first['items'][-1]['code'])
+        self.assertEqual(PAST_PAPER_KEYSET.decode(first['next_cursor']), [2023, 's', '1', last_row.id])
+        second = self.fetch('get_past_papers', first['next_cursor']).json()
+        self.assertNotIn('total', second)
+        self.assertEqual(len(second['items']), 2)
+
+    def test_tampered_cursor_is_rejected(self):
+        stamp = timezone.now().isoformat()
+        for cursor in [
+            'not base64 at all!',
+            'é',
+            _cursor({'id': 1}),
+            _cursor([stamp]),
+            _cursor(['yesterday', 1]),
+            _cursor([stamp, 'one']),
+            _cursor([stamp, None]),
+            _cursor([stamp, [1]]),
+            base64.urlsafe_b64encode(b'[1, NaN]').decode(),
+        ]:
+            with self.subTest(cursor=cursor):
+                response = self.fetch('get_list', cursor, unit=1)
+                self.assertEqual(response.status_code, 400)
+                self.assertEqual(response.json(), {'error': 'Invalid cursor'})
+        response = self.fetch('get_past_papers', _cursor(['2023', {'s': 1}, '1', 1]))
+        self.assertEqual(response.status_code, 400)
+
+
+def _decode_columns(data):
+    """与 static/js/columnar.js 的 decodeColumns 相同的还原规则"""
+    rows = []
+    for index in range(data['count']):
+        row = dict(data['shared'])
+        row.update({name: values[index] for name, values in data['columns'].items()})
+        if 'tags' in row:
+            tags = row.pop('tags')
+            row['checked'] = bool(tags & TAG_CHECKED)
+            row['save'] = bool(tags & TAG_SAVED)
+        rows.append(row)
+    return {'items': rows, 'next_cursor': data.get('next_cursor'), 'total': data.get('total')}
+
+
+@override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+class ColumnarFormatTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        subject = Subject.objects.create(code='cs', name='Computer Science', exam_code='9618')
+        unit = Unit.objects.create(subject=subject, unit_num=4, name='Processor')
+        questions = [
+            Question.objects.create(code=f'9618_s23_1{i}-Q{i}', unit=unit, subject=subject, qpage=i, apage=2 * i)
+            for i in range(5)
+        ]
+        papers = [
+            PastPaper.objects.create(
+                code=f'9618_{season}23_1{i}', subject=subject, year=2023, session=season, paper_num=f'1{i}',
+            )
+            for i, season in enumerate('swsw')
+        ]
+        cls.user = User.objects.create_user('columns', password='columns-pass')
+        UserTag.objects.create(user=cls.user, question=questions[1], kill=True)
+        UserTag.objects.create(user=cls.user, question=questions[3], saved=True)
+        PastPaperTag.objects.create(user=cls.user, past_paper=papers[2], kill=True)
+
+    def setUp(self):
+        self.client.force_login(self.user)
+
+    def both(self, name, **params):
+        url = reverse(f'pastpaper:{name}')
+        rows = self.client.post(url, params).json()
+        response = self.client.post(url, params, HTTP_ACCEPT=COLUMNAR_CONTENT_TYPE)
+        self.assertEqual(response['Content-Type'], COLUMNAR_CONTENT_TYPE)
+        return rows, response.json()
+
+    def cases(self):
+        for name, params in [('get_list', {'unit': 4}), ('get_past_papers', {})]:
+            yield name, params
+            yield name, {**params, 'limit': 3}
+
+    def test_decoded_rows_match_json_rows(self):
+        for name, params in self.cases():
+            with self.subTest(name=name, **params):
+                rows, columns = self.both(name, **params)
+                decoded = _decode_columns(columns)
+                if 'limit' in params:
+                    self.assertEqual(decoded, {**rows, 'total': rows.get('total')})
+                else:
+                    self.assertEqual(decoded['items'], rows)
+
+    def test_shared_and_varying_fields(self):
+        _, columns = self.both('get_list', unit=4)
+        self.assertEqual(columns['shared']['unit_num'], 4)
+        self.assertIn('syllabus_url', columns['shared'])
+        self.assertEqual(columns['columns']['tags'], [0, TAG_SAVED, 0, TAG_CHECKED, 0])
+        _, empty = self.both('get_list', unit=99)
+        self.assertEqual(_decode_columns(empty)['items'], [])
+
+    @skipUnless(shutil.which('node'), 'node is not installed')
+    def test_front_end_decoder_rebuilds_json_rows(self):
+        with open(finders.find('js/columnar.js'), encoding='utf-8') as fh:
+            script = fh.read()
+        for name, params in self.cases():
+            with self.subTest(name=name, **params):
+                rows, columns = self.both(name, **params)
+                result = subprocess.run(
+                    ['node', '-e', script + (
+                        '\nlet input = "";'
+                        '\nprocess.stdin.on("data", chunk => { input += chunk; });'
+                        '\nprocess.stdin.on("end", () => {'
+                        '\n    process.stdout.write(JSON.stringify(decodeColumns(JSON.parse(input))));'
+                        '\n});'
+                    )],
+                    input=json.dumps(columns), capture_output=True, text=True, check=True, timeout=30,
+                )
+                decoded = json.loads(result.stdout)
+                if 'limit' in params:
+                    self.assertEqual(decoded['items'], rows['items'])
+                    self.assertEqual(decoded['next_cursor'], rows['next_cursor'])
+                    self.assertEqual(decoded.get('total'), rows.get('total'))
+                else:
+                    self.assertEqual(decoded['items'], rows)
@@ -1,5 +1,9 @@
+from django.conf import settings
 from django.urls import path
-from . import views
+from . import async_views, views
+
+# 这几个 JSON 接口在 ASGI 部署时换成异步版本，其余视图保持同步
+api = async_views if settings.ASYNC_VIEWS else views
 
 app_name = 'pastpaper'
 
@@ -8,20 +12,25 @@ urlpatterns = [
     path('home/', views.home_view, name='home'),
     path('home/<str:subject_code>/', views.home_view, name='home_subject'),
     path('createQuestion/', views.create_question_view, name='create_question'),
+    path('teacher/dashboard/', views.teacher_dashboard_view, name='teacher_dashboard'),
+    path('teacher/export/', views.export_progress_view, name='export_progress'),
     path('feedback/', views.feedback_view, name='feedback'),
     path('mydetails/', views.mydetails_view, name='mydetails'),
     path('theme-settings/', views.theme_settings_view, name='theme_settings'),
     
     # API endpoints
-    path('get_units/', views.get_units, name='get_units'),
-    path('get_list/', views.get_list, name='get_list'),
-    path('get_past_papers/', views.get_past_papers, name='get_past_papers'),
+    path('get_units/', api.get_units, name='get_units'),
+    path('get_list/', api.get_list, name='get_list'),
+    path('get_past_papers/', api.get_past_papers, name='get_past_papers'),
     path('get_question_info/', views.get_question_info, name='get_question_info'),
+    path('open_question/', views.open_question, name='open_question'),
     path('api/papers/by-subject/', views.list_papers_by_subject, name='list_papers_by_subject'),
     path('api/questions/by-paper/', views.get_questions_by_paper, name='get_questions_by_paper'),
     path('api/questions/save/', views.save_question, name='save_question'),
-    path('get_history/', views.get_history, name='get_history'),
-    path('update_user_tags/', views.update_user_tags, name='update_user_tags'),
-    path('update_history/', views.update_history, name='update_history'),
+    path('get_history/', api.get_history, name='get_history'),
+    path('update_user_tags/', api.update_user_tags, name='update_user_tags'),
+    path('update_user_tags/batch/', views.update_user_tags_batch, name='update_user_tags_batch'),
+    path('update_history/', api.update_history, name='update_history'),
+    path('sync/', views.sync, name='sync'),
 ]
 
@@ -1,8 +1,13 @@
+import json
+
 from django.shortcuts import render
 from django.contrib.auth.decorators import login_required, user_passes_test
-from django.http import JsonResponse
+from django.http import JsonResponse, StreamingHttpResponse
 from django.views.decorators.http import require_POST
 from django.db.models import Q
+from django.utils import timezone
+from django.utils.cache import patch_vary_headers
+from django.utils.http import content_disposition_header
 from .models import (
     Subject,
     Unit,
@@ -14,6 +19,23 @@ from .models import (
     Setting,
 )
 from .permissions import has_question_editor_privileges
+from .analytics import dashboard_data
+from .subjects import subject_context
+from .sync import apply_tag_batch, build_sync_payload, parse_catalog_version
+from .exports import EXPORT_FORMATS, export_filename, parse_export_filters, stream_export
+from .pagination import (
+    PAST_PAPER_COUNT_NAME,
+    PAST_PAPER_KEYSET,
+    QUESTION_COUNT_NAME,
+    QUESTION_KEYSET,
+    InvalidPage,
+    cached_count,
+    page_fields,
+    page_payload,
+    paginate,
+    parse_page,
+)
+from .columnar import ColumnarResponse, columnar_payload, tag_bits, wants_columnar
 
 
 question_editor_required = user_passes_test(has_question_editor_privileges)
@@ -23,92 +45,165 @@ question_editor_required = user_passes_test(has_question_editor_privileges)
 @question_editor_required
 def create_question_view(request):
     """教师端创建题目页面"""
-    subjects = Subject.objects.all().order_by('id')
-    current_subject = subjects.first() if subjects else None
-    return render(
-        request,
-        'pastpaper/create_question.html',
-        {
-            'current_subject': current_subject,
-            'all_subjects': subjects,
-        },
-    )
+    return render(request, 'pastpaper/create_question.html', subject_context(default=None))
+
+
+@login_required
+@question_editor_required
+def teacher_dashboard_view(request):
+    """教师端班级统计页面（数据来自汇总表）"""
+    context = subject_context(request.GET.get('subject'), default=None)
+    if context['current_subject'] is not None:
+        context.update(dashboard_data(context['current_subject']))
+    return render(request, 'pastpaper/teacher_dashboard.html', context)
+
+
+@login_required
+@question_editor_required
+def export_progress_view(request):
+    """流式导出学生学习进度（CSV / JSONL）"""
+    fmt = request.GET.get('format', 'csv')
+    if fmt not in EXPORT_FORMATS:
+        return JsonResponse({'error': f"format must be one of: {', '.join(EXPORT_FORMATS)}"}, status=400)
+    try:
+        filters = parse_export_filters(request.GET)
+    except ValueError as exc:
+        return JsonResponse({'error': str(exc)}, status=400)
+
+    content_type = 'text/csv; charset=utf-8' if fmt == 'csv' else 'application/x-ndjson; charset=utf-8'
+    response = StreamingHttpResponse(stream_export(filters, fmt), content_type=content_type)
+    response['Content-Disposition'] = content_disposition_header(True, export_filename(filters, fmt))
+    return response
 
 
 @login_required
 def home_view(request, subject_code='cs'):
     """主页视图"""
-    # 获取学科信息
-    try:
-        subject = Subject.objects.get(code=subject_code)
-    except Subject.DoesNotExist:
-        subject = Subject.objects.get(code='cs')  # 默认使用cs
-    
-    # 获取所有学科列表
-    all_subjects = Subject.objects.all().order_by('id')
-    
-    return render(request, 'pastpaper/home.html', {
-        'current_subject': subject,
-        'all_subjects': all_subjects
-    })
+    return render(request, 'pastpaper/home.html', subject_context(subject_code))
 
 
 @login_required
 def theme_settings_view(request):
     """主题设置页面"""
-    # 获取默认学科
-    try:
-        subject = Subject.objects.first()
-    except Subject.DoesNotExist:
-        subject = None
-
-    all_subjects = Subject.objects.all().order_by('id')
-
-    return render(request, 'pastpaper/theme_settings.html', {
-        'current_subject': subject,
-        'all_subjects': all_subjects
-    })
+    return render(request, 'pastpaper/theme_settings.html', subject_context(default=None))
 
 
 @login_required
 def feedback_view(request):
     """反馈页面视图"""
-    # 获取默认学科
-    try:
-        subject = Subject.objects.get(code='cs')
-    except Subject.DoesNotExist:
-        subject = None
-    
-    # 获取所有学科列表
-    all_subjects = Subject.objects.all().order_by('id')
-    
-    return render(request, 'pastpaper/feedback.html', {
-        'current_subject': subject,
-        'all_subjects': all_subjects
-    })
+    return render(request, 'pastpaper/feedback.html', subject_context())
 
 
 @login_required
 def mydetails_view(request):
     """个人详情页面视图"""
-    # 获取默认学科
-    try:
-        subject = Subject.objects.get(code='cs')
-    except Subject.DoesNotExist:
-        subject = None
-    
-    # 获取所有学科列表
-    all_subjects = Subject.objects.all().order_by('id')
-    
-    return render(request, 'pastpaper/mydetails.html', {
-        'user': request.user,
-        'current_subject': subject,
-        'all_subjects': all_subjects
-    })
+    return render(request, 'pastpaper/mydetails.html', {'user': request.user, **subject_context()})
 
 
 # API Endpoints
 
+def _units_payload(subject, units):
+    return [
+        {
+            'id': unit.id,
+            'unit_num': unit.unit_num,
+            'name': unit.name,
+            'syllabus_page': unit.syllabus_page,
+            'syllabus_url': subject.syllabus_media_url,
+        }
+        for unit in units
+    ]
+
+
+def _question_list_payload(subject, questions, tags):
+    """questions 需已 select_related('unit')；tags 为 {question_id: (kill, saved)}"""
+    result = []
+    for q in questions:
+        checked, save = tags.get(q.id, (False, False))
+        result.append({
+            'id': q.id,
+            'code': q.code,
+            'qpage': q.qpage,
+            'apage': q.apage,
+            'syllabus_page': q.syllabus_page,
+            'syllabus_url': subject.syllabus_media_url,
+            'unit_num': q.unit.unit_num if q.unit else None,
+            'checked': checked,
+            'save': save
+        })
+    return result
+
+
+def _question_list_columns(subject, questions, tags):
+    """列式版本的 _question_list_payload（见 columnar.py）"""
+    columns = {name: [] for name in ('id', 'code', 'qpage', 'apage', 'syllabus_page', 'unit_num', 'tags')}
+    for q in questions:
+        columns['id'].append(q.id)
+        columns['code'].append(q.code)
+        columns['qpage'].append(q.qpage)
+        columns['apage'].append(q.apage)
+        columns['syllabus_page'].append(q.syllabus_page)
+        columns['unit_num'].append(q.unit.unit_num if q.unit else None)
+        columns['tags'].append(tag_bits(*tags.get(q.id, (False, False))))
+    return columnar_payload(columns, len(columns['id']), shared={'syllabus_url': subject.syllabus_media_url})
+
+
+def _past_papers_payload(past_papers, tags):
+    """tags 为 {past_paper_id: (kill, saved)}"""
+    result = []
+    for pp in past_papers:
+        checked, save = tags.get(pp.id, (False, False))
+        result.append({
+            'code': pp.code,
+            'year': pp.year,
+            'session': pp.session,
+            'paper_num': pp.paper_num,
+            'checked': checked,
+            'save': save,
+        })
+    return result
+
+
+def _past_papers_columns(past_papers, tags):
+    columns = {name: [] for name in ('code', 'year', 'session', 'paper_num', 'tags')}
+    for pp in past_papers:
+        columns['code'].append(pp.code)
+        columns['year'].append(pp.year)
+        columns['session'].append(pp.session)
+        columns['paper_num'].append(pp.paper_num)
+        columns['tags'].append(tag_bits(*tags.get(pp.id, (False, False))))
+    return columnar_payload(columns, len(columns['code']))
+
+
+def _list_response(request, limit, items, columns, next_cursor=None, total=None):
+    """
+    列表接口的响应格式协商：items / columns 为生成普通数组或列式数据的函数，只调用其一。
+    limit 为 None 表示未分页。
+    """
+    if wants_columnar(request):
+        data = columns()
+        if limit is not None:
+            data.update(page_fields(next_cursor, total))
+        response = ColumnarResponse(data)
+    elif limit is None:
+        response = JsonResponse(items(), safe=False)
+    else:
+        response = JsonResponse(page_payload(items(), next_cursor, total))
+    patch_vary_headers(response, ['Accept'])
+    return response
+
+
+def _history_payload(history):
+    """history 需已 select_related('question')"""
+    return [
+        {
+            'code': h.question.code,
+            'visited_at': h.visited_at.strftime('%Y-%m-%d %H:%M')
+        }
+        for h in history
+    ]
+
+
 @login_required
 @require_POST
 def get_units(request):
@@ -118,96 +213,105 @@ def get_units(request):
     try:
         subject = Subject.objects.get(code=subject_code)
         units = Unit.objects.filter(subject=subject).order_by('unit_num')
-        data = [
-            {
-                'id': unit.id,
-                'unit_num': unit.unit_num,
-                'name': unit.name,
-                'syllabus_page': unit.syllabus_page,
-                'syllabus_url': subject.syllabus_media_url,
-            }
-            for unit in units
-        ]
-        return JsonResponse(data, safe=False)
+        return JsonResponse(_units_payload(subject, units), safe=False)
     except Subject.DoesNotExist:
         return JsonResponse([], safe=False)
 
 
+def _empty_list(request, limit):
+    return _list_response(request, limit, list, lambda: columnar_payload({}, 0), None, 0)
+
+
 @login_required
 @require_POST
 def get_list(request):
-    """获取指定单元的题目列表"""
+    """
+    获取指定单元的题目列表。
+    带 limit/cursor 参数时分页返回 {items, next_cursor, total}（total 只在第一页给出），否则返回完整数组；
+    format=columns 时返回列式数据（见 columnar.py）。
+    """
     unit_num = request.POST.get('unit')
     subject_code = request.POST.get('subject', 'cs')
     
     if not unit_num:
         return JsonResponse({'error': 'Unit number is required'}, status=400)
+    try:
+        limit, cursor = parse_page(request.POST)
+    except InvalidPage as e:
+        return JsonResponse({'error': str(e)}, status=400)
     
     try:
         subject = Subject.objects.get(code=subject_code)
         unit = Unit.objects.get(unit_num=unit_num, subject=subject)
-        questions = Question.objects.filter(unit=unit).order_by('-created_at')
-        
-        result = []
-        for q in questions:
-            # 获取用户标签
-            try:
-                tag = UserTag.objects.get(user=request.user, question=q)
-                checked = tag.kill
-                save = tag.saved
-            except UserTag.DoesNotExist:
-                checked = False
-                save = False
-            
-            result.append({
-                'id': q.id,
-                'code': q.code,
-                'qpage': q.qpage,
-                'apage': q.apage,
-                'syllabus_page': q.syllabus_page,
-                'syllabus_url': subject.syllabus_media_url,
-                'unit_num': q.unit.unit_num if q.unit else None,
-                'checked': checked,
-                'save': save
-            })
-        
-        return JsonResponse(result, safe=False)
     except (Subject.DoesNotExist, Unit.DoesNotExist):
-        return JsonResponse([], safe=False)
+        return _empty_list(request, limit)
+
+    next_cursor = total = None
+    questions = Question.objects.filter(unit=unit).select_related('unit')
+    user_tags = UserTag.objects.filter(user=request.user)
+    if limit is None:
+        questions = list(questions.order_by(*QUESTION_KEYSET.ordering))
+        # 一次查询取出该单元所有题目的用户标签
+        user_tags = user_tags.filter(question__unit=unit)
+    else:
+        try:
+            questions, next_cursor = paginate(questions, QUESTION_KEYSET, limit, cursor)
+        except InvalidPage as e:
+            return JsonResponse({'error': str(e)}, status=400)
+        user_tags = user_tags.filter(question_id__in=[q.id for q in questions])
+    tags = {
+        question_id: (kill, saved)
+        for question_id, kill, saved in user_tags.values_list('question_id', 'kill', 'saved')
+    }
+    if limit is not None and not cursor:
+        total = cached_count(QUESTION_COUNT_NAME.format(unit.id), Question.objects.filter(unit=unit))
+    return _list_response(
+        request, limit,
+        lambda: _question_list_payload(subject, questions, tags),
+        lambda: _question_list_columns(subject, questions, tags),
+        next_cursor, total,
+    )
 
 
 @login_required
 @require_POST
 def get_past_papers(request):
-    """获取指定学科的所有历年试卷"""
+    """获取指定学科的所有历年试卷；分页参数与 get_list 相同"""
     subject_code = request.POST.get('subject', 'cs')
+    try:
+        limit, cursor = parse_page(request.POST)
+    except InvalidPage as e:
+        return JsonResponse({'error': str(e)}, status=400)
     
     try:
         subject = Subject.objects.get(code=subject_code)
-        past_papers = list(PastPaper.objects.filter(subject=subject).order_by('-year', 'session', 'paper_num'))
-        paper_ids = [pp.id for pp in past_papers]
-        tags = {}
-        if paper_ids:
-            tags = {
-                tag.past_paper_id: tag
-                for tag in PastPaperTag.objects.filter(user=request.user, past_paper_id__in=paper_ids)
-            }
-        
-        result = []
-        for pp in past_papers:
-            tag = tags.get(pp.id)
-            result.append({
-                'code': pp.code,
-                'year': pp.year,
-                'session': pp.session,
-                'paper_num': pp.paper_num,
-                'checked': tag.kill if tag else False,
-                'save': tag.saved if tag else False,
-            })
-        
-        return JsonResponse(result, safe=False)
     except Subject.DoesNotExist:
-        return JsonResponse([], safe=False)
+        return _empty_list(request, limit)
+
+    next_cursor = total = None
+    past_papers = PastPaper.objects.filter(subject=subject)
+    paper_tags = PastPaperTag.objects.filter(user=request.user)
+    if limit is None:
+        past_papers = list(past_papers.order_by(*PAST_PAPER_KEYSET.ordering))
+        paper_tags = paper_tags.filter(past_paper__subject=subject)
+    else:
+        try:
+            past_papers, next_cursor = paginate(past_papers, PAST_PAPER_KEYSET, limit, cursor)
+        except InvalidPage as e:
+            return JsonResponse({'error': str(e)}, status=400)
+        paper_tags = paper_tags.filter(past_paper_id__in=[pp.id for pp in past_papers])
+    tags = {
+        past_paper_id: (kill, saved)
+        for past_paper_id, kill, saved in paper_tags.values_list('past_paper_id', 'kill', 'saved')
+    }
+    if limit is not None and not cursor:
+        total = cached_count(PAST_PAPER_COUNT_NAME.format(subject.id), PastPaper.objects.filter(subject=subject))
+    return _list_response(
+        request, limit,
+        lambda: _past_papers_payload(past_papers, tags),
+        lambda: _past_papers_columns(past_papers, tags),
+        next_cursor, total,
+    )
 
 
 @login_required
@@ -383,16 +487,17 @@ def save_question(request):
 @require_POST
 def get_history(request):
     """获取用户浏览历史"""
-    history = HistoryRecord.objects.filter(user=request.user).order_by('-visited_at')[:20]
-    
-    result = []
-    for h in history:
-        result.append({
-            'code': h.question.code,
-            'visited_at': h.visited_at.strftime('%Y-%m-%d %H:%M')
-        })
-    
-    return JsonResponse(result, safe=False)
+    history = HistoryRecord.objects.filter(user=request.user).select_related('question').order_by('-visited_at')[:20]
+    return JsonResponse(_history_payload(history), safe=False)
+
+
+def tag_state(kill_value, save_value):
+    """标签提交的目标状态 (kill, saved)：kill 优先，其次 save；都为 0 时返回 None（保持不变）"""
+    if kill_value == '1':
+        return True, False
+    if save_value == '1':
+        return False, True
+    return None
 
 
 @login_required
@@ -406,12 +511,9 @@ def update_user_tags(request):
     save_value = request.POST.get('save', '0')
 
     def apply_tag_state(tag_obj):
-        if kill_value == '1':
-            tag_obj.kill = True
-            tag_obj.saved = False
-        elif save_value == '1':
-            tag_obj.saved = True
-            tag_obj.kill = False
+        state = tag_state(kill_value, save_value)
+        if state is not None:
+            tag_obj.kill, tag_obj.saved = state
         tag_obj.save()
         return {'kill': tag_obj.kill, 'saved': tag_obj.saved}
 
@@ -448,6 +550,49 @@ def update_user_tags(request):
         return JsonResponse({'success': False, 'error': str(e)}, status=500)
 
 
+@login_required
+@require_POST
+def update_user_tags_batch(request):
+    """批量更新标签：按客户端序号顺序在一个事务内应用，重试时幂等"""
+    try:
+        body = json.loads(request.body or b'{}')
+    except (TypeError, ValueError):
+        return JsonResponse({'success': False, 'error': 'Invalid JSON body'}, status=400)
+    if not isinstance(body, dict):
+        return JsonResponse({'success': False, 'error': 'Invalid JSON body'}, status=400)
+
+    client_id = str(body.get('client_id') or '').strip()
+    if not client_id or len(client_id) > 64:
+        return JsonResponse({'success': False, 'error': 'client_id is required (max 64 chars)'}, status=400)
+
+    try:
+        result = apply_tag_batch(request.user, client_id, body.get('ops', []))
+    except ValueError as exc:
+        return JsonResponse({'success': False, 'error': str(exc)}, status=400)
+    return JsonResponse({'success': True, **result})
+
+
+HISTORY_DEDUP_SECONDS = 60
+
+
+def history_is_duplicate(recent_history):
+    return recent_history is not None and \
+        (timezone.now() - recent_history.visited_at).total_seconds() <= HISTORY_DEDUP_SECONDS
+
+
+def record_history(user, question):
+    """记录浏览历史；同一题目1分钟内重复打开只记一次"""
+    recent_history = HistoryRecord.objects.filter(
+        user=user,
+        question=question
+    ).order_by('-visited_at').first()
+
+    if not history_is_duplicate(recent_history):
+        HistoryRecord.objects.create(
+            user=user,
+            question=question
+        )
+
 
 @login_required
 @require_POST
@@ -460,21 +605,85 @@ def update_history(request):
     
     try:
         question = Question.objects.get(code=code)
-        
-        # 检查是否已存在最近的历史记录（避免重复）
-        recent_history = HistoryRecord.objects.filter(
-            user=request.user,
-            question=question
-        ).order_by('-visited_at').first()
-        
-        # 如果不存在或者超过1分钟，则创建新记录
-        if not recent_history or (recent_history.visited_at - recent_history.visited_at).seconds > 60:
-            HistoryRecord.objects.create(
-                user=request.user,
-                question=question
-            )
-        
+        record_history(request.user, question)
         return JsonResponse({'success': True})
     except Question.DoesNotExist:
         return JsonResponse({'success': False, 'error': 'Question not found'}, status=404)
 
+
+def _question_payload(question):
+    return {
+        'id': question.id,
+        'code': question.code,
+        'qpage': question.qpage,
+        'apage': question.apage,
+        'syllabus_page': question.syllabus_page,
+        'unit_num': question.unit.unit_num if question.unit else None,
+    }
+
+
+@login_required
+@require_POST
+def open_question(request):
+    """
+    打开题目（一次请求完成）：题目信息、用户标签、同单元上一题/下一题，并记录浏览历史。
+    相邻题目的PDF通过 Link: rel=prefetch 头和 prefetch 字段提示浏览器预取。
+    """
+    code = request.POST.get('code')
+
+    if not code:
+        return JsonResponse({'error': 'Code is required'}, status=400)
+
+    try:
+        question = Question.objects.select_related('unit', 'subject').get(code=code)
+    except Question.DoesNotExist:
+        return JsonResponse({'error': 'Question not found'}, status=404)
+
+    tag = UserTag.objects.filter(user=request.user, question=question).values_list('kill', 'saved').first()
+    previous, following = question.unit_neighbors()
+    record_history(request.user, question)
+
+    # 相邻题目经常与当前题目同一份试卷，去重后只预取其他试卷
+    current_urls = {question.qp_url, question.ms_url}
+    prefetch = []
+    for neighbor in (following, previous):
+        if neighbor and neighbor.qp_url not in current_urls and neighbor.qp_url not in prefetch:
+            prefetch.append(neighbor.qp_url)
+
+    data = _question_payload(question)
+    data['syllabus_url'] = question.subject.syllabus_media_url
+    response = JsonResponse({
+        'question': data,
+        'qp_url': question.qp_url,
+        'ms_url': question.ms_url,
+        'checked': tag[0] if tag else False,
+        'save': tag[1] if tag else False,
+        'prev': _question_payload(previous) if previous else None,
+        'next': _question_payload(following) if following else None,
+        'prefetch': prefetch,
+    })
+    if prefetch:
+        response['Link'] = ', '.join(f'<{url}>; rel=prefetch' for url in prefetch)
+    return response
+
+
+@login_required
+@require_POST
+def sync(request):
+    """增量同步：返回客户端水位线之后的题库变更（含删除墓碑）与用户标签变更"""
+    subject_code = request.POST.get('subject', 'cs')
+    try:
+        subject = Subject.objects.get(code=subject_code)
+    except Subject.DoesNotExist:
+        return JsonResponse({'error': 'Subject not found'}, status=404)
+
+    try:
+        payload = build_sync_payload(
+            request.user,
+            subject,
+            parse_catalog_version(request.POST.get('catalog_version')),
+            request.POST.get('tags_since'),
+        )
+    except ValueError:
+        return JsonResponse({'error': 'tags_since must be an ISO 8601 datetime'}, status=400)
+    return JsonResponse(payload)
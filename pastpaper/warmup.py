@@ -0,0 +1,58 @@
+"""
+共享缓存预热：启动时（manage.py warm_caches）同步执行；/readyz/ 发现缓存为空时在后台线程中执行，
+把页面和列表接口依赖的题库缓存写入共享缓存。
+"""
+import logging
+import threading
+
+from django.core.cache import cache
+from django.db import connections
+
+from .models import PastPaper, Question, Unit, catalog_version
+from .pagination import PAST_PAPER_COUNT_NAME, QUESTION_COUNT_NAME, cached_count
+from .permissions import _roles_version
+from .subjects import all_subjects, catalog_cache_version, subjects_cache_key
+
+logger = logging.getLogger(__name__)
+
+# 每个进程同时只有一个后台预热
+_warming_lock = threading.Lock()
+
+
+def catalog_cache_warm(version=None):
+    """当前题库版本的学科列表已在缓存中"""
+    if version is None:
+        version = catalog_version()
+    return cache.has_key(subjects_cache_key(catalog_cache_version(version)))
+
+
+def warm_catalog():
+    """返回预热的学科数和单元数"""
+    version = catalog_version()
+    cache_version = catalog_cache_version(version)
+    subjects = all_subjects(cache_version)
+    units = list(Unit.objects.order_by().only('id'))
+    for unit in units:
+        cached_count(QUESTION_COUNT_NAME.format(unit.id), Question.objects.filter(unit=unit), cache_version)
+    for subject in subjects:
+        cached_count(PAST_PAPER_COUNT_NAME.format(subject.id), PastPaper.objects.filter(subject=subject), cache_version)
+    _roles_version()
+    return {'catalog_version': version, 'subjects': len(subjects), 'units': len(units)}
+
+
+def warm_catalog_in_background():
+    """启动后台预热线程；已有预热在进行时返回 False"""
+    if not _warming_lock.acquire(blocking=False):
+        return False
+
+    def run():
+        try:
+            warm_catalog()
+        except Exception:
+            logger.exception('Background catalog warm-up failed')
+        finally:
+            connections.close_all()
+            _warming_lock.release()
+
+    threading.Thread(target=run, name='warm-catalog', daemon=True).start()
+    return True
@@ -16,6 +16,11 @@ function getCookie(name) {
     return cookieValue;
 }
 
+// CSRF token rendered into the <meta name="csrf-token"> tag of base.html
+function getCsrfToken() {
+    return document.querySelector('meta[name="csrf-token"]').content;
+}
+
 // Auto-dismiss alerts after 5 seconds
 document.addEventListener('DOMContentLoaded', function() {
     const alerts = document.querySelectorAll('.alert');
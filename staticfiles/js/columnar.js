@@ -0,0 +1,30 @@
+// 列式列表响应的解码（格式说明见 pastpaper/columnar.py）
+
+const COLUMNAR_TAG_CHECKED = 1;
+const COLUMNAR_TAG_SAVED = 2;
+
+// 还原为与普通 JSON 格式相同的行对象，返回 {items, next_cursor, total}
+function decodeColumns(data) {
+    if (data.v !== 1) {
+        throw new Error(`Unsupported columnar format version: ${data.v}`);
+    }
+    const names = Object.keys(data.columns);
+    const items = new Array(data.count);
+    for (let i = 0; i < data.count; i++) {
+        const row = Object.assign({}, data.shared);
+        for (const name of names) {
+            row[name] = data.columns[name][i];
+        }
+        if ('tags' in row) {
+            row.checked = (row.tags & COLUMNAR_TAG_CHECKED) !== 0;
+            row.save = (row.tags & COLUMNAR_TAG_SAVED) !== 0;
+            delete row.tags;
+        }
+        items[i] = row;
+    }
+    return {
+        items,
+        next_cursor: data.next_cursor === undefined ? null : data.next_cursor,
+        total: data.total
+    };
+}
@@ -0,0 +1,545 @@
+// 教师录题页：按试卷浏览题目、录入页码并在 PDF.js 查看器中预览
+
+const csrfToken = document.getElementById('csrf-token').value;
+const subjectSelect = document.getElementById('subject-select');
+const subjects = Array.from(subjectSelect.options).map(option => ({
+    code: option.value,
+    exam_code: option.dataset.exam
+}));
+const sessionSelect = document.getElementById('session-select');
+const paperSelect = document.getElementById('paper-select');
+const questionListEl = document.getElementById('question-list');
+const codeInput = document.getElementById('input-code');
+const unitSelect = document.getElementById('input-unit');
+const qpageInput = document.getElementById('input-qpage');
+const apageInput = document.getElementById('input-apage');
+const spageInput = document.getElementById('input-spage');
+const pdfViewer = document.getElementById('pdf-viewer');
+const pdfTitle = document.getElementById('pdf-title');
+const pdfMeta = document.getElementById('pdf-meta');
+const pageInput = document.getElementById('page-input');
+const toast = document.getElementById('save-toast');
+const pdfJsViewerBase = document.getElementById('pdfjs-viewer-url').value;
+
+let currentSubject = document.getElementById('current-subject-code').value || (subjects[0]?.code || '');
+let currentExamCode = subjectSelect.selectedOptions[0]?.dataset.exam || subjects[0]?.exam_code || '';
+let currentSubjectSyllabusUrl = subjectSelect.selectedOptions[0]?.dataset.syllabus || '';
+let currentYearSession = '';
+let currentPaper = '';
+let currentQuestionId = null;
+let currentPdfType = 'qp';
+let currentPrefix = '';
+let questionsCache = [];
+let pageState = { qp: 1, ms: 1, syllabus: 1 };
+let papersGroupedCache = {};
+let pdfIframe = null;
+let pdfEventBus = null;
+let pdfPageChangeHandler = null;
+let pdfCurrentFileUrl = '';
+let pdfReadyPromise = null;
+let pdfViewerBoundType = null;
+let unitsCache = [];
+
+// Helpers
+function postForm(url, data) {
+    return fetch(url, {
+        method: 'POST',
+        headers: {
+            'Content-Type': 'application/x-www-form-urlencoded',
+            'X-CSRFToken': csrfToken
+        },
+        body: new URLSearchParams(data).toString()
+    }).then(res => res.json());
+}
+
+function renderQuestionList(questions) {
+    questionListEl.innerHTML = '';
+    if (!questions.length) {
+        questionListEl.innerHTML = '<div class="text-muted small">暂无题目，点击右上角“新建题目”创建。</div>';
+        return;
+    }
+    questions.forEach(q => {
+        const item = document.createElement('div');
+        item.className = 'question-chip';
+        item.dataset.id = q.id || '';
+        item.innerHTML = `<span>${q.code}</span><span class="text-muted small">${q.unit_label || ''}</span>`;
+        item.onclick = () => selectQuestion(q);
+        questionListEl.appendChild(item);
+    });
+}
+
+function markActiveQuestion(code) {
+    document.querySelectorAll('.question-chip').forEach(el => {
+        if (el.textContent.trim().startsWith(code)) {
+            el.classList.add('active');
+        } else {
+            el.classList.remove('active');
+        }
+    });
+}
+
+function findUnitById(unitId) {
+    if (!unitId) return null;
+    return unitsCache.find(u => String(u.id) === String(unitId)) || null;
+}
+
+function syncSyllabusInput(unitId, preferredPage = null) {
+    let page = preferredPage;
+    if (!page || page < 1) {
+        const unit = findUnitById(unitId);
+        page = unit ? (unit.syllabus_page || 1) : 1;
+    }
+    spageInput.value = page;
+    pageState.syllabus = page;
+    if (currentPdfType === 'syllabus') {
+        pageInput.value = page;
+        if (pdfCurrentFileUrl) {
+            goToPageInViewer(page);
+        } else {
+            loadPdf('syllabus', page);
+        }
+    }
+    return page;
+}
+
+function updateUnitSyllabusCache(unitId, page) {
+    if (!unitId) return;
+    const unit = findUnitById(unitId);
+    if (unit) {
+        unit.syllabus_page = page;
+    }
+    Array.from(unitSelect.options).forEach(opt => {
+        if (opt.value === String(unitId)) {
+            opt.dataset.syllabusPage = page;
+        }
+    });
+}
+
+function loadUnits() {
+    postForm('/get_units/', { subject: currentSubject })
+        .then(data => {
+            unitsCache = data || [];
+            if (!currentSubjectSyllabusUrl && unitsCache.length) {
+                currentSubjectSyllabusUrl = unitsCache[0].syllabus_url || '';
+            }
+            const prevUnit = unitSelect.value;
+            unitSelect.innerHTML = '<option value=\"\">未选择</option>';
+            unitsCache.forEach(u => {
+                const opt = document.createElement('option');
+                opt.value = u.id;
+                opt.textContent = `Unit ${u.unit_num} - ${u.name}`;
+                opt.dataset.syllabusPage = u.syllabus_page || 1;
+                unitSelect.appendChild(opt);
+            });
+            if (prevUnit && findUnitById(prevUnit)) {
+                unitSelect.value = prevUnit;
+                syncSyllabusInput(prevUnit);
+            } else {
+                unitSelect.value = '';
+                syncSyllabusInput(null);
+            }
+        })
+        .catch(err => console.error('Load units error', err));
+}
+
+function loadPapers() {
+    sessionSelect.innerHTML = '';
+    paperSelect.innerHTML = '';
+    postForm('/api/papers/by-subject/', { subject: currentSubject })
+        .then(data => {
+            const grouped = {};
+            data.forEach(p => {
+                if (!grouped[p.year_session]) grouped[p.year_session] = [];
+                grouped[p.year_session].push(p);
+            });
+            papersGroupedCache = grouped;
+            const sessions = Object.keys(grouped).sort().reverse();
+            sessions.forEach((sess, idx) => {
+                const opt = document.createElement('option');
+                opt.value = sess;
+                opt.textContent = sess.toUpperCase();
+                if (idx === 0) opt.selected = true;
+                sessionSelect.appendChild(opt);
+            });
+            currentYearSession = sessionSelect.value || '';
+            populatePapers(papersGroupedCache);
+        })
+        .catch(err => console.error('Load papers error', err));
+}
+
+function populatePapers(grouped) {
+    const papers = grouped[currentYearSession] || [];
+    paperSelect.innerHTML = '';
+    papers.sort((a, b) => a.paper_num.localeCompare(b.paper_num));
+    papers.forEach((p, idx) => {
+        const opt = document.createElement('option');
+        opt.value = p.paper_num;
+        opt.textContent = p.paper_num;
+        if (idx === 0) opt.selected = true;
+        paperSelect.appendChild(opt);
+    });
+    currentPaper = paperSelect.value || '';
+    if (currentYearSession && currentPaper) {
+        loadQuestions();
+    }
+}
+
+function loadQuestions(targetCode = null) {
+    postForm('/api/questions/by-paper/', {
+        subject: currentSubject,
+        year_session: currentYearSession,
+        paper: currentPaper
+    }).then(data => {
+        currentPrefix = data.prefix || '';
+        questionsCache = data.questions || [];
+        renderQuestionList(questionsCache);
+        currentQuestionId = null;
+        let target = null;
+        if (targetCode) {
+            target = questionsCache.find(q => q.code === targetCode);
+        }
+        if (!target && questionsCache.length) {
+            target = questionsCache[0];
+        }
+        if (target) {
+            selectQuestion(target);
+        } else {
+            prepareNewQuestion();
+        }
+    }).catch(err => console.error('Load questions error', err));
+}
+
+function selectQuestion(q) {
+    currentQuestionId = q.id || null;
+    codeInput.value = q.code || '';
+    if (q.unit_id) {
+        unitSelect.value = q.unit_id;
+    } else {
+        unitSelect.value = '';
+    }
+    qpageInput.value = q.qpage || 1;
+    apageInput.value = q.apage || 1;
+    const syllabusPage = syncSyllabusInput(q.unit_id, q.syllabus_page || null);
+    pageState.qp = q.qpage || 1;
+    pageState.ms = q.apage || 1;
+    pageState.syllabus = syllabusPage;
+    pageInput.value = pageState[currentPdfType];
+    markActiveQuestion(q.code);
+    updatePdfTitle();
+    loadPdf(currentPdfType, pageState[currentPdfType]);
+}
+
+function prepareNewQuestion() {
+    currentQuestionId = null;
+    codeInput.value = currentPrefix ? `${currentPrefix}-Q${questionsCache.length + 1}` : '';
+    qpageInput.value = 1;
+    apageInput.value = 1;
+    const unit = findUnitById(unitSelect.value);
+    const unitPage = unit ? (unit.syllabus_page || 1) : 1;
+    spageInput.value = unitPage;
+    pageState = { qp: 1, ms: 1, syllabus: unitPage };
+    pageInput.value = pageState[currentPdfType];
+    markActiveQuestion('');
+    updatePdfTitle();
+    loadPdf(currentPdfType, pageState[currentPdfType]);
+}
+
+function updatePdfTitle() {
+    const label = codeInput.value || `${currentExamCode}_${currentYearSession}_${currentPaper}`;
+    pdfTitle.textContent = label;
+    pdfMeta.textContent = `${currentExamCode} ${currentYearSession.toUpperCase()} Paper ${currentPaper}`;
+}
+
+function getPaperParts() {
+    const manual = (codeInput.value || '').split('-')[0];
+    const parts = manual.split('_');
+    if (parts.length === 3) {
+        return { exam: parts[0], session: parts[1], paper: parts[2] };
+    }
+    return { exam: currentExamCode, session: currentYearSession, paper: currentPaper };
+}
+
+function renderPlaceholder() {
+    pdfIframe = null;
+    pdfEventBus = null;
+    pdfPageChangeHandler = null;
+    pdfCurrentFileUrl = '';
+    pdfViewer.innerHTML = `<div class="d-flex h-100 align-items-center justify-content-center text-white-50">
+        <div class="text-center">
+            <i class="bi bi-journal-code" style="font-size: 42px;"></i>
+            <div class="mt-2">请选择完整的试卷信息以预览 PDF</div>
+        </div>
+    </div>`;
+}
+
+function computePdfUrl(type) {
+    const parts = getPaperParts();
+    if (!parts.exam || !parts.session || !parts.paper) {
+        return '';
+    }
+    if (type === 'qp') {
+        return `/media/${parts.exam}_${parts.session}_qp_${parts.paper}.pdf`;
+    } else if (type === 'ms') {
+        return `/media/${parts.exam}_${parts.session}_ms_${parts.paper}.pdf`;
+    } else {
+        return currentSubjectSyllabusUrl || '';
+    }
+}
+
+function buildViewerSrc(fileUrl, page) {
+    const encodedFile = encodeURIComponent(fileUrl);
+    const safePage = Math.max(1, parseInt(page, 10) || 1);
+    return `${pdfJsViewerBase}?file=${encodedFile}#page=${safePage}`;
+}
+
+function ensurePdfIframe() {
+    if (!pdfIframe) {
+        pdfIframe = document.createElement('iframe');
+        pdfIframe.setAttribute('allowfullscreen', 'true');
+        pdfIframe.style.width = '100%';
+        pdfIframe.style.height = '100%';
+        pdfIframe.style.border = 'none';
+        pdfViewer.innerHTML = '';
+        pdfViewer.appendChild(pdfIframe);
+    }
+}
+
+function waitForViewerReady() {
+    return new Promise((resolve, reject) => {
+        const started = Date.now();
+        const check = () => {
+            const win = pdfIframe?.contentWindow;
+            const app = win?.PDFViewerApplication;
+            if (app?.eventBus && app.initializedPromise) {
+                app.initializedPromise.then(() => resolve(app)).catch(reject);
+                return;
+            }
+            if (Date.now() - started > 8000) {
+                reject(new Error('PDF viewer init timeout'));
+                return;
+            }
+            setTimeout(check, 80);
+        };
+        check();
+    });
+}
+
+async function bindViewerEvents(type) {
+    try {
+        const app = await pdfReadyPromise;
+        const eventBus = app.eventBus;
+        if (pdfEventBus && pdfPageChangeHandler) {
+            pdfEventBus.off('pagechanging', pdfPageChangeHandler);
+        }
+        pdfEventBus = eventBus;
+        pdfViewerBoundType = type;
+        pdfPageChangeHandler = (evt) => {
+            const p = evt.pageNumber;
+            pageState[type] = p;
+            pageInput.value = p;
+            syncPageToForm();
+        };
+        eventBus.on('pagechanging', pdfPageChangeHandler);
+    } catch (err) {
+        console.error('bindViewerEvents error', err);
+    }
+}
+
+function goToPageInViewer(page) {
+    const target = Math.max(1, parseInt(page, 10) || 1);
+    if (pdfReadyPromise) {
+        pdfReadyPromise.then(app => {
+            app.pdfLinkService?.goToPage(target);
+        }).catch(err => console.error('goToPageInViewer error', err));
+    }
+}
+
+function loadPdf(type, page) {
+    currentPdfType = type;
+    pageState[type] = Math.max(1, parseInt(page, 10) || 1);
+    pageInput.value = pageState[type];
+    const fileUrl = computePdfUrl(type);
+    if (!fileUrl) {
+        if (type === 'syllabus') {
+            alert('当前学科未配置大纲文件');
+        }
+        renderPlaceholder();
+        return;
+    }
+    const viewerSrc = buildViewerSrc(fileUrl, pageState[type]);
+    ensurePdfIframe();
+    if (pdfCurrentFileUrl !== fileUrl) {
+        pdfCurrentFileUrl = fileUrl;
+        pdfReadyPromise = new Promise((resolve, reject) => {
+            pdfIframe.onload = () => {
+                waitForViewerReady().then(resolve).catch(reject);
+            };
+            pdfIframe.onerror = reject;
+        });
+        pdfIframe.src = viewerSrc;
+        bindViewerEvents(type);
+    } else {
+        goToPageInViewer(pageState[type]);
+    }
+}
+
+function showToast(message) {
+    toast.textContent = message;
+    toast.classList.add('show');
+    setTimeout(() => toast.classList.remove('show'), 1600);
+}
+
+function saveQuestion() {
+    const payload = {
+        subject: currentSubject,
+        code: codeInput.value.trim(),
+        unit_id: unitSelect.value,
+        qpage: qpageInput.value || 1,
+        apage: apageInput.value || 1,
+        syllabus_page: spageInput.value || '',
+    };
+    if (currentQuestionId) payload.id = currentQuestionId;
+    postForm('/api/questions/save/', payload)
+        .then(data => {
+            if (data.success) {
+                showToast('Saved!');
+                currentQuestionId = data.id;
+                if (unitSelect.value) {
+                    const pageVal = Math.max(1, parseInt(spageInput.value, 10) || 1);
+                    updateUnitSyllabusCache(unitSelect.value, pageVal);
+                    pageState.syllabus = pageVal;
+                }
+                loadQuestions(data.code);
+            } else {
+                alert(data.error || '保存失败');
+            }
+        })
+        .catch(err => alert('保存失败: ' + err));
+}
+
+// Event bindings
+subjectSelect.addEventListener('change', () => {
+    currentSubject = subjectSelect.value;
+    currentExamCode = subjectSelect.selectedOptions[0]?.dataset.exam || '';
+    currentSubjectSyllabusUrl = subjectSelect.selectedOptions[0]?.dataset.syllabus || '';
+    loadUnits();
+    loadPapers();
+});
+
+sessionSelect.addEventListener('change', () => {
+    currentYearSession = sessionSelect.value;
+    if (Object.keys(papersGroupedCache).length) {
+        populatePapers(papersGroupedCache);
+    }
+});
+
+paperSelect.addEventListener('change', () => {
+    currentPaper = paperSelect.value;
+    loadQuestions();
+});
+
+unitSelect.addEventListener('change', () => {
+    syncSyllabusInput(unitSelect.value);
+});
+
+document.getElementById('btn-new-question').addEventListener('click', (e) => {
+    e.preventDefault();
+    prepareNewQuestion();
+});
+
+document.getElementById('btn-view-qp').addEventListener('click', () => {
+    loadPdf('qp', pageState.qp);
+});
+document.getElementById('btn-view-ms').addEventListener('click', () => {
+    loadPdf('ms', pageState.ms);
+});
+document.getElementById('btn-view-syllabus').addEventListener('click', () => {
+    loadPdf('syllabus', pageState.syllabus);
+});
+
+document.getElementById('btn-page-prev').addEventListener('click', () => {
+    const val = Math.max(1, (parseInt(pageInput.value, 10) || 1) - 1);
+    pageState[currentPdfType] = val;
+    pageInput.value = val;
+    syncPageToForm();
+    if (pdfViewerBoundType === currentPdfType && pdfCurrentFileUrl) {
+        goToPageInViewer(val);
+    } else {
+        loadPdf(currentPdfType, val);
+    }
+});
+document.getElementById('btn-page-next').addEventListener('click', () => {
+    const val = Math.max(1, (parseInt(pageInput.value, 10) || 1) + 1);
+    pageState[currentPdfType] = val;
+    pageInput.value = val;
+    syncPageToForm();
+    if (pdfViewerBoundType === currentPdfType && pdfCurrentFileUrl) {
+        goToPageInViewer(val);
+    } else {
+        loadPdf(currentPdfType, val);
+    }
+});
+pageInput.addEventListener('change', () => {
+    const val = Math.max(1, parseInt(pageInput.value, 10) || 1);
+    pageState[currentPdfType] = val;
+    syncPageToForm();
+    if (pdfViewerBoundType === currentPdfType && pdfCurrentFileUrl) {
+        goToPageInViewer(val);
+    } else {
+        loadPdf(currentPdfType, val);
+    }
+});
+
+function syncPageToForm() {
+    if (currentPdfType === 'qp') {
+        qpageInput.value = pageState.qp;
+    } else if (currentPdfType === 'ms') {
+        apageInput.value = pageState.ms;
+    } else {
+        spageInput.value = pageState.syllabus;
+    }
+}
+
+document.getElementById('btn-save').addEventListener('click', (e) => {
+    e.preventDefault();
+    saveQuestion();
+});
+
+// keep page fields in sync when user edits manually
+qpageInput.addEventListener('change', () => {
+    pageState.qp = Math.max(1, parseInt(qpageInput.value, 10) || 1);
+    if (currentPdfType === 'qp') {
+        pageInput.value = pageState.qp;
+        if (pdfCurrentFileUrl) {
+            goToPageInViewer(pageState.qp);
+        } else {
+            loadPdf('qp', pageState.qp);
+        }
+    }
+});
+apageInput.addEventListener('change', () => {
+    pageState.ms = Math.max(1, parseInt(apageInput.value, 10) || 1);
+    if (currentPdfType === 'ms') {
+        pageInput.value = pageState.ms;
+        if (pdfCurrentFileUrl) {
+            goToPageInViewer(pageState.ms);
+        } else {
+            loadPdf('ms', pageState.ms);
+        }
+    }
+});
+spageInput.addEventListener('change', () => {
+    pageState.syllabus = Math.max(1, parseInt(spageInput.value, 10) || 1);
+    if (currentPdfType === 'syllabus') {
+        pageInput.value = pageState.syllabus;
+        if (pdfCurrentFileUrl) {
+            goToPageInViewer(pageState.syllabus);
+        } else {
+            loadPdf('syllabus', pageState.syllabus);
+        }
+    }
+});
+
+// Init
+loadUnits();
+loadPapers();
@@ -0,0 +1,873 @@
+// 首页：单元/题目/Past Papers 列表、PDF 查看与标签同步
+
+let currentSubject = document.getElementById('current-subject').value;
+let currentSubjectSyllabusUrl = document.getElementById('current-subject-syllabus').value;
+let currentUnit = null;
+let currentQuestionId = null;
+let currentQuestionCode = null;
+let currentPastPaperCode = null;
+let currentPdfUrl = null;
+let currentPdfType = 'qp';
+let currentPage = 1;
+let currentUnitSyllabusPage = 1;
+let isPastPaperMode = false;
+let questionsList = []; // Store all questions for navigation
+let displayedQuestionsList = []; // Store currently displayed/filtered questions
+let currentQuestionIndex = -1; // Current position in displayedQuestionsList
+let unitMetadata = {};
+let currentQuestionInfo = null; // open_question 返回的当前题目信息
+let currentQuestionRequest = null;
+
+// 加载单元列表
+function loadUnits() {
+    fetch('/get_units/', {
+        method: 'POST',
+        headers: {
+            'Content-Type': 'application/x-www-form-urlencoded',
+            'X-CSRFToken': getCsrfToken()
+        },
+        body: `subject=${currentSubject}`
+    })
+    .then(response => response.json())
+    .then(data => {
+        const list = document.getElementById('question-list');
+        list.innerHTML = '';
+        listPaging = null;
+        unitMetadata = {};
+
+        // 更新标题和计数
+        document.getElementById('questions-title').textContent = 'Units';
+        document.getElementById('question-count').textContent = `${data.length + 1} units`;
+
+        // 隐藏导航栏
+        document.getElementById('nav-bar').style.display = 'none';
+
+        // 添加单元项
+        data.forEach(unit => {
+            unitMetadata[unit.unit_num] = {
+                syllabus_page: unit.syllabus_page || 1,
+                syllabus_url: unit.syllabus_url || ''
+            };
+            if (!currentSubjectSyllabusUrl && unit.syllabus_url) {
+                currentSubjectSyllabusUrl = unit.syllabus_url;
+            }
+            const item = document.createElement('div');
+            item.className = 'unit-item';
+            item.innerHTML = `
+                <span>Unit ${unit.unit_num}</span>
+                <i class="bi bi-chevron-right"></i>
+            `;
+            item.onclick = () => selectUnit(unit.unit_num);
+            list.appendChild(item);
+        });
+
+        // 添加Past Papers项
+        const ppItem = document.createElement('div');
+        ppItem.className = 'unit-item pastpaper-item';
+        ppItem.innerHTML = `
+            <span>Past Papers</span>
+            <i class="bi bi-chevron-right"></i>
+        `;
+        ppItem.onclick = () => selectPastPapers();
+        list.appendChild(ppItem);
+    })
+    .catch(error => console.error('Error loading units:', error));
+}
+
+// 返回单元选择
+function backToUnits() {
+    currentUnit = null;
+    isPastPaperMode = false;
+    currentQuestionId = null;
+    currentQuestionCode = null;
+    currentUnitSyllabusPage = 1;
+
+    // 清空PDF查看器
+    const viewer = document.getElementById('pdf-viewer');
+    viewer.innerHTML = `
+        <div class="pdf-placeholder">
+            <i class="bi bi-file-pdf" style="font-size: 48px;"></i>
+            <p class="mt-3">Select a question to view PDF</p>
+        </div>
+    `;
+    document.getElementById('pdf-title').textContent = 'PDF Viewer';
+
+    // 重新加载单元列表
+    loadUnits();
+}
+
+// 选择单元
+function selectUnit(unitNum) {
+    currentUnit = unitNum;
+    isPastPaperMode = false;
+    document.getElementById('is-pastpaper-mode').value = 'false';
+    currentPastPaperCode = null;
+    const unitInfo = unitMetadata[unitNum];
+    currentUnitSyllabusPage = unitInfo && unitInfo.syllabus_page ? unitInfo.syllabus_page : 1;
+
+    // 显示导航栏
+    document.getElementById('nav-bar').style.display = 'flex';
+
+    // 更新标题
+    document.getElementById('questions-title').textContent = `Unit ${unitNum} Questions`;
+
+    // 加载题目列表
+    loadQuestions(unitNum);
+}
+
+// 选择Past Papers
+function selectPastPapers() {
+    isPastPaperMode = true;
+    currentUnit = null;
+    document.getElementById('is-pastpaper-mode').value = 'true';
+    currentQuestionId = null;
+    currentPastPaperCode = null;
+    currentUnitSyllabusPage = 1;
+
+    // 显示导航栏
+    document.getElementById('nav-bar').style.display = 'flex';
+
+    // 更新标题
+    document.getElementById('questions-title').textContent = 'Past Papers';
+
+    // 加载Past Papers
+    loadPastPapers();
+}
+
+// 列表分页加载：每次取 LIST_PAGE_SIZE 条，滚动到底部附近时再取下一页
+const LIST_PAGE_SIZE = 50;
+let listPaging = null;
+
+function startPagedList(url, params, label, renderItem) {
+    document.getElementById('question-list').innerHTML = '';
+    questionsList = [];
+    displayedQuestionsList = [];
+    currentQuestionIndex = -1;
+    listPaging = { url, params, label, renderItem, cursor: null, total: null, done: false, loading: null };
+    document.getElementById('question-count').textContent = '';
+    return loadNextPage();
+}
+
+function loadNextPage() {
+    const paging = listPaging;
+    if (!paging || paging.done) return Promise.resolve();
+    if (paging.loading) return paging.loading;
+
+    const params = new URLSearchParams(paging.params);
+    params.set('limit', LIST_PAGE_SIZE);
+    params.set('format', 'columns');
+    if (paging.cursor) params.set('cursor', paging.cursor);
+    paging.loading = fetch(paging.url, {
+        method: 'POST',
+        headers: {
+            'Content-Type': 'application/x-www-form-urlencoded',
+            'X-CSRFToken': getCsrfToken()
+        },
+        body: params.toString()
+    })
+    .then(response => response.json())
+    .then(decodeColumns)
+    .then(data => {
+        // 请求返回前已切换到其他列表
+        if (paging !== listPaging) return;
+        if (data.total !== undefined) paging.total = data.total;
+        paging.cursor = data.next_cursor;
+        paging.done = !data.next_cursor;
+
+        const list = document.getElementById('question-list');
+        data.items.forEach(item => {
+            const index = questionsList.length;
+            questionsList.push(item);
+            paging.renderItem(list, item, index);
+        });
+        const count = paging.total !== null ? paging.total : questionsList.length;
+        document.getElementById('question-count').textContent = `${count} ${paging.label}`;
+
+        applySearchFilter();
+        fillListViewport();
+    })
+    .catch(error => console.error(`Error loading ${paging.label}:`, error))
+    .finally(() => { paging.loading = null; });
+    return paging.loading;
+}
+
+// 列表还没有填满可视区域（或搜索过滤后剩下的太少）时继续加载
+function fillListViewport() {
+    const list = document.getElementById('question-list');
+    if (listPaging && !listPaging.done && list.scrollHeight - list.scrollTop - list.clientHeight < 200) {
+        loadNextPage();
+    }
+}
+
+// 加载题目列表
+function loadQuestions(unitNum) {
+    return startPagedList('/get_list/', { unit: unitNum, subject: currentSubject }, 'questions', (list, q, index) => {
+        const item = document.createElement('div');
+        item.className = 'question-item';
+        item.dataset.questionIndex = index; // Store original index
+        if (q.checked) item.classList.add('completed');
+        if (q.save) item.classList.add('saved');
+        item.textContent = `${index + 1}. ${q.code}`;
+        item.onclick = () => selectQuestion(q.id, q.code, q.qpage, q.apage, index, q.syllabus_page, q.unit_num);
+        list.appendChild(item);
+    });
+}
+
+// 加载Past Papers（按年份降序返回，年份变化时插入标题）
+function loadPastPapers() {
+    let lastYear = null;
+    return startPagedList('/get_past_papers/', { subject: currentSubject }, 'papers', (list, pp, index) => {
+        if (pp.year !== lastYear) {
+            lastYear = pp.year;
+            const yearHeader = document.createElement('div');
+            yearHeader.className = 'fw-bold mt-2 mb-1 px-2';
+            yearHeader.style.color = '#495057';
+            yearHeader.textContent = `Year ${pp.year}`;
+            list.appendChild(yearHeader);
+        }
+
+        const item = document.createElement('div');
+        item.className = 'question-item';
+        if (pp.checked) item.classList.add('completed');
+        if (pp.save) item.classList.add('saved');
+        item.dataset.questionIndex = index; // Store original index
+        item.textContent = pp.code;
+        item.onclick = () => selectPastPaper(pp.code, index);
+        list.appendChild(item);
+    });
+}
+
+// 选择题目
+function selectQuestion(id, code, qpage, apage, index, syllabusPage = null, unitNum = null) {
+    currentQuestionId = id;
+    currentQuestionCode = code;
+    currentPastPaperCode = null;
+    currentPage = qpage || 1;
+    if (unitNum) {
+        currentUnit = unitNum;
+    }
+    const unitInfo = unitMetadata[unitNum || currentUnit] || null;
+    const resolvedSyllabusPage = (typeof syllabusPage === 'number' ? syllabusPage : unitInfo?.syllabus_page);
+    currentUnitSyllabusPage = resolvedSyllabusPage && resolvedSyllabusPage > 0 ? resolvedSyllabusPage : 1;
+
+    // 在displayedQuestionsList中查找当前题目的索引
+    const displayedIndex = displayedQuestionsList.findIndex(q => q.id === id);
+    currentQuestionIndex = displayedIndex >= 0 ? displayedIndex : (index !== undefined ? index : currentQuestionIndex);
+
+    // 更新题目状态
+    document.querySelectorAll('.question-item').forEach(item => {
+        item.classList.remove('active');
+    });
+    // 由“下一题”在加载下一页后调用时没有点击事件
+    window.event?.target?.classList?.add('active');
+
+    // 更新导航按钮状态
+    updateNavigationButtons();
+
+    // 更新PDF标题
+    document.getElementById('pdf-title').textContent = code;
+
+    // 加载PDF
+    loadPDF(code, 'qp', qpage);
+
+    // 获取题目信息、记录历史并预取相邻题目
+    openQuestion(code);
+}
+
+// 更新导航按钮状态
+function updateNavigationButtons() {
+    const prevBtn = document.getElementById('prev-btn');
+    const nextBtn = document.getElementById('next-btn');
+
+    // 禁用/启用上一题按钮
+    if (currentQuestionIndex <= 0 || displayedQuestionsList.length === 0) {
+        prevBtn.disabled = true;
+    } else {
+        prevBtn.disabled = false;
+    }
+
+    // 禁用/启用下一题按钮（还有未加载的页时保持可用）
+    const hasMore = listPaging && !listPaging.done;
+    if ((currentQuestionIndex >= displayedQuestionsList.length - 1 && !hasMore) || displayedQuestionsList.length === 0) {
+        nextBtn.disabled = true;
+    } else {
+        nextBtn.disabled = false;
+    }
+}
+
+// 上一题
+function previousQuestion() {
+    if (currentQuestionIndex > 0 && displayedQuestionsList.length > 0) {
+        const prevItem = displayedQuestionsList[currentQuestionIndex - 1];
+
+        // Find the original index in questionsList
+        const originalIndex = questionsList.findIndex(q =>
+            isPastPaperMode ? q.code === prevItem.code : q.id === prevItem.id
+        );
+
+        if (isPastPaperMode) {
+            // Past Paper模式
+            selectPastPaper(prevItem.code, currentQuestionIndex - 1, originalIndex);
+        } else {
+            // 普通题目模式
+            selectQuestion(
+                prevItem.id,
+                prevItem.code,
+                prevItem.qpage,
+                prevItem.apage,
+                currentQuestionIndex - 1,
+                prevItem.syllabus_page,
+                prevItem.unit_num
+            );
+        }
+
+        // 更新UI中的active状态
+        updateActiveQuestionUI();
+    }
+}
+
+// 下一题
+function nextQuestion() {
+    // 已到已加载列表末尾：先加载下一页
+    if (currentQuestionIndex >= displayedQuestionsList.length - 1 && listPaging && !listPaging.done) {
+        const loaded = questionsList.length;
+        loadNextPage().then(() => {
+            if (questionsList.length > loaded) nextQuestion();
+        });
+        return;
+    }
+    if (currentQuestionIndex < displayedQuestionsList.length - 1 && displayedQuestionsList.length > 0) {
+        const nextItem = displayedQuestionsList[currentQuestionIndex + 1];
+
+        // Find the original index in questionsList
+        const originalIndex = questionsList.findIndex(q =>
+            isPastPaperMode ? q.code === nextItem.code : q.id === nextItem.id
+        );
+
+        if (isPastPaperMode) {
+            // Past Paper模式
+            selectPastPaper(nextItem.code, currentQuestionIndex + 1, originalIndex);
+        } else {
+            // 普通题目模式
+            selectQuestion(
+                nextItem.id,
+                nextItem.code,
+                nextItem.qpage,
+                nextItem.apage,
+                currentQuestionIndex + 1,
+                nextItem.syllabus_page,
+                nextItem.unit_num
+            );
+        }
+
+        // 更新UI中的active状态
+        updateActiveQuestionUI();
+    }
+}
+
+// 更新UI中当前激活的题目
+function updateActiveQuestionUI() {
+    const items = document.querySelectorAll('.question-item');
+    items.forEach(item => item.classList.remove('active'));
+
+    // 找到当前题目并激活
+    const currentItem = displayedQuestionsList[currentQuestionIndex];
+    if (currentItem) {
+        for (let i = 0; i < items.length; i++) {
+            if (!items[i].classList.contains('fw-bold')) {
+                const itemText = items[i].textContent;
+                const itemCode = isPastPaperMode ? currentItem.code : currentItem.code;
+                if (itemText.includes(itemCode)) {
+                    items[i].classList.add('active');
+                    break;
+                }
+            }
+        }
+    }
+}
+
+// 选择Past Paper
+function selectPastPaper(code, index, originalIndex) {
+    currentQuestionCode = code;
+    currentPastPaperCode = code;
+    currentQuestionId = null;
+    currentPage = 1;
+
+    // 在displayedQuestionsList中查找当前试卷的索引
+    const displayedIndex = displayedQuestionsList.findIndex(q => q.code === code);
+    currentQuestionIndex = displayedIndex >= 0 ? displayedIndex : (index !== undefined ? index : currentQuestionIndex);
+
+    // 更新状态
+    document.querySelectorAll('.question-item').forEach(item => {
+        item.classList.remove('active');
+    });
+    // 由“下一题”在加载下一页后调用时没有点击事件
+    window.event?.target?.classList?.add('active');
+
+    // 更新导航按钮状态
+    updateNavigationButtons();
+
+    // 更新PDF标题
+    document.getElementById('pdf-title').textContent = code;
+
+    // 加载PDF
+    loadPDF(code, 'qp', 1);
+}
+
+// 加载PDF
+function loadPDF(code, type, page) {
+    currentPdfType = type;
+    let pdfUrl;
+    let targetPage = Math.max(1, page || 1);
+    
+    if (type === 'syllabus') {
+        targetPage = Math.max(1, page || currentUnitSyllabusPage || 1);
+        if (!currentSubjectSyllabusUrl) {
+            alert('当前学科未配置大纲文件');
+            return;
+        }
+        pdfUrl = currentSubjectSyllabusUrl;
+    } else if (type === 'ppt') {
+        alert('此区域暂未开放哦');
+        return;
+        // 示例PPT链接构建逻辑
+        if (currentUnit) {
+            pdfUrl = `https://cdn.computerscience.vip/pdf/ppt/Unit${currentUnit}.pdf`;
+        } else {
+            alert('此区域暂未开放哦');
+            return;
+        }
+    } else {
+        const baseParts = code.split('-')[0];  // e.g., "9618_s23_11"
+        const parts = baseParts.split('_');  // ["9618", "s23", "11"]
+        const subjectCode = parts[0];  // "9618"
+        const yearSession = parts[1];  // "s23"
+        const paper = parts[2];  // "11"
+
+        if (type === 'qp') {
+            pdfUrl = `/media/${subjectCode}_${yearSession}_qp_${paper}.pdf`;
+        } else if (type === 'ms') {
+            pdfUrl = `/media/${subjectCode}_${yearSession}_ms_${paper}.pdf`;
+        } else {
+            return;
+        }
+    }
+    
+    currentPdfUrl = pdfUrl;
+    
+    // 使用iframe加载PDF
+    const viewer = document.getElementById('pdf-viewer');
+    viewer.innerHTML = `<iframe src="${pdfUrl}#page=${targetPage}" width="100%" height="100%" style="border: none;"></iframe>`;
+}
+
+// PDF控制按钮
+document.getElementById('btn-qp').onclick = () => {
+    if (currentQuestionCode) {
+        if (isPastPaperMode) {
+            loadPDF(currentQuestionCode, 'qp', 1);
+            return;
+        }
+        const code = currentQuestionCode;
+        getCurrentQuestionInfo().then(info => {
+            loadPDF(code, 'qp', (info && info.question.qpage) || 1);
+        });
+    }
+};
+
+document.getElementById('btn-ms').onclick = () => {
+    if (currentQuestionCode) {
+        if (isPastPaperMode) {
+            loadPDF(currentQuestionCode, 'ms', 1);
+            return;
+        }
+        const code = currentQuestionCode;
+        getCurrentQuestionInfo().then(info => {
+            loadPDF(code, 'ms', (info && info.question.apage) || 1);
+        });
+    }
+};
+
+document.getElementById('btn-syllabus').onclick = () => {
+    loadPDF('', 'syllabus', currentUnitSyllabusPage || 1);
+};
+
+document.getElementById('btn-ppt').onclick = () => {
+    loadPDF('', 'ppt', 1);
+};
+
+document.getElementById('btn-kill').onclick = () => {
+    if (!isPastPaperMode && currentQuestionId) {
+        updateUserTag({ id: currentQuestionId, kill: 1, save: 0, itemType: 'question' });
+    } else if (isPastPaperMode && currentPastPaperCode) {
+        updateUserTag({ code: currentPastPaperCode, kill: 1, save: 0, itemType: 'past_paper' });
+    }
+};
+
+document.getElementById('btn-save').onclick = () => {
+    if (!isPastPaperMode && currentQuestionId) {
+        updateUserTag({ id: currentQuestionId, kill: 0, save: 1, itemType: 'question' });
+    } else if (isPastPaperMode && currentPastPaperCode) {
+        updateUserTag({ code: currentPastPaperCode, kill: 0, save: 1, itemType: 'past_paper' });
+    }
+};
+
+// 标签同步队列：操作先写入localStorage，再按序号批量提交；断网时保留，恢复后重试（服务端按序号去重）。
+// 每个标签页使用自己的 client_id 和序号，多个标签页不会分配到相同的序号而被服务端当作重复丢弃
+const TAG_SYNC_PREFIX = `tagSync:${document.getElementById('current-username').value}:`;
+const TAG_CLIENT_KEY = `${TAG_SYNC_PREFIX}clientId`;
+const TAG_BATCH_LIMIT = 500;
+// 标签页打开期间定时刷新 touched；超过该时间未刷新（崩溃、被系统结束）视为已关闭
+const TAG_SYNC_HEARTBEAT_MS = 30 * 1000;
+const TAG_SYNC_STALE_MS = 2 * 60 * 1000;
+let tagFlushInFlight = null;
+
+function newTagClientId() {
+    return window.crypto && crypto.randomUUID
+        ? crypto.randomUUID()
+        : `${Date.now()}-${Math.random().toString(16).slice(2)}`;
+}
+
+function readTagSyncState(clientId) {
+    try {
+        return JSON.parse(localStorage.getItem(TAG_SYNC_PREFIX + clientId));
+    } catch (error) {
+        return null;
+    }
+}
+
+function saveTagSyncState(clientId, state) {
+    if (clientId === tagClientId) {
+        state.touched = Date.now();
+    }
+    localStorage.setItem(TAG_SYNC_PREFIX + clientId, JSON.stringify(state));
+}
+
+function tagStateAbandoned(state) {
+    return !state.open || Date.now() - (state.touched || 0) > TAG_SYNC_STALE_MS;
+}
+
+// 刷新页面时沿用 sessionStorage 中的 client_id；复制标签页会连同 sessionStorage 一起复制，
+// 原标签页仍在使用该 id 时另取新 id
+function claimTagClientId() {
+    let clientId = sessionStorage.getItem(TAG_CLIENT_KEY);
+    const state = clientId ? readTagSyncState(clientId) : null;
+    if (!state || !tagStateAbandoned(state)) {
+        clientId = newTagClientId();
+    }
+    sessionStorage.setItem(TAG_CLIENT_KEY, clientId);
+    return clientId;
+}
+
+let tagClientId = null;
+
+function openTagSyncState() {
+    tagClientId = claimTagClientId();
+    const state = readTagSyncState(tagClientId) || { seq: 0, queue: [] };
+    state.open = true;
+    saveTagSyncState(tagClientId, state);
+}
+
+function setTagSyncOpen(open) {
+    const state = readTagSyncState(tagClientId);
+    if (!state) {
+        // 关闭期间记录已被其他标签页清理，序号无从接续，改用新 id
+        openTagSyncState();
+        return;
+    }
+    state.open = open;
+    saveTagSyncState(tagClientId, state);
+}
+
+// 旧版本所有标签页共用的队列
+function migrateSharedTagQueue() {
+    const legacyKey = TAG_SYNC_PREFIX.slice(0, -1);
+    let legacy = null;
+    try {
+        legacy = JSON.parse(localStorage.getItem(legacyKey));
+    } catch (error) {
+        legacy = null;
+    }
+    if (legacy && legacy.clientId && legacy.queue && legacy.queue.length && !readTagSyncState(legacy.clientId)) {
+        localStorage.setItem(TAG_SYNC_PREFIX + legacy.clientId, JSON.stringify({ seq: legacy.seq, queue: legacy.queue, open: false }));
+    }
+    localStorage.removeItem(legacyKey);
+}
+
+migrateSharedTagQueue();
+openTagSyncState();
+setInterval(() => setTagSyncOpen(true), TAG_SYNC_HEARTBEAT_MS);
+window.addEventListener('pagehide', () => setTagSyncOpen(false));
+window.addEventListener('pageshow', event => {
+    if (event.persisted) {
+        setTagSyncOpen(true);
+    }
+});
+
+// 已关闭的标签页留下的、尚未提交的队列
+function abandonedTagClientIds() {
+    const clientIds = [];
+    for (let i = 0; i < localStorage.length; i++) {
+        const key = localStorage.key(i);
+        if (!key || !key.startsWith(TAG_SYNC_PREFIX) || key === TAG_CLIENT_KEY) {
+            continue;
+        }
+        const clientId = key.slice(TAG_SYNC_PREFIX.length);
+        const state = clientId !== tagClientId ? readTagSyncState(clientId) : null;
+        if (state && tagStateAbandoned(state)) {
+            clientIds.push(clientId);
+        }
+    }
+    return clientIds;
+}
+
+// 以原 client_id 提交一个队列，返回是否有操作被服务端确认
+function flushClientQueue(clientId) {
+    const state = readTagSyncState(clientId);
+    if (!state || !state.queue || !state.queue.length) {
+        if (state && clientId !== tagClientId && !state.open) {
+            localStorage.removeItem(TAG_SYNC_PREFIX + clientId);
+        }
+        return Promise.resolve(false);
+    }
+    const batch = state.queue.slice(0, TAG_BATCH_LIMIT);
+
+    return fetch('/update_user_tags/batch/', {
+        method: 'POST',
+        headers: {
+            'Content-Type': 'application/json',
+            'X-CSRFToken': getCsrfToken()
+        },
+        body: JSON.stringify({ client_id: clientId, ops: batch })
+    })
+    .then(response => response.json().then(data => ({ status: response.status, data: data })))
+    .then(({ status, data }) => {
+        const latest = readTagSyncState(clientId);
+        if (!latest) {
+            return Boolean(data.success);
+        }
+        if (data.success) {
+            latest.queue = latest.queue.filter(op => op.seq > data.applied_seq);
+            latest.seq = Math.max(latest.seq, data.applied_seq);
+        } else if (status === 400) {
+            // 请求本身无效，重试也不会成功，丢弃这一批避免阻塞后续操作
+            const lastSeq = batch[batch.length - 1].seq;
+            latest.queue = latest.queue.filter(op => op.seq > lastSeq);
+        }
+        if (clientId !== tagClientId && !latest.queue.length && !latest.open) {
+            localStorage.removeItem(TAG_SYNC_PREFIX + clientId);
+        } else {
+            saveTagSyncState(clientId, latest);
+        }
+        return Boolean(data.success);
+    })
+    .catch(error => {
+        console.error('Error syncing tags:', error);
+        return false;
+    });
+}
+
+// 提交本标签页的队列，再代为提交已关闭标签页留下的队列；返回本标签页是否有操作被确认
+function flushTagQueue() {
+    if (tagFlushInFlight) {
+        return tagFlushInFlight.then(() => flushTagQueue());
+    }
+    tagFlushInFlight = flushClientQueue(tagClientId)
+        .then(success => Promise.all(abandonedTagClientIds().map(flushClientQueue)).then(() => success))
+        .finally(() => {
+            tagFlushInFlight = null;
+        });
+    return tagFlushInFlight;
+}
+
+// 更新用户标签
+function updateUserTag({ id = null, code = null, kill = 0, save = 0, itemType = 'question' }) {
+    const op = { item_type: itemType, kill: kill, save: save };
+    if (itemType === 'past_paper' && code) {
+        op.code = code;
+    } else if (id) {
+        op.id = id;
+    } else {
+        return;
+    }
+
+    const state = readTagSyncState(tagClientId) || { seq: 0, queue: [], open: true };
+    state.seq += 1;
+    op.seq = state.seq;
+    state.queue.push(op);
+    saveTagSyncState(tagClientId, state);
+
+    flushTagQueue().then(success => {
+        if (success) {
+            // 重新加载题目列表
+            if (itemType === 'past_paper') {
+                loadPastPapers();
+            } else if (currentUnit) {
+                loadQuestions(currentUnit);
+            }
+        }
+    });
+}
+
+window.addEventListener('online', () => flushTagQueue());
+
+// 打开题目：一次请求获取题目信息与标签、记录浏览历史，并预取相邻题目的PDF
+function openQuestion(code) {
+    currentQuestionInfo = null;
+    currentQuestionRequest = fetch('/open_question/', {
+        method: 'POST',
+        headers: {
+            'Content-Type': 'application/x-www-form-urlencoded',
+            'X-CSRFToken': getCsrfToken()
+        },
+        body: `code=${encodeURIComponent(code)}`
+    })
+    .then(response => response.json())
+    .then(data => {
+        if (data.error) {
+            return null;
+        }
+        if (code === currentQuestionCode) {
+            currentQuestionInfo = data;
+        }
+        prefetchPdfs(data.prefetch || []);
+        return data;
+    })
+    .catch(error => {
+        console.error('Error opening question:', error);
+        return null;
+    });
+    return currentQuestionRequest;
+}
+
+function getCurrentQuestionInfo() {
+    if (currentQuestionInfo) {
+        return Promise.resolve(currentQuestionInfo);
+    }
+    return currentQuestionRequest || Promise.resolve(null);
+}
+
+// fetch响应中的Link头不会被浏览器处理，这里手动插入 <link rel="prefetch">
+function prefetchPdfs(urls) {
+    urls.forEach(url => {
+        const exists = Array.from(document.head.querySelectorAll('link[rel="prefetch"]'))
+            .some(link => link.getAttribute('href') === url);
+        if (exists) {
+            return;
+        }
+        const link = document.createElement('link');
+        link.rel = 'prefetch';
+        link.href = url;
+        document.head.appendChild(link);
+    });
+}
+
+// 搜索功能（只过滤已加载的行；过滤后不足一屏时 fillListViewport 会继续加载）
+function applySearchFilter() {
+    const searchTerm = document.getElementById('search-input').value.toLowerCase();
+
+    // 更新displayedQuestionsList
+    if (searchTerm === '') {
+        // 如果搜索框为空，显示所有题目
+        displayedQuestionsList = [...questionsList];
+    } else {
+        // 过滤题目列表
+        displayedQuestionsList = questionsList.filter(q => {
+            const code = q.code.toLowerCase();
+            return code.includes(searchTerm);
+        });
+    }
+
+    // 更新UI
+    const items = document.querySelectorAll('.question-item');
+    let displayedIndex = 0;
+    items.forEach(item => {
+        // 跳过年份标题
+        if (item.classList.contains('fw-bold')) {
+            return;
+        }
+
+        const text = item.textContent.toLowerCase();
+        const shouldDisplay = text.includes(searchTerm);
+        item.style.display = shouldDisplay ? 'block' : 'none';
+
+        // 更新data-questionIndex以匹配displayedQuestionsList中的索引
+        if (shouldDisplay) {
+            item.dataset.displayIndex = displayedIndex;
+            displayedIndex++;
+        }
+    });
+
+    // 如果当前选中的题目被过滤掉了，重置索引
+    if (currentQuestionIndex >= 0 && currentQuestionCode) {
+        const newIndex = displayedQuestionsList.findIndex(q =>
+            q.code === currentQuestionCode
+        );
+        if (newIndex >= 0) {
+            currentQuestionIndex = newIndex;
+        } else {
+            currentQuestionIndex = -1;
+        }
+    }
+
+    // 更新导航按钮状态
+    updateNavigationButtons();
+}
+
+document.getElementById('search-input').addEventListener('input', function() {
+    applySearchFilter();
+    fillListViewport();
+});
+
+// 页面加载时初始化
+document.addEventListener('DOMContentLoaded', function() {
+    loadUnits();
+
+    // 提交上次未同步的标签操作
+    flushTagQueue();
+
+    // 绑定返回按钮事件
+    document.getElementById('back-btn').onclick = backToUnits;
+
+    // 绑定导航按钮事件
+    document.getElementById('prev-btn').onclick = previousQuestion;
+    document.getElementById('next-btn').onclick = nextQuestion;
+
+    // 滚动到列表底部附近时加载下一页
+    document.getElementById('question-list').addEventListener('scroll', fillListViewport);
+
+    // 初始化导航按钮状态
+    updateNavigationButtons();
+
+    // 绑定浮动按钮事件
+    initializeFloatingButtons();
+});
+
+// 初始化浮动控制按钮
+function initializeFloatingButtons() {
+    // 导航栏切换按钮
+    const navbarToggleBtn = document.getElementById('navbar-toggle-btn');
+    let navbarHidden = false;
+
+    navbarToggleBtn.addEventListener('click', function() {
+        navbarHidden = !navbarHidden;
+        document.body.classList.toggle('navbar-hidden', navbarHidden);
+        this.classList.toggle('rotated', navbarHidden);
+    });
+
+    // 侧边栏切换按钮
+    const sidebarToggleBtn = document.getElementById('sidebar-toggle-btn');
+    let sidebarHidden = false;
+
+    sidebarToggleBtn.addEventListener('click', function() {
+        sidebarHidden = !sidebarHidden;
+        document.body.classList.toggle('sidebar-hidden', sidebarHidden);
+
+        // 切换箭头方向
+        const icon = this.querySelector('i');
+        if (sidebarHidden) {
+            icon.className = 'bi bi-chevron-right';
+        } else {
+            icon.className = 'bi bi-chevron-left';
+        }
+    });
+}
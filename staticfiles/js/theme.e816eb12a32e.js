@@ -0,0 +1,53 @@
+// Apply the saved colour theme on every page
+
+// Hashed URL of themes.json, passed by base.html
+const THEMES_URL = document.currentScript.dataset.themesUrl;
+
+// Apply theme on page load
+(async function() {
+    const savedTheme = localStorage.getItem('colorTheme') || 'default';
+    document.documentElement.setAttribute('data-theme', savedTheme);
+    document.body.setAttribute('data-theme', savedTheme);
+
+    // Load theme config and apply CSS variables
+    try {
+        const response = await fetch(THEMES_URL);
+        const themes = await response.json();
+
+        if (themes[savedTheme]) {
+            applyThemeVariables(themes[savedTheme].colors);
+        }
+    } catch (error) {
+        console.error('Error loading theme:', error);
+    }
+})();
+
+function applyThemeVariables(colors) {
+    const root = document.documentElement;
+    root.style.setProperty('--navbar-gradient-start', colors.navbarGradientStart);
+    root.style.setProperty('--navbar-gradient-end', colors.navbarGradientEnd);
+    root.style.setProperty('--float-button-color', colors.floatButtonColor);
+    root.style.setProperty('--float-button-hover', colors.floatButtonHover);
+    root.style.setProperty('--nav-button-color', colors.navButtonColor);
+    root.style.setProperty('--nav-button-hover', colors.navButtonHover);
+    root.style.setProperty('--back-button-color', colors.backButtonColor);
+    root.style.setProperty('--back-button-hover', colors.backButtonHover);
+    root.style.setProperty('--selection-panel-header-color', colors.selectionPanelHeaderColor);
+    root.style.setProperty('--pdf-panel-header-color', colors.pdfPanelHeaderColor);
+    root.style.setProperty('--pdf-button-primary', colors.pdfButtonPrimary);
+    root.style.setProperty('--pdf-button-success', colors.pdfButtonSuccess);
+    root.style.setProperty('--pdf-button-info', colors.pdfButtonInfo);
+    root.style.setProperty('--pdf-button-warning', colors.pdfButtonWarning);
+    root.style.setProperty('--pdf-button-danger', colors.pdfButtonDanger);
+    root.style.setProperty('--pdf-button-secondary', colors.pdfButtonSecondary);
+    root.style.setProperty('--question-completed-bg', colors.questionCompletedBg);
+    root.style.setProperty('--question-completed-border', colors.questionCompletedBorder);
+    root.style.setProperty('--question-saved-bg', colors.questionSavedBg);
+    root.style.setProperty('--question-saved-border', colors.questionSavedBorder);
+    root.style.setProperty('--bg-gradient-start', colors.bgGradientStart);
+    root.style.setProperty('--bg-gradient-end', colors.bgGradientEnd);
+    root.style.setProperty('--text-color', colors.textColor);
+    root.style.setProperty('--button-text-color', colors.buttonTextColor);
+    root.style.setProperty('--card-bg', colors.cardBg);
+    root.style.setProperty('--card-border', colors.cardBorder);
+}
@@ -0,0 +1,141 @@
+// Theme settings page; THEMES_URL and applyThemeVariables come from theme.js
+
+let themesData = {};
+
+// Load themes from JSON and render
+document.addEventListener('DOMContentLoaded', async function() {
+    await loadThemes();
+    const currentTheme = localStorage.getItem('colorTheme') || 'default';
+    updateActiveTheme(currentTheme);
+});
+
+async function loadThemes() {
+    try {
+        const response = await fetch(THEMES_URL);
+        themesData = await response.json();
+        renderThemes();
+    } catch (error) {
+        console.error('Error loading themes:', error);
+    }
+}
+
+function renderThemes() {
+    const container = document.getElementById('themes-container');
+    container.innerHTML = '';
+
+    Object.keys(themesData).forEach(themeKey => {
+        const theme = themesData[themeKey];
+        const themeCard = createThemeCard(themeKey, theme);
+        container.appendChild(themeCard);
+    });
+}
+
+function createThemeCard(themeKey, theme) {
+    const card = document.createElement('div');
+    card.className = 'theme-card';
+    card.setAttribute('data-theme', themeKey);
+    card.onclick = () => selectTheme(themeKey);
+
+    // Create gradient background for the card preview
+    const bgGradient = `linear-gradient(135deg, ${theme.colors.bgGradientStart} 0%, ${theme.colors.bgGradientEnd} 100%)`;
+
+    card.innerHTML = `
+        <div class="theme-header">
+            <h3 class="theme-name">${theme.name}</h3>
+            <span class="theme-badge text-white" style="background: ${theme.badgeColor};">${theme.badge}</span>
+        </div>
+        <div class="color-palette">
+            ${theme.palette.map(color => `
+                <div class="color-swatch" style="background: ${color.color}; color: ${isLightColor(color.color) ? '#000' : '#fff'};">
+                    <span>${color.name}</span>
+                    <span class="color-code">${color.color}</span>
+                </div>
+            `).join('')}
+        </div>
+        <div class="theme-preview" style="background: ${bgGradient};">
+            <p style="color: ${theme.colors.textColor};"><strong>Preview:</strong></p>
+            <div class="preview-elements">
+                <button class="preview-btn" style="background: ${theme.colors.floatButtonColor}; color: ${isLightColor(theme.colors.floatButtonColor) ? '#000' : '#fff'};">Float Button</button>
+                <button class="preview-btn" style="background: ${theme.colors.backButtonColor}; color: white;">Back Button</button>
+                <button class="preview-btn" style="background: ${theme.colors.pdfButtonSuccess}; color: white;">PDF Button</button>
+            </div>
+            <div style="margin-top: 10px; padding: 8px 12px; background: ${theme.colors.selectionPanelHeaderColor}; border-radius: 4px; margin-bottom: 6px;">
+                <span style="color: white; font-size: 12px; font-weight: 600;">Selection Panel Header</span>
+            </div>
+            <div style="margin-top: 6px; padding: 8px 12px; background: ${theme.colors.pdfPanelHeaderColor}; border-radius: 4px; margin-bottom: 6px;">
+                <span style="color: white; font-size: 12px; font-weight: 600;">PDF Panel Header</span>
+            </div>
+            <div style="padding: 10px; background: linear-gradient(135deg, ${theme.colors.navbarGradientStart} 0%, ${theme.colors.navbarGradientEnd} 100%); border-radius: 4px;">
+                <span style="color: white; font-size: 12px;">Navbar Gradient</span>
+            </div>
+        </div>
+    `;
+
+    return card;
+}
+
+function isLightColor(color) {
+    // Convert hex to RGB
+    const hex = color.replace('#', '');
+    const r = parseInt(hex.substr(0, 2), 16);
+    const g = parseInt(hex.substr(2, 2), 16);
+    const b = parseInt(hex.substr(4, 2), 16);
+
+    // Calculate luminance
+    const luminance = (0.299 * r + 0.587 * g + 0.114 * b) / 255;
+    return luminance > 0.5;
+}
+
+function selectTheme(themeName) {
+    // Save to localStorage
+    localStorage.setItem('colorTheme', themeName);
+
+    // Update active state
+    updateActiveTheme(themeName);
+
+    // Apply theme immediately
+    applyTheme(themeName);
+
+    // Show confirmation
+    showConfirmation();
+}
+
+function updateActiveTheme(themeName) {
+    // Remove active class from all
+    document.querySelectorAll('.theme-card').forEach(card => {
+        card.classList.remove('active');
+    });
+
+    // Add active class to selected
+    const selectedCard = document.querySelector(`[data-theme="${themeName}"]`);
+    if (selectedCard) {
+        selectedCard.classList.add('active');
+    }
+}
+
+function applyTheme(themeName) {
+    document.documentElement.setAttribute('data-theme', themeName);
+    document.body.setAttribute('data-theme', themeName);
+
+    // Apply theme CSS variables immediately
+    if (themesData[themeName]) {
+        applyThemeVariables(themesData[themeName].colors);
+    }
+}
+
+function showConfirmation() {
+    const saveInfo = document.querySelector('.save-info');
+    const originalHTML = saveInfo.innerHTML;
+
+    saveInfo.innerHTML = '<i class="bi bi-check-circle-fill check-icon"></i> Theme saved successfully! It will be applied across all pages.';
+    saveInfo.style.background = '#d4edda';
+    saveInfo.style.borderColor = '#c3e6cb';
+    saveInfo.style.color = '#155724';
+
+    setTimeout(() => {
+        saveInfo.innerHTML = originalHTML;
+        saveInfo.style.background = '#d1ecf1';
+        saveInfo.style.borderColor = '#bee5eb';
+        saveInfo.style.color = '#0c5460';
+    }, 3000);
+}